@@ -21,6 +21,7 @@ class FlaskApp:
         self.app = Flask(__name__)
         self.app.config.from_object(Config)
         Database.init_app(self.app)
+        Database.migrate(self.app)
 
     def create_app(self):
         self.app.register_blueprint(main)
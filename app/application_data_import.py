@@ -8,6 +8,7 @@ from app.application_dataclasses_support import *
 from app.SupportUtilities import TaskProgressIndicator
 from app.file_support import FileConverter, FileHandler
 from app.application_views import PortSecurityView
+from app.snapshot_support import SnapshotFileHandler
 import os
 
 
@@ -145,7 +146,7 @@ class CiscoDataRetrieval:
         try:
             show_interfaces_entry_list:List[ShowInterfacesEntry] = []
             for cli_record in cli.show_interfaces(cli.connection):
-                show_interfaces_entry_list.append(ShowInterfacesEntry(**cli_record))
+                show_interfaces_entry_list.append(ShowInterfacesEntry.from_cli_record(cli_record))
             device.show_interfaces_entry_list = show_interfaces_entry_list
             device.device_connection_status = f"{device.device_connection_status}; show interfaces: OK "   
             device.textfsm_templates_active.set_template("show_interface", True)
@@ -165,7 +166,7 @@ class CiscoDataRetrieval:
         try: 
             show_ip_arp_entry_list:List[ShowIPARPEntry] = []
             for cli_record in cli.show_ip_arp(cli.connection):
-                show_ip_arp_entry_list.append(ShowIPARPEntry(**cli_record))
+                show_ip_arp_entry_list.append(ShowIPARPEntry.from_cli_record(cli_record))
             device.show_ip_arp_entry_list = show_ip_arp_entry_list   
             device.device_connection_status = f"{device.device_connection_status}; show ip arp: OK "     
             device.textfsm_templates_active.set_template("show_ip_arp", True)
@@ -186,7 +187,7 @@ class CiscoDataRetrieval:
         try:
             show_mac_address_table_entry_list:List[ShowMACAddressTableEntry] = []
             for cli_record in cli.show_mac_address_table(cli.connection):
-                show_mac_address_table_entry_list.append(ShowMACAddressTableEntry(**cli_record))
+                show_mac_address_table_entry_list.append(ShowMACAddressTableEntry.from_cli_record(cli_record))
             device.show_mac_address_table_entry_list = show_mac_address_table_entry_list 
             device.device_connection_status = f"{device.device_connection_status}; show mac address-table: OK "   
             device.textfsm_templates_active.set_template("show_mac_address_table", True)   
@@ -208,7 +209,7 @@ class CiscoDataRetrieval:
             show_interfaces_status_entry_list:List[ShowInterfacesStatusEntry] = []
             cli_records = cli.show_interface_status(cli.connection)
             for cli_record in cli_records:
-                show_interfaces_status_entry_list.append(ShowInterfacesStatusEntry(**cli_record))
+                show_interfaces_status_entry_list.append(ShowInterfacesStatusEntry.from_cli_record(cli_record))
             device.show_interfaces_status_entry_list = show_interfaces_status_entry_list   
             device.device_connection_status = f"{device.device_connection_status}; show interfaces status: OK "   
             device.textfsm_templates_active.set_template("show_interface_status", True)  
@@ -247,6 +248,7 @@ if __name__ == "__main__":
     #print(str(sample))
     file = FileHandler.delete_txt(r"..\app\console_data.txt")
     file = FileHandler.write_txt(r"..\app\console_data.txt", str(sample))
+    SnapshotFileHandler.write_snapshot(r"..\app\console_data.snapshot", sample.Data['network_cisco_switches'])
     
     view = PortSecurityView(sample.Data['network_cisco_switches'])
     print(str(view))
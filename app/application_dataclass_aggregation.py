@@ -0,0 +1,265 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from app.application_dataclass_data_manager import compile_key_accessor
+from app.application_dataclass_query import DataQuery, DeviceEntryRow
+from app.application_dataclasses import NetworkDeviceEntry
+from app.mac_address_support import MacAddress
+
+
+AGGREGATE_FUNCTIONS = ("count", "sum", "mean", "min", "max", "distinct")
+
+
+def row_key_accessor(key: str) -> Callable[[Any], Any]:
+    """
+    Compile a group or value key for aggregation rows.
+
+    Dotted keys are read with compile_key_accessor. A bare field name on a DeviceEntryRow is read from the entry
+    when the entry has that field and from the device otherwise, so 'VLAN_ID' and 'switch_region' both work on
+    interface rows.
+
+    :param key: Field name or dotted key.
+    :type key: str
+    :return: Function that reads the key from one row.
+    :rtype: Callable[[Any], Any]
+    """
+    accessor = compile_key_accessor(key)
+    if '.' in key:
+        return accessor
+    on_entry: Dict[type, bool] = {}
+
+    def get(row: Any) -> Any:
+        if type(row) is not DeviceEntryRow:
+            return accessor(row)
+        entry = row.entry
+        entry_type = type(entry)
+        found = on_entry.get(entry_type)
+        if found is None:
+            found = on_entry[entry_type] = isinstance(entry, dict) or hasattr(entry, key)
+        if found:
+            return accessor(entry)
+        return accessor(row.device)
+
+    return get
+
+
+def _number(value: Any) -> Optional[float]:
+    """
+    Convert a value to int or float for sum/mean/min/max; values that are not numbers are skipped (None).
+    """
+    if isinstance(value, MacAddress):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+class GroupByAggregator:
+    """
+    Hash aggregation of rows into groups, filled in one pass.
+
+    Each group keeps one small state list with a slot per aggregate, so adding a row is a dictionary lookup and a
+    few slot updates. A new group's state is a copy of a template built once from the plan, with fresh
+    containers only in its mean and distinct slots. Results come back as flat dictionaries that
+    DataTableExporter can write directly.
+    """
+
+    def __init__(self, group_by: Sequence[str], aggregates: Optional[Dict[str, Tuple[str, Optional[str]]]] = None) -> None:
+        """
+        Initialize the aggregator.
+
+        :param group_by: Keys that form a group, e.g. ['switch_region', 'STATUS'].
+        :type group_by: Sequence[str]
+        :param aggregates: Output column to (function, key), e.g. {'ports': ('count', None), 'vlans': ('distinct', 'VLAN_ID')}.
+            Functions are count, sum, mean, min, max and distinct (number of distinct values). Defaults to a count.
+        :type aggregates: Optional[Dict[str, Tuple[str, Optional[str]]]]
+        :raises ValueError: If an aggregate function is not supported or lacks its key, or an aggregate column
+            has the name of a group key.
+        """
+        aggregates = {"count": ("count", None)} if aggregates is None else aggregates
+        clashes = [name for name in aggregates if name in group_by]
+        if clashes:
+            raise ValueError(f"Aggregate columns {clashes} have the names of group keys; rename them.")
+        for name, (function, key) in aggregates.items():
+            if function not in AGGREGATE_FUNCTIONS:
+                raise ValueError(f"Unsupported aggregate function '{function}' for '{name}'.")
+            if function != "count" and not key:
+                raise ValueError(f"Aggregate '{name}' needs a key for '{function}'.")
+        self.group_by = list(group_by)
+        self.aggregates = dict(aggregates)
+        self._group_accessors = [row_key_accessor(key) for key in self.group_by]
+        self._aggregate_plan = [(function, row_key_accessor(key) if key else None)
+                                for function, key in self.aggregates.values()]
+        self._groups: Dict[Tuple[Any, ...], List[Any]] = {}
+        self._state_template = [0 if function in ("count", "sum") else None for function, _ in self._aggregate_plan]
+        self._mean_slots = [slot for slot, (function, _) in enumerate(self._aggregate_plan) if function == "mean"]
+        self._distinct_slots = [slot for slot, (function, _) in enumerate(self._aggregate_plan)
+                                if function == "distinct"]
+
+    def _new_state(self) -> List[Any]:
+        state = self._state_template[:]
+        for slot in self._mean_slots:
+            state[slot] = [0, 0]
+        for slot in self._distinct_slots:
+            state[slot] = set()
+        return state
+
+    def add(self, row: Any) -> None:
+        """
+        Add one row to its group.
+
+        :param row: A row, e.g. a DeviceEntryRow, a dataclass instance or a dictionary.
+        """
+        group_key = tuple(accessor(row) for accessor in self._group_accessors)
+        state = self._groups.get(group_key)
+        if state is None:
+            state = self._groups[group_key] = self._new_state()
+        for slot, (function, accessor) in enumerate(self._aggregate_plan):
+            if function == "count":
+                if accessor is None or accessor(row) is not None:
+                    state[slot] += 1
+                continue
+            value = accessor(row)
+            if value is None:
+                continue
+            if function == "distinct":
+                state[slot].add(value)
+                continue
+            number = _number(value)
+            if number is None:
+                continue
+            if function == "sum":
+                state[slot] += number
+            elif function == "mean":
+                state[slot][0] += number
+                state[slot][1] += 1
+            elif function == "min":
+                if state[slot] is None or number < state[slot]:
+                    state[slot] = number
+            elif state[slot] is None or number > state[slot]:
+                state[slot] = number
+
+    def update(self, rows: Iterable[Any]) -> 'GroupByAggregator':
+        """
+        Add every row of an iterable, e.g. a DataQuery.
+
+        :param rows: The rows.
+        :return: The aggregator.
+        """
+        add = self.add
+        for row in rows:
+            add(row)
+        return self
+
+    def _final(self, state: List[Any]) -> List[Any]:
+        values = []
+        for (function, _), value in zip(self._aggregate_plan, state):
+            if function == "mean":
+                value = value[0] / value[1] if value[1] else None
+            elif function == "distinct":
+                value = len(value)
+            values.append(value)
+        return values
+
+    def results(self) -> Dict[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Return group key tuple to aggregate values, in order of first appearance.
+        """
+        names = list(self.aggregates)
+        return {key: dict(zip(names, self._final(state))) for key, state in self._groups.items()}
+
+    def rows(self, sort: bool = True) -> List[Dict[str, Any]]:
+        """
+        Return one flat row per group with the group keys and aggregate columns, ready for DataTableExporter.
+
+        :param sort: Sort the rows by group key (as text, so missing values sort too).
+        :return: The table rows.
+        """
+        names = list(self.aggregates)
+        keys = list(self._groups)
+        if sort:
+            keys.sort(key=lambda key: tuple("" if part is None else str(part) for part in key))
+        return [dict(zip(self.group_by, key), **dict(zip(names, self._final(self._groups[key])))) for key in keys]
+
+    def pivot(self, columns: str, value: Optional[str] = None, fill: Any = 0,
+              missing: str = "(none)") -> List[Dict[str, Any]]:
+        """
+        Spread one group key into columns, e.g. ports per status (columns) per region (rows).
+
+        The pivoted key must be one of group_by; the remaining group keys form the rows. Columns are named by the
+        text of their value, and rows whose pivoted key is None go to the column named missing.
+
+        :param columns: The group key whose values become columns.
+        :param value: The aggregate to show. Defaults to the first aggregate.
+        :param fill: Value for combinations with no rows.
+        :param missing: Column name for rows without a value in the pivoted key.
+        :return: The pivot table rows, sorted by the row keys, with columns in sorted order.
+        :raises ValueError: If columns is not a group key, or a column name would overwrite a row key or another
+            column (e.g. the values 1 and '1').
+        """
+        if columns not in self.group_by:
+            raise ValueError(f"'{columns}' is not one of the group keys {self.group_by}.")
+        value = value or next(iter(self.aggregates))
+        position = self.group_by.index(columns)
+        index_keys = [key for key in self.group_by if key != columns]
+        column_values = set()
+        table: Dict[Tuple[Any, ...], Dict[Any, Any]] = {}
+        for key, aggregates in self.results().items():
+            column_value = key[position]
+            column_values.add(column_value)
+            row_key = key[:position] + key[position + 1:]
+            table.setdefault(row_key, {})[column_value] = aggregates[value]
+        ordered_columns = sorted(column_values, key=lambda part: "" if part is None else str(part))
+        column_names = [missing if column_value is None else str(column_value) for column_value in ordered_columns]
+        clashes = sorted(set(column_names) & set(index_keys))
+        if clashes:
+            raise ValueError(f"Pivot columns {clashes} have the names of row keys; pivot on another key.")
+        if len(set(column_names)) != len(column_names):
+            raise ValueError(f"Values of '{columns}' give duplicate column names {column_names}.")
+        rows = []
+        for row_key in sorted(table, key=lambda key: tuple("" if part is None else str(part) for part in key)):
+            row = dict(zip(index_keys, row_key))
+            cells = table[row_key]
+            for column_value, column_name in zip(ordered_columns, column_names):
+                row[column_name] = cells.get(column_value, fill)
+            rows.append(row)
+        return rows
+
+
+def aggregate_entries(devices: Iterable[Optional[NetworkDeviceEntry]], entry_list: str, group_by: Sequence[str],
+                      aggregates: Optional[Dict[str, Tuple[str, Optional[str]]]] = None,
+                      where: Optional[Callable[[DeviceEntryRow], bool]] = None) -> GroupByAggregator:
+    """
+    Aggregate one entry list across the fleet in a single pass.
+
+    :param devices: The collected devices, e.g. Data['network_cisco_switches'].
+    :param entry_list: The NetworkDeviceEntry list field, e.g. 'show_interfaces_status_entry_list'.
+    :param group_by: Group keys; bare names are read from the entry or, failing that, the device.
+    :param aggregates: Output column to (function, key); defaults to a row count.
+    :param where: Optional predicate on DeviceEntryRow rows.
+    :return: The filled aggregator; call rows() or pivot() for tables.
+    """
+    query = DataQuery.entries(devices, entry_list)
+    if where is not None:
+        query = query.where(where)
+    return GroupByAggregator(group_by, aggregates).update(query)
+
+
+# # Example usage
+# switches = Data['network_cisco_switches']
+#
+# # Ports per status per region
+# status = aggregate_entries(switches, 'show_interfaces_status_entry_list', ['switch_region', 'STATUS'])
+# DataTableExporter(status.pivot(columns='STATUS')).export_to_csv('ports_per_status.csv')
+#
+# # Stale ports per switch, with the VLANs they sit in
+# stale = aggregate_entries(switches, 'show_interfaces_entry_list', ['switch_hostname'],
+#                           {'stale_ports': ('count', None), 'vlans': ('distinct', 'VLAN_ID')},
+#                           where=lambda row: row.entry.LAST_INPUT == 'never')
+# print(stale.rows())
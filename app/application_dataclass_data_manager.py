@@ -5,42 +5,117 @@ class DataExtrator:
 
 
 
-from typing import Any, Union, List, Dict
-from functools import cmp_to_key
+from typing import Any, Callable, Union, List, Dict, Sequence, Tuple
+from itertools import repeat
+from app.application_dataclasses_support import InfoErrorFlags, PropertyIndex
+from app.mac_address_support import MacAddress
+
+
+def compile_key_accessor(key: str = None) -> Callable[[Any], Any]:
+    """
+    Compile a dotted key into a function that reads the nested value from one item.
+
+    The key is split once and list positions are converted once, so the returned function can be applied to many
+    items cheaply. Lookups follow DataProcessor._get_nested_value: dictionaries use get(), lists use integer
+    positions and any other object uses attributes.
+
+    :param key: The key to read. Supports dot notation for nested keys. None or '' returns the item itself.
+    :type key: str
+    :return: Function that takes an item and returns the nested value.
+    :rtype: Callable[[Any], Any]
+    """
+    if not key:
+        return lambda item: item
+    steps = tuple((part, int(part) if part.lstrip('-').isdigit() else None) for part in key.split('.'))
+
+    def accessor(item: Any) -> Any:
+        for part, position in steps:
+            if isinstance(item, dict):
+                item = item.get(part)
+            elif isinstance(item, list):
+                item = item[position if position is not None else int(part)]
+            else:
+                try:
+                    item = getattr(item, part)
+                except AttributeError:
+                    raise KeyError(f"Key '{part}' not found in data.") from None
+        return item
+
+    return accessor
+
 
 class DataProcessor:
-    def __init__(self, data: Any) -> None:
+    def __init__(self, data: Any, indexed: bool = False) -> None:
         """
         Initialize the processor with any Python data structure.
 
         :param data: Data to be processed.
         :type data: Any
+        :param indexed: Answer repeated filters from hash indexes. Only pass True when the items are not edited
+            in place between filters, or call index.invalidate() after editing them.
+        :type indexed: bool
         """
         self.data = data
+        self.index = PropertyIndex(self._row_accessor) if indexed else None
 
-    def sort(self, key: str = None, ascending: bool = True) -> Any:
+    def sort(self, key: Union[str, Sequence[str]] = None, ascending: Union[bool, Sequence[bool]] = True) -> Any:
         """
-        Sort the data structure by a specified key or position. Supports nested structures.
+        Sort the data structure by one or more keys. Supports nested structures.
 
-        :param key: The key or position to sort by. Supports dot notation for nested keys.
-        :type key: str
-        :param ascending: True for ascending order, False for descending order.
-        :type ascending: bool
+        Each key is read once per item with a compiled accessor. Several keys sort like a tuple, first key first,
+        and each key may have its own direction, e.g. key=["switch_hostname", "CRC"], ascending=[True, False].
+        Items with equal keys keep their original order.
+
+        :param key: The key, or list of keys, to sort by. Supports dot notation for nested keys.
+        :type key: Union[str, Sequence[str]]
+        :param ascending: True for ascending order, False for descending order, or one flag per key.
+        :type ascending: Union[bool, Sequence[bool]]
         :return: Sorted data structure.
         :rtype: Any
-        :raises ValueError: If data is not a list or set.
+        :raises ValueError: If data is not a list or set, or the number of flags does not match the keys.
         """
-        if isinstance(self.data, list):
-            return sorted(self.data, key=cmp_to_key(self._get_comparator(key, ascending)))
-        elif isinstance(self.data, set):
-            return sorted(self.data, key=cmp_to_key(self._get_comparator(key, ascending)))
-        else:
+        if not isinstance(self.data, (list, set)):
             raise ValueError("Data must be a list or set to be sorted.")
+        sort_keys = self._sort_keys(key, ascending)
+        if len(sort_keys) == 1:
+            accessor, ascending = sort_keys[0]
+            return sorted(self.data, key=accessor, reverse=not ascending)
+
+        items = list(self.data)
+        columns = [(list(map(accessor, items)), ascending) for accessor, ascending in sort_keys]
+        if all(ascending == columns[0][1] for _, ascending in columns):
+            rows = list(zip(*[values for values, _ in columns]))
+            order = sorted(range(len(items)), key=rows.__getitem__, reverse=not columns[0][1])
+        else:
+            order = list(range(len(items)))
+            for values, ascending in reversed(columns):
+                order.sort(key=values.__getitem__, reverse=not ascending)
+        return [items[index] for index in order]
+
+    @staticmethod
+    def _sort_keys(key: Union[str, Sequence[str], None],
+                   ascending: Union[bool, Sequence[bool]]) -> List[Tuple[Callable[[Any], Any], bool]]:
+        """
+        Pair a compiled accessor with the direction of every sort key.
+
+        :param key: The key or list of keys.
+        :param ascending: A single flag for every key or one flag per key.
+        :return: List of (accessor, ascending) pairs.
+        :raises ValueError: If the number of flags does not match the number of keys.
+        """
+        keys = [key] if key is None or isinstance(key, str) else list(key)
+        flags = list(repeat(ascending, len(keys))) if isinstance(ascending, bool) else list(ascending)
+        if not keys or len(flags) != len(keys):
+            raise ValueError("Provide one ascending flag per sort key.")
+        return [(compile_key_accessor(k), bool(flag)) for k, flag in zip(keys, flags)]
 
     def filter(self, key: str, value: Any) -> Any:
         """
         Filter the data structure by a specified key or position. Supports nested structures.
 
+        With indexed=True the first filter on a key builds a hash index over the data, so repeated filters are
+        dictionary lookups.
+
         :param key: The key or position to filter by. Supports dot notation for nested keys.
         :type key: str
         :param value: The value to filter by.
@@ -49,15 +124,35 @@ class DataProcessor:
         :rtype: Any
         :raises ValueError: If data is not a list, set, or dict.
         """
+        if key and self.index is not None and isinstance(self.data, (list, set, dict)):
+            indexed = self.index.select(self.data, {key: value})
+            if indexed is not None:
+                if isinstance(self.data, set):
+                    return set(indexed)
+                return dict(indexed) if isinstance(self.data, dict) else indexed
         if isinstance(self.data, list):
             return [item for item in self.data if self._get_nested_value(item, key.split('.')) == value]
         elif isinstance(self.data, set):
             return {item for item in self.data if self._get_nested_value(item, key.split('.')) == value}
         elif isinstance(self.data, dict):
-            return {k: v for k, v in self.data.items if self._get_nested_value(v, key.split('.')) == value}
+            return {k: v for k, v in self.data.items() if self._get_nested_value(v, key.split('.')) == value}
         else:
             raise ValueError("Data must be a list, set, or dict to be filtered.")
 
+    def _row_accessor(self, key: str) -> Callable[[Any], Any]:
+        """
+        Build the index accessor for a key; dictionaries are indexed as (key, value) pairs.
+
+        :param key: The key to read. Supports dot notation for nested keys.
+        :type key: str
+        :return: Function that reads the key from one indexed row.
+        :rtype: Callable[[Any], Any]
+        """
+        accessor = compile_key_accessor(key)
+        if isinstance(self.data, dict):
+            return lambda pair: accessor(pair[1])
+        return accessor
+
     def _get_nested_value(self, data: Any, keys: List[str]) -> Any:
         """
         Retrieve the value from a nested data structure using a list of keys.
@@ -80,28 +175,6 @@ class DataProcessor:
                 raise KeyError(f"Key '{key}' not found in data.")
         return data
 
-    def _get_comparator(self, key: str, ascending: bool):
-        """
-        Generate a comparator function for sorting based on a nested key.
-
-        :param key: The key to sort by. Supports dot notation for nested keys.
-        :type key: str
-        :param ascending: True for ascending order, False for descending order.
-        :type ascending: bool
-        :return: Comparator function for sorting.
-        :rtype: function
-        """
-        def comparator(x, y):
-            x_val = self._get_nested_value(x, key.split('.')) if key else x
-            y_val = self._get_nested_value(y, key.split('.')) if key else y
-            if x_val == y_val:
-                return 0
-            if ascending:
-                return -1 if x_val < y_val else 1
-            else:
-                return 1 if x_val < y_val else -1
-        return comparator
-
 # # Example usage
 # data = [
 #     {"name": "Alice", "details": {"age": 30, "city": "New York"}},
@@ -120,6 +193,10 @@ class DataProcessor:
 # sorted_data_desc = processor.sort(key="details.age", ascending=False)
 # print("Sorted by details.age (descending):", sorted_data_desc)
 #
+# # Sort by details.city ascending, then details.age descending
+# sorted_data_multi = processor.sort(key=["details.city", "details.age"], ascending=[True, False])
+# print("Sorted by details.city, details.age (descending):", sorted_data_multi)
+#
 # # Filter by details.city
 # filtered_data = processor.filter(key="details.city", value="New York")
 # print("Filtered by details.city (New York):", filtered_data)
@@ -136,17 +213,38 @@ import operator
 
 
 class DictListProcessor:
-    def __init__(self, data: List[Dict[str, Any]]) -> None:
+    def __init__(self, data: List[Dict[str, Any]], indexed: bool = False) -> None:
         """
         Initialize the processor with a list of dictionaries.
 
         :param data: List of dictionaries to be processed.
         :type data: List[Dict[str, Any]]
+        :param indexed: Answer repeated filters from hash indexes. Only pass True when the dictionaries are not
+            edited in place between filters, or call index.invalidate() after editing them.
+        :type indexed: bool
         :raises ValueError: If data is not a list of dictionaries.
         """
         if not isinstance(data, list) or not all(isinstance(i, dict) for i in data):
             raise ValueError("Data must be a list of dictionaries.")
         self.data = data
+        self.index = PropertyIndex(self._property_accessor) if indexed else None
+
+    @staticmethod
+    def _property_accessor(property_name: str):
+        """
+        Build a function that reads a nested property from one dictionary.
+
+        :param property_name: The property name, can be nested (e.g., 'a.b.c').
+        :type property_name: str
+        :return: The accessor function.
+        """
+        keys = property_name.split('.')
+
+        def get_nested_value(d):
+            for key in keys:
+                d = d[key]
+            return d
+        return get_nested_value
 
     def sort_by_property(self, property_name: str, ascending: bool = True) -> List[Dict[str, Any]]:
         """
@@ -175,6 +273,7 @@ class DictListProcessor:
     def filter_by_property(self, property_name: str, value: Any) -> List[Dict[str, Any]]:
         """
         Filter the list of dictionaries by a specified property value. Supports nested properties.
+        With indexed=True repeated filters on a property are answered from a hash index built on first use.
 
         :param property_name: The property name to filter by, can be nested (e.g., 'a.b.c').
         :type property_name: str
@@ -184,6 +283,10 @@ class DictListProcessor:
         :rtype: List[Dict[str, Any]]
         :raises KeyError: If the property_name does not exist in any dictionary.
         """
+        indexed = self.index.select(self.data, {property_name: value}) if self.index is not None else None
+        if indexed is not None:
+            return indexed
+
         def get_nested_value(d, keys):
             for key in keys:
                 d = d[key]
@@ -218,9 +321,277 @@ class DictListProcessor:
 # filtered_data = processor.filter_by_property("details.city", "New York")
 # print("Filtered by details.city (New York):", filtered_data)
 
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Iterable, Optional
 from collections import Counter
+import math
+import random
 import statistics
+import sys
+from fractions import Fraction
+
+
+class StreamingPropertyStatistics:
+    """
+    One-pass statistics for one property: value counts, mean and variance, min/max and quantiles.
+
+    Quantiles are exact while the number of distinct values stays within max_distinct, because they are read
+    from the value counts. Beyond that the counts stop growing, items with new values are tallied in
+    uncounted (reports list them as one line) and quantiles come from a fixed-size random sample, so memory
+    stays bounded however many items are added. Mean, variance and stdev are summed exactly per denominator,
+    as the statistics module does, so they equal statistics.mean/variance/stdev in value and type.
+    """
+
+    def __init__(self, sample_size: int = 1024, max_distinct: int = 100000, rng: Optional[random.Random] = None) -> None:
+        """
+        Initialize empty statistics.
+
+        :param sample_size: Size of the reservoir sample used for approximate quantiles.
+        :type sample_size: int
+        :param max_distinct: Maximum number of distinct values counted.
+        :type max_distinct: int
+        :param rng: Random generator for the reservoir sample.
+        :type rng: Optional[random.Random]
+        """
+        self.sample_size = sample_size
+        self.max_distinct = max_distinct
+        self.counts: Counter = Counter()
+        self.uncounted = 0
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        # Denominator -> sum of numerators of the values (and of their squares); None sums NaN and infinities
+        self._partials: Dict[Optional[int], Any] = {}
+        self._square_partials: Dict[int, int] = {}
+        self._integral = True
+        self._sample: List[Union[int, float]] = []
+        self._rng = rng or random.Random()
+
+    def add(self, value: Any) -> None:
+        """
+        Add one value. Only int and float values feed the numeric statistics; MAC addresses count as text.
+
+        :param value: The property value of one item.
+        :type value: Any
+        """
+        counts = self.counts
+        if value in counts:
+            counts[value] += 1
+        elif len(counts) < self.max_distinct:
+            counts[value] = 1
+        else:
+            self.uncounted += 1
+        if not isinstance(value, (int, float)) or isinstance(value, MacAddress):
+            return
+        self.count += 1
+        if isinstance(value, int):
+            numerator, denominator = value, 1
+        elif math.isfinite(value):
+            numerator, denominator = value.as_integer_ratio()
+            self._integral = False
+        else:
+            numerator, denominator = value, None
+            self._integral = False
+        partials = self._partials
+        partials[denominator] = partials.get(denominator, 0) + numerator
+        if denominator is not None:
+            squares = self._square_partials
+            squares[denominator] = squares.get(denominator, 0) + numerator * numerator
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if len(self._sample) < self.sample_size:
+            self._sample.append(value)
+        else:
+            slot = self._rng.randrange(self.count)
+            if slot < self.sample_size:
+                self._sample[slot] = value
+
+    @property
+    def counts_complete(self) -> bool:
+        """
+        True while every added value is in counts.
+        """
+        return not self.uncounted
+
+    @property
+    def mean(self) -> Union[int, float]:
+        """
+        Mean of the numeric values; an int when they are integers with a whole mean, like statistics.mean.
+
+        :raises statistics.StatisticsError: If no numeric values were added.
+        """
+        if not self.count:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        if None in self._partials:
+            return self._partials[None] / self.count
+        return self._convert(self._total() / self.count)
+
+    @property
+    def variance(self) -> Union[int, float]:
+        """
+        Sample variance of the numeric values.
+
+        :raises statistics.StatisticsError: If fewer than two numeric values were added.
+        """
+        if self.count < 2:
+            raise statistics.StatisticsError("variance requires at least two data points")
+        if None in self._partials:
+            return self._partials[None] / (self.count - 1)
+        return self._convert(self._squared_deviations() / (self.count - 1))
+
+    @property
+    def stdev(self) -> float:
+        """
+        Sample standard deviation of the numeric values, correctly rounded like statistics.stdev.
+
+        :raises statistics.StatisticsError: If fewer than two numeric values were added.
+        """
+        if self.count < 2:
+            raise statistics.StatisticsError("stdev requires at least two data points")
+        if None in self._partials:
+            return math.sqrt(self._partials[None] / (self.count - 1))
+        variance = self._squared_deviations() / (self.count - 1)
+        numerator, denominator = variance.numerator, variance.denominator
+        # Integer square root with spare bits, rounded to odd, so the final conversion rounds correctly
+        shift = (numerator.bit_length() - denominator.bit_length() - 2 * sys.float_info.mant_dig - 3) // 2
+        if shift >= 0:
+            return float(self._odd_rounded_root(numerator, denominator << 2 * shift) << shift)
+        return self._odd_rounded_root(numerator << -2 * shift, denominator) / (1 << -shift)
+
+    @staticmethod
+    def _odd_rounded_root(numerator: int, denominator: int) -> int:
+        root = math.isqrt(numerator // denominator)
+        return root | (root * root * denominator != numerator)
+
+    def _total(self) -> Fraction:
+        return sum((Fraction(numerator, denominator) for denominator, numerator in self._partials.items()),
+                   Fraction(0))
+
+    def _squared_deviations(self) -> Fraction:
+        total = self._total()
+        squares = sum((Fraction(numerator, denominator * denominator)
+                       for denominator, numerator in self._square_partials.items()), Fraction(0))
+        return (self.count * squares - total * total) / self.count
+
+    def _convert(self, value: Fraction) -> Union[int, float]:
+        return value.numerator if self._integral and value.denominator == 1 else float(value)
+
+    def numeric_counts(self) -> Dict[Union[int, float], int]:
+        """
+        Return the counts of the numeric values, in order of first appearance.
+        """
+        return {value: count for value, count in self.counts.items() if isinstance(value, (int, float)) and not isinstance(value, MacAddress)}
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Return the value below which the given fraction of the numeric values lie, interpolating between neighbours.
+        quantile(0.5) is the median as statistics.median computes it.
+
+        :param fraction: Between 0 and 1.
+        :type fraction: float
+        :return: The quantile; approximate once the value counts are incomplete.
+        :rtype: float
+        :raises ValueError: If no numeric values were added or the fraction is out of range.
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError("Quantile fraction must be between 0 and 1.")
+        if not self.count:
+            raise ValueError("No numeric values to compute a quantile from.")
+        if self.counts_complete:
+            ordered = sorted(self.numeric_counts().items())
+            total = self.count
+        else:
+            ordered = [(value, 1) for value in sorted(self._sample)]
+            total = len(self._sample)
+        position = fraction * (total - 1)
+        lower_rank, upper_rank = math.floor(position), math.ceil(position)
+        lower = upper = None
+        seen = 0
+        for value, count in ordered:
+            seen += count
+            if lower is None and seen > lower_rank:
+                lower = value
+            if seen > upper_rank:
+                upper = value
+                break
+        if lower_rank == upper_rank:
+            return lower
+        return lower + (upper - lower) * (position - lower_rank)
+
+    def mode(self) -> Union[int, float]:
+        """
+        Return the most common numeric value; ties go to the value seen first, as statistics.mode does.
+        Values added after the counts filled up are not considered.
+
+        :raises ValueError: If no numeric values were added.
+        """
+        numeric_counts = self.numeric_counts()
+        if not numeric_counts:
+            raise ValueError("No numeric values to compute a mode from.")
+        return max(numeric_counts.items(), key=lambda item: item[1])[0]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the statistics reported by DictListStatisticsReport.get_statistics.
+
+        :raises ValueError: If no numeric values were added.
+        :raises statistics.StatisticsError: If only one numeric value was added.
+        """
+        if not self.count:
+            raise ValueError("No numeric values found.")
+        return {
+            "mean": self.mean,
+            "median": self.quantile(0.5),
+            "mode": self.mode(),
+            "variance": self.variance,
+            "stdev": self.stdev,
+        }
+
+
+class StreamingStatisticsAggregator:
+    """
+    Collects StreamingPropertyStatistics for many properties of dictionaries in a single pass.
+    Works over any iterable, so the items never need to be held in memory.
+    """
+
+    def __init__(self, property_names: Iterable[str], sample_size: int = 1024, max_distinct: int = 100000,
+                 seed: Optional[int] = None) -> None:
+        """
+        Initialize the aggregator.
+
+        :param property_names: The dictionary keys to aggregate.
+        :type property_names: Iterable[str]
+        :param sample_size: Reservoir sample size per property.
+        :type sample_size: int
+        :param max_distinct: Maximum number of distinct values counted per property.
+        :type max_distinct: int
+        :param seed: Seed for the reservoir samples, for repeatable approximate quantiles.
+        :type seed: Optional[int]
+        """
+        rng = random.Random(seed)
+        self.properties: Dict[str, StreamingPropertyStatistics] = {
+            name: StreamingPropertyStatistics(sample_size, max_distinct, rng) for name in property_names
+        }
+
+    def update(self, items: Iterable[Dict[str, Any]]) -> 'StreamingStatisticsAggregator':
+        """
+        Add every item of an iterable.
+
+        :param items: Dictionaries to aggregate.
+        :type items: Iterable[Dict[str, Any]]
+        :return: The aggregator.
+        :rtype: StreamingStatisticsAggregator
+        """
+        adders = [(name, stats.add) for name, stats in self.properties.items()]
+        for item in items:
+            get = item.get
+            for name, add in adders:
+                add(get(name))
+        return self
+
+    def __getitem__(self, property_name: str) -> StreamingPropertyStatistics:
+        return self.properties[property_name]
 
 
 class DictListStatisticsReport(DictListProcessor):
@@ -233,6 +604,17 @@ class DictListStatisticsReport(DictListProcessor):
         """
         super().__init__(data)
 
+    def aggregate(self, property_names: Iterable[str]) -> StreamingStatisticsAggregator:
+        """
+        Aggregate several properties in one pass over the data.
+
+        :param property_names: The property names to aggregate.
+        :type property_names: Iterable[str]
+        :return: The filled aggregator.
+        :rtype: StreamingStatisticsAggregator
+        """
+        return StreamingStatisticsAggregator(property_names).update(self.data)
+
     def count_values(self, property_name: str) -> Dict[Any, int]:
         """
         Count the occurrences of each value for a specified property.
@@ -242,10 +624,7 @@ class DictListStatisticsReport(DictListProcessor):
         :return: Dictionary with values as keys and their counts as values.
         :rtype: Dict[Any, int]
         """
-        values = [item.get(property_name) for item in self.data]
-        
-        
-        return dict(Counter(values))
+        return dict(Counter(item.get(property_name) for item in self.data))
 
     def get_statistics(self, property_name: str) -> Dict[str, float]:
         """
@@ -257,18 +636,13 @@ class DictListStatisticsReport(DictListProcessor):
         :rtype: Dict[str, float]
         :raises ValueError: If no numeric values are found.
         """
-        values = [item.get(property_name) for item in self.data if isinstance(item.get(property_name), (int, float))]
+        return self._statistics(property_name, self.aggregate([property_name])[property_name])
 
-        if not values:
+    @staticmethod
+    def _statistics(property_name: str, stats: StreamingPropertyStatistics) -> Dict[str, float]:
+        if not stats.count:
             raise ValueError(f"No numeric values found for property '{property_name}'.")
-
-        return {
-            "mean": statistics.mean(values),
-            "median": statistics.median(values),
-            "mode": statistics.mode(values) if len(values) > 1 else values[0],
-            "variance": statistics.variance(values),
-            "stdev": statistics.stdev(values)
-        }
+        return stats.summary()
 
     def generate_report(self, property_name: str) -> str:
         """
@@ -279,12 +653,43 @@ class DictListStatisticsReport(DictListProcessor):
         :return: Formatted report as a string.
         :rtype: str
         """
-        counts = self.count_values(property_name)
-        try:
-            stats = self.get_statistics(property_name)
-        except ValueError:
-            stats = {}
+        return self.generate_reports([property_name])
+
+    def generate_reports(self, property_names: Iterable[str]) -> str:
+        """
+        Generate the reports of several properties from a single pass over the data.
+
+        :param property_names: The property names to generate reports for.
+        :type property_names: Iterable[str]
+        :return: The reports, one after the other.
+        :rtype: str
+        """
+        return self.report_from_iterable(self.data, property_names)
 
+    @classmethod
+    def report_from_iterable(cls, items: Iterable[Dict[str, Any]], property_names: Iterable[str]) -> str:
+        """
+        Generate reports for dictionaries streamed from any iterable, e.g. a generator over a large export.
+
+        :param items: The dictionaries to report on.
+        :type items: Iterable[Dict[str, Any]]
+        :param property_names: The property names to generate reports for.
+        :type property_names: Iterable[str]
+        :return: The reports, one after the other.
+        :rtype: str
+        """
+        aggregator = StreamingStatisticsAggregator(property_names).update(items)
+        reports = []
+        for property_name, stats in aggregator.properties.items():
+            try:
+                summary = cls._statistics(property_name, stats)
+            except ValueError:
+                summary = {}
+            reports.append(cls._format_report(property_name, stats.counts, summary, stats.uncounted))
+        return "".join(reports)
+
+    @staticmethod
+    def _format_report(property_name: str, counts: Dict[Any, int], stats: Dict[str, float], uncounted: int = 0) -> str:
         report_lines = []
         report_lines.append(f"Data Statistics Report for '{property_name}'")
         report_lines.append("=" * (len(report_lines[0])))
@@ -293,6 +698,8 @@ class DictListStatisticsReport(DictListProcessor):
 
         for value, count in counts.items():
             report_lines.append(f"{value}: {count}")
+        if uncounted:
+            report_lines.append(f"(values beyond the distinct value limit, not counted): {uncounted}")
 
         if stats:
             report_lines.append("\nStatistics for Numeric Values:")
@@ -313,10 +720,16 @@ class DictListStatisticsReport(DictListProcessor):
 # report_generator = DictListStatisticsReport(data)
 # report = report_generator.generate_report("age")
 # print(report)
+#
+# # Several properties from one pass
+# print(report_generator.generate_reports(["age", "city"]))
 
 
 import csv
-from typing import Any, List, Dict, Union
+import json
+import tempfile
+from itertools import chain, islice
+from typing import Any, List, Dict, Union, Iterator, Iterable, Optional
 import collections.abc
 
 class DataTableExporter:
@@ -328,7 +741,6 @@ class DataTableExporter:
         :type data: Any
         """
         self.data = data
-        self.rows = []
 
     def _flatten_dict(self, d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
         """
@@ -352,40 +764,92 @@ class DataTableExporter:
                 items.append((new_key, v))
         return dict(items)
 
-    def _process_data(self, data: Any) -> None:
+    def iter_rows(self, data: Any = None) -> Iterator[Dict[str, Any]]:
         """
-        Process the data into a list of rows for CSV export.
+        Yield the flattened rows of the data one at a time, without building a row list.
 
-        :param data: Data to be processed.
+        Lists, tuples and iterators (e.g. generators) are walked, every dictionary becomes one row.
+
+        :param data: Data to flatten. Defaults to the exporter's data.
         :type data: Any
-        """
-        if isinstance(data, list):
-            for item in data:
-                self._process_data(item)
-        elif isinstance(data, dict):
-            flat_data = self._flatten_dict(data)
-            self.rows.append(flat_data)
-        else:
-            raise ValueError("Unsupported data structure")
+        :return: Iterator over flattened rows.
+        :rtype: Iterator[Dict[str, Any]]
+        :raises ValueError: If the data holds anything other than dictionaries and sequences of them.
+        """
+        stack = [iter((self.data if data is None else data,))]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, dict):
+                    yield self._flatten_dict(item)
+                elif isinstance(item, (list, tuple, collections.abc.Iterator)):
+                    stack.append(iter(item))
+                    break
+                else:
+                    raise ValueError("Unsupported data structure")
+            else:
+                stack.pop()
 
-    def export_to_csv(self, file_path: str) -> None:
+    def export_to_csv(self, file_path: str, header_scan_rows: Optional[int] = None) -> int:
         """
-        Export the processed data to a CSV file.
+        Stream the data to a CSV file, writing each row as soon as it is flattened.
+
+        The header is the sorted union of the keys of all rows. Lists and tuples are read twice, first for the
+        header and then to write the rows. Iterators can only be read once, so their rows are spilled to a
+        temporary file while the header is collected. With header_scan_rows the header is taken from the first
+        rows only, nothing is spilled and keys that first appear later are left out.
 
         :param file_path: Path to the CSV file.
         :type file_path: str
-        """
-        self._process_data(self.data)
-        if not self.rows:
+        :param header_scan_rows: Number of leading rows that define the header, or None for all rows.
+        :type header_scan_rows: Optional[int]
+        :return: Number of rows written.
+        :rtype: int
+        :raises ValueError: If there is no data to export.
+        """
+        if header_scan_rows is not None:
+            rows = self.iter_rows()
+            leading = list(islice(rows, header_scan_rows))
+            return self._write_csv(file_path, self._header(leading), chain(leading, rows))
+        if isinstance(self.data, (list, tuple, dict)):
+            return self._write_csv(file_path, self._header(self.iter_rows()), self.iter_rows())
+
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as spill:
+            keys = set()
+            for row in self.iter_rows():
+                keys.update(row)
+                spill.write(json.dumps({key: self._csv_value(value) for key, value in row.items()}))
+                spill.write('\n')
+            spill.seek(0)
+            return self._write_csv(file_path, sorted(keys), map(json.loads, spill))
+
+    @staticmethod
+    def _header(rows: Iterable[Dict[str, Any]]) -> List[str]:
+        keys = set()
+        for row in rows:
+            keys.update(row)
+        return sorted(keys)
+
+    @staticmethod
+    def _csv_value(value: Any) -> str:
+        """
+        Convert a value to the text csv.writer would write for it.
+        """
+        return '' if value is None else str(value)
+
+    @staticmethod
+    def _write_csv(file_path: str, headers: List[str], rows: Iterable[Dict[str, Any]]) -> int:
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
             raise ValueError("No data to export")
-
-        # Extract headers from the first row
-        headers = sorted(self.rows[0].keys())
-        
+        count = 0
         with open(file_path, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
+            writer = csv.DictWriter(csvfile, fieldnames=headers, extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(self.rows)
+            for row in chain((first,), rows):
+                writer.writerow(row)
+                count += 1
+        return count
 
 # Example usage
 # data = [
@@ -398,6 +862,10 @@ class DataTableExporter:
 # exporter = DataTableExporter(data)
 # exporter.export_to_csv("output.csv")
 # print("Data exported to output.csv")
+#
+# # Stream rows from a generator; the header comes from the first 1000 rows
+# exporter = DataTableExporter(entry.to_dict() for device in devices for entry in device.show_mac_address_table_entry_list)
+# exporter.export_to_csv("mac_table.csv", header_scan_rows=1000)
 
 
 from typing import Any, Union, List, Dict
@@ -425,10 +893,11 @@ class DataStatisticsReport:
         :return: Formatted report as a string.
         :rtype: str
         """
-        # Get counts and statistics
-        counts = self.statistics_processor.count_values()
+        # Get counts and statistics from one pass over the data
+        summary = self.statistics_processor.summarize()
+        counts = summary.counts
         try:
-            stats = self.statistics_processor.get_statistics()
+            stats = self.statistics_processor.statistics_from_summary(summary)
         except ValueError:
             stats = {}
 
@@ -456,39 +925,74 @@ class DataStatisticsProcessor:
         self.data = data
 
     def count_values(self) -> Dict[Any, int]:
-        flat_data = self._flatten_data(self.data)
-        return dict(Counter(flat_data))
+        return dict(Counter(self.iter_values(self.data)))
 
     def get_statistics(self) -> Dict[str, float]:
-        flat_data = self._flatten_data(self.data)
-        numeric_values = [x for x in flat_data if isinstance(x, (int, float))]
+        return self.statistics_from_summary(self.summarize())
 
-        if not numeric_values:
+    def summarize(self) -> StreamingPropertyStatistics:
+        """
+        Count every leaf value and collect the numeric statistics in a single pass over the data.
+
+        :return: Value counts and numeric statistics of all leaf values.
+        :rtype: StreamingPropertyStatistics
+        """
+        summary = StreamingPropertyStatistics(max_distinct=math.inf)
+        add = summary.add
+        for value in self.iter_values(self.data):
+            add(value)
+        return summary
+
+    @staticmethod
+    def statistics_from_summary(summary: StreamingPropertyStatistics) -> Dict[str, float]:
+        """
+        Return the statistics get_statistics reports from a summary built by summarize.
+
+        :param summary: The summary of the data.
+        :type summary: StreamingPropertyStatistics
+        :return: Dictionary with statistics.
+        :rtype: Dict[str, float]
+        :raises ValueError: If no numeric values are found.
+        """
+        if not summary.count:
             raise ValueError("No numeric values found in data.")
+        return summary.summary()
 
-        return {
-            "mean": statistics.mean(numeric_values),
-            "median": statistics.median(numeric_values),
-            "mode": statistics.mode(numeric_values) if len(numeric_values) > 1 else numeric_values[0],
-            "variance": statistics.variance(numeric_values),
-            "stdev": statistics.stdev(numeric_values)
-        }
+    @staticmethod
+    def iter_values(data: Any) -> Iterator[Any]:
+        """
+        Yield the leaf values of nested dictionaries, lists, sets and objects in depth-first order.
+
+        Uses an explicit stack instead of recursion, so deep trees such as NetworkDeviceEntry collections are
+        walked without building intermediate lists.
+
+        :param data: The data to walk.
+        :type data: Any
+        :return: Iterator over leaf values.
+        :rtype: Iterator[Any]
+        """
+        stack = [iter((data,))]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, dict):
+                    stack.append(iter(item.values()))
+                    break
+                elif isinstance(item, (list, set)):
+                    stack.append(iter(item))
+                    break
+                elif isinstance(item, InfoErrorFlags):
+                    # The template bits share one mask; walk them as the per-template fields they replaced
+                    stack.append(iter(item.to_dict().values()))
+                    break
+                elif hasattr(item, '__dict__'):
+                    stack.append(iter(item.__dict__.values()))
+                    break
+                yield item
+            else:
+                stack.pop()
 
     def _flatten_data(self, data: Any) -> List[Any]:
-        if isinstance(data, dict):
-            values = []
-            for key, value in data.items():
-                values.extend(self._flatten_data(value))
-            return values
-        elif isinstance(data, list) or isinstance(data, set):
-            values = []
-            for item in data:
-                values.extend(self._flatten_data(item))
-            return values
-        elif hasattr(data, '__dict__'):
-            return self._flatten_data(data.__dict__)
-        else:
-            return [data]
+        return list(self.iter_values(data))
 
 
 if __name__ == '__main__':
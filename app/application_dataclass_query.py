@@ -0,0 +1,261 @@
+import heapq
+import re
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from app.application_dataclass_data_manager import compile_key_accessor
+from app.application_dataclasses import NetworkDeviceEntry
+
+
+class DeviceEntryRow(NamedTuple):
+    """
+    One entry of a device's entry list together with its device, e.g. an interface and its switch.
+    Query keys reach the two parts as 'device.<field>' and 'entry.<field>'.
+    """
+    device: NetworkDeviceEntry
+    entry: Any
+
+
+class DataQuery:
+    """
+    Lazy, composable query over collected device data.
+
+    Builder methods return a new query and do no work. When the query is iterated, every filter and regex match
+    is applied in one pass over the source, and only the rows that survive are kept, sorted, limited, projected
+    and grouped. Filter, match and sort keys refer to the source rows; select() only shapes the output.
+    """
+
+    def __init__(self, source: Iterable[Any]) -> None:
+        """
+        Initialize the query.
+
+        :param source: Rows to query. Any iterable, including generators; it is read once per execution.
+        :type source: Iterable[Any]
+        """
+        self._source = source
+        self._predicates: Tuple[Callable[[Any], bool], ...] = ()
+        self._order: Tuple[Tuple[Callable[[Any], Any], bool], ...] = ()
+        self._limit: Optional[int] = None
+        self._projection: Optional[Tuple[Tuple[str, Callable[[Any], Any]], ...]] = None
+
+    @classmethod
+    def devices(cls, devices: Iterable[Optional[NetworkDeviceEntry]]) -> 'DataQuery':
+        """
+        Query the devices of a collection, e.g. Data['network_cisco_switches']. Missing devices (None) are skipped.
+
+        :param devices: The collected devices.
+        :return: The query.
+        """
+        return cls(_Replayable(lambda: (device for device in devices if device is not None)))
+
+    @classmethod
+    def entries(cls, devices: Iterable[Optional[NetworkDeviceEntry]], entry_list: str) -> 'DataQuery':
+        """
+        Query one entry list across devices, e.g. 'show_interfaces_entry_list'. Rows are DeviceEntryRow tuples.
+
+        :param devices: The collected devices.
+        :param entry_list: Name of the NetworkDeviceEntry list field.
+        :return: The query.
+        """
+        def rows() -> Iterator[DeviceEntryRow]:
+            for device in devices:
+                if device is None:
+                    continue
+                for entry in getattr(device, entry_list) or ():
+                    yield DeviceEntryRow(device, entry)
+        return cls(_Replayable(rows))
+
+    def _copy(self) -> 'DataQuery':
+        query = DataQuery.__new__(DataQuery)
+        query.__dict__.update(self.__dict__)
+        return query
+
+    def where(self, key: Union[str, Callable[[Any], bool], None] = None, value: Any = None, **criteria: Any) -> 'DataQuery':
+        """
+        Keep rows whose key equals value, or for which a predicate returns True.
+
+        :param key: Dotted key to compare, or a predicate taking the row.
+        :param value: Value the key must equal.
+        :param criteria: More equality filters; use '__' in place of '.' for nested keys, e.g. entry__VLAN_ID='10'.
+        :return: The extended query.
+        """
+        predicates = []
+        if callable(key):
+            predicates.append(key)
+        elif key is not None:
+            predicates.append(_equals(compile_key_accessor(key), value))
+        for name, expected in criteria.items():
+            predicates.append(_equals(compile_key_accessor(name.replace('__', '.')), expected))
+        query = self._copy()
+        query._predicates = self._predicates + tuple(predicates)
+        return query
+
+    def match(self, key: str, pattern: Union[str, re.Pattern]) -> 'DataQuery':
+        """
+        Keep rows whose key, as a string, matches a regular expression from its start (like DataclassFilter).
+
+        :param key: Dotted key to test.
+        :param pattern: Regular expression.
+        :return: The extended query.
+        """
+        accessor = compile_key_accessor(key)
+        regex_match = re.compile(pattern).match
+        query = self._copy()
+        query._predicates = self._predicates + (lambda row: regex_match(str(accessor(row))) is not None,)
+        return query
+
+    def select(self, *keys: str, **aliases: str) -> 'DataQuery':
+        """
+        Project each result row to a dictionary.
+
+        :param keys: Dotted keys to include, named by their last part, e.g. 'entry.CRC' -> 'CRC'.
+        :param aliases: Output name to dotted key, e.g. switch='device.switch_hostname'.
+        :return: The extended query.
+        """
+        projection = [(key.rsplit('.', 1)[-1], compile_key_accessor(key)) for key in keys]
+        projection.extend((name, compile_key_accessor(key)) for name, key in aliases.items())
+        query = self._copy()
+        query._projection = tuple(projection)
+        return query
+
+    def order_by(self, *keys: Union[str, Callable[[Any], Any]], ascending: Union[bool, List[bool]] = True) -> 'DataQuery':
+        """
+        Sort the results by one or more dotted keys or key functions.
+
+        Keys are compared as stored, so string fields holding counters sort as text ('9' after '10'); pass a key
+        function such as lambda row: int(row.entry.CRC or 0) to sort them by number.
+
+        :param keys: Dotted keys or functions taking the row, in order of priority.
+        :param ascending: One flag for every key or one flag per key.
+        :return: The extended query.
+        :raises ValueError: If the number of flags does not match the keys.
+        """
+        flags = [ascending] * len(keys) if isinstance(ascending, bool) else list(ascending)
+        if not keys or len(flags) != len(keys):
+            raise ValueError("Provide one ascending flag per sort key.")
+        query = self._copy()
+        query._order = tuple((key if callable(key) else compile_key_accessor(key), bool(flag))
+                             for key, flag in zip(keys, flags))
+        return query
+
+    def limit(self, count: int) -> 'DataQuery':
+        """
+        Return at most count results. With order_by only the best count rows are kept while scanning.
+
+        :param count: Maximum number of results.
+        :return: The extended query.
+        """
+        if count < 0:
+            raise ValueError("Limit must not be negative.")
+        query = self._copy()
+        query._limit = count
+        return query
+
+    def _filtered(self) -> Iterator[Any]:
+        predicates = self._predicates
+        if not predicates:
+            return iter(self._source)
+        if len(predicates) == 1:
+            return filter(predicates[0], self._source)
+        return (row for row in self._source if all(predicate(row) for predicate in predicates))
+
+    def _ordered(self, rows: Iterator[Any]) -> Iterable[Any]:
+        if not self._order:
+            return rows if self._limit is None else islice(rows, self._limit)
+        accessors = [accessor for accessor, _ in self._order]
+        directions = {ascending for _, ascending in self._order}
+        if len(directions) == 1:
+            key = accessors[0] if len(accessors) == 1 else (lambda row: tuple(accessor(row) for accessor in accessors))
+            ascending = directions.pop()
+            if self._limit is not None:
+                select = heapq.nsmallest if ascending else heapq.nlargest
+                return select(self._limit, rows, key=key)
+            return sorted(rows, key=key, reverse=not ascending)
+        rows = list(rows)
+        for accessor, ascending in reversed(self._order):
+            rows.sort(key=accessor, reverse=not ascending)
+        return rows if self._limit is None else rows[:self._limit]
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Execute the query and yield the results.
+        """
+        rows = self._ordered(self._filtered())
+        if self._projection is None:
+            return iter(rows)
+        projection = self._projection
+        return ({name: accessor(row) for name, accessor in projection} for row in rows)
+
+    def to_list(self) -> List[Any]:
+        """
+        Execute the query and return the results as a list.
+        """
+        return list(self)
+
+    def first(self, default: Any = None) -> Any:
+        """
+        Execute the query and return the first result, reading no further than needed when unsorted.
+        """
+        return next(iter(self), default)
+
+    def count(self) -> int:
+        """
+        Execute the query and return the number of results without building them.
+        """
+        if self._order or self._projection is not None:
+            return sum(1 for _ in self)
+        rows = self._filtered()
+        if self._limit is not None:
+            rows = islice(rows, self._limit)
+        return sum(1 for _ in rows)
+
+    def group_by(self, key: str, aggregate: Optional[Callable[[List[Any]], Any]] = None) -> Dict[Any, Any]:
+        """
+        Execute the query and group the results by a dotted key of the source rows.
+
+        :param key: Key to group by, e.g. 'device.switch_region'.
+        :param aggregate: Optional function applied to each group's result list, e.g. len.
+        :return: Group value to results (or aggregate), in order of first appearance.
+        """
+        accessor = compile_key_accessor(key)
+        projection = self._projection
+        groups: Dict[Any, List[Any]] = {}
+        for row in self._ordered(self._filtered()):
+            result = row if projection is None else {name: get(row) for name, get in projection}
+            groups.setdefault(accessor(row), []).append(result)
+        if aggregate is None:
+            return groups
+        return {value: aggregate(results) for value, results in groups.items()}
+
+
+class _Replayable:
+    """
+    Iterable that calls a generator function on every iteration, so a query built on it can run many times.
+    """
+
+    def __init__(self, generator_function: Callable[[], Iterator[Any]]) -> None:
+        self._generator_function = generator_function
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._generator_function()
+
+
+def _equals(accessor: Callable[[Any], Any], expected: Any) -> Callable[[Any], bool]:
+    return lambda row: accessor(row) == expected
+
+
+# # Example usage
+# switches = Data['network_cisco_switches']
+#
+# # Ten interfaces with the most CRC errors in one region, one pass over every interface
+# worst = (DataQuery.entries(switches, 'show_interfaces_entry_list')
+#          .where('device.switch_region', 'FMT')
+#          .match('entry.INTERFACE', r'Gi')
+#          .order_by(lambda row: int(row.entry.CRC or 0), ascending=False)
+#          .limit(10)
+#          .select('entry.INTERFACE', 'entry.CRC', switch='device.switch_hostname')
+#          .to_list())
+#
+# # Number of connected ports per switch
+# connected = (DataQuery.entries(switches, 'show_interfaces_entry_list')
+#              .where(entry__LINK_STATUS='connected')
+#              .group_by('device.switch_hostname', aggregate=len))
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field, fields, asdict, is_dataclass
 from typing import Dict, List, Any, Optional
 from app.application_dataclasses_support import InfoErrorFlags
-from app.application_dataclasses import DataclassDunderMethods
+from app.application_dataclasses import DataclassDunderMethods, compact_dataclass
 from pickle import NONE
 
 @dataclass 
@@ -49,4 +49,6 @@ class PortSecurityViewEntry(DataclassDunderMethods):
     VLAN_ID: Optional[str] = None
     VLAN_ID_INNER: Optional[str] = None
     VLAN_ID_OUTER: Optional[str] = None
-    
\ No newline at end of file
+
+
+CompactPortSecurityViewEntry = compact_dataclass(PortSecurityViewEntry)
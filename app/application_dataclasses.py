@@ -1,11 +1,89 @@
-from dataclasses import dataclass, field, fields, asdict, is_dataclass
-from typing import Dict, List, Any, Optional
-from app.application_dataclasses_support import InfoErrorFlags
+from dataclasses import dataclass, field, fields, asdict, is_dataclass, make_dataclass, MISSING
+from typing import Dict, List, Any, Optional, Type
+from operator import attrgetter, eq
+from app.application_dataclasses_support import InfoErrorFlags, CLI_FIELD_INTERNER
+from app.mac_address_support import MacAddress
+
+_SCALAR_TYPES = frozenset((str, int, float, bool))
+
+# Parsed CLI fields that hold a MAC address; from_cli_record stores them as MacAddress values
+MAC_ADDRESS_FIELDS = ("MAC_ADDRESS", "BIA", "DESTINATION_ADDRESS")
+
+
+def _is_dataclass_instance(value: Any) -> bool:
+    """
+    Same test as dataclasses.is_dataclass for instances, without the extra type checks.
+    """
+    return hasattr(type(value), '__dataclass_fields__')
+
+
+class _DataclassAccessors:
+    """
+    Field names and a C-level attrgetter for one dataclass, built once per class and cached.
+    """
+    __slots__ = ('names', 'values')
+
+    def __init__(self, cls: type) -> None:
+        self.names = tuple(f.name for f in fields(cls))
+        if len(self.names) > 1:
+            self.values = attrgetter(*self.names)
+        elif self.names:
+            single_value = attrgetter(self.names[0])
+            self.values = lambda obj: (single_value(obj),)
+        else:
+            self.values = lambda obj: ()
+
+
+_ACCESSOR_CACHE: Dict[type, _DataclassAccessors] = {}
+
+
+def _accessors(cls: type) -> _DataclassAccessors:
+    """
+    Returns the cached accessors for a dataclass, building them on first use.
+    """
+    accessors = _ACCESSOR_CACHE.get(cls)
+    if accessors is None:
+        accessors = _ACCESSOR_CACHE[cls] = _DataclassAccessors(cls)
+    return accessors
+
+
+def _plain_value(value: Any) -> Any:
+    """
+    Converts a value the way dataclasses.asdict does, without deep-copying leaf values.
+    """
+    if value is None or type(value) in _SCALAR_TYPES:
+        return value
+    if _is_dataclass_instance(value):
+        accessors = _accessors(type(value))
+        return dict(zip(accessors.names, map(_plain_value, accessors.values(value))))
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return type(value)(*[_plain_value(v) for v in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_plain_value(v) for v in value)
+    if isinstance(value, dict):
+        return type(value)((_plain_value(k), _plain_value(v)) for k, v in value.items())
+    return value
+
 
 class DataclassDunderMethods:
     """
     A  class to automatically generate common dunder methods for dataclasses.
+
+    Field access goes through per-class accessors that are built on first use and cached,
+    so to_dict, __eq__, __hash__ and __str__ do not reflect over dataclasses.fields() per call.
     """
+    # Empty slots keep slotted subclasses (see compact_dataclass) free of a per-instance __dict__
+    __slots__ = ()
+
+    def field_values(self) -> tuple:
+        """
+        Returns the field values as a tuple in field order, without copying nested values.
+
+        Returns:
+            tuple: The field values.
+        """
+        return _accessors(type(self)).values(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Converts the dataclass instance to a dictionary representation.
@@ -13,17 +91,35 @@ class DataclassDunderMethods:
         Returns:
             Dict[str, Any]: A dictionary of the dataclass fields and their values.
         """
-        result = {}
-        for field in fields(self):
-            value = getattr(self, field.name)
-            if is_dataclass(value):
-                result[field.name] = value.to_dict()  # Recursive call for nested dataclasses
-            elif isinstance(value, list) and value and is_dataclass(value[0]):
-                result[field.name] = [v.to_dict() if is_dataclass(v) else v for v in value]
-            else:
-                result[field.name] = value
+        accessors = _accessors(type(self))
+        values = accessors.values(self)
+        result = dict(zip(accessors.names, values))
+        for name, value in zip(accessors.names, values):
+            if value is None or type(value) in _SCALAR_TYPES:
+                continue
+            if _is_dataclass_instance(value):
+                result[name] = value.to_dict()  # Recursive call for nested dataclasses
+            elif isinstance(value, list) and value and _is_dataclass_instance(value[0]):
+                result[name] = [v.to_dict() if _is_dataclass_instance(v) else v for v in value]
         return result
 
+    @classmethod
+    def from_cli_record(cls, record: Dict[str, Any]):
+        """
+        Creates an instance from a parsed CLI record, sharing repeated field values through CLI_FIELD_INTERNER
+        and parsing MAC address fields once into MacAddress values. Values that are not valid MAC addresses
+        (e.g. '' on interfaces without one) are kept as they are.
+
+        :param record: A dictionary of field names and values, e.g. one TextFSM row. It is updated in place.
+        :return: The new dataclass instance.
+        """
+        CLI_FIELD_INTERNER.intern_record(record)
+        for name in MAC_ADDRESS_FIELDS:
+            value = record.get(name)
+            if value:
+                record[name] = MacAddress.coerce(value)
+        return cls(**record)
+
     def update_attributes(self, updates: dict):
         """
         Update the attributes of the class based on the provided dictionary.
@@ -40,8 +136,9 @@ class DataclassDunderMethods:
         """
         Provides a string representation of the dataclass object with its field names and values.
         """
-        available_members = {k: v for k, v in asdict(self).items() if v is not None}
-        members_str = ', '.join(f"{k}: {v}" for k, v in available_members.items())
+        accessors = _accessors(type(self))
+        members_str = ', '.join(f"{k}: {_plain_value(v)}" for k, v in zip(accessors.names, accessors.values(self))
+                                if v is not None)
         return f"{self.__class__.__name__}({members_str})"
 
     def __repr__(self) -> str:
@@ -56,13 +153,44 @@ class DataclassDunderMethods:
         """
         if not isinstance(other, self.__class__):
             return False
-        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(self))
+        values = _accessors(type(self)).values
+        return all(map(eq, values(self), values(other)))
 
     def __hash__(self) -> int:
         """
         Provides a hash value for the dataclass object, allowing it to be used in sets and as dictionary keys.
         """
-        return hash(tuple(getattr(self, f.name) for f in fields(self) if getattr(self, f.name) is not None))
+        values = _accessors(type(self)).values(self)
+        return hash(tuple(tuple(v) if isinstance(v, list) else v for v in values if v is not None))
+
+
+def compact_dataclass(cls: Type[DataclassDunderMethods], name: Optional[str] = None) -> Type[DataclassDunderMethods]:
+    """
+    Builds a slotted, memory-compact copy of a DataclassDunderMethods dataclass.
+
+    The copy has the same fields and defaults as the source class but stores them in __slots__
+    instead of a per-instance __dict__. Equality and hashing come from DataclassDunderMethods,
+    so compact records can be compared, deduplicated and used as dictionary keys.
+
+    Args:
+        cls (Type[DataclassDunderMethods]): The dataclass to copy.
+        name (Optional[str]): Name of the new class. Defaults to 'Compact' + the source class name.
+
+    Returns:
+        Type[DataclassDunderMethods]: The slotted dataclass.
+    """
+    field_specs = []
+    for source_field in fields(cls):
+        if source_field.default_factory is not MISSING:
+            spec = field(default_factory=source_field.default_factory, metadata=source_field.metadata)
+        else:
+            spec = field(default=source_field.default, metadata=source_field.metadata)
+        field_specs.append((source_field.name, source_field.type, spec))
+
+    compact_cls = make_dataclass(name or f"Compact{cls.__name__}", field_specs,
+                                 bases=(DataclassDunderMethods,), eq=False, slots=True)
+    compact_cls.__module__ = cls.__module__
+    return compact_cls
 
 
 @dataclass
@@ -136,6 +264,12 @@ class ShowIPARPEntry(DataclassDunderMethods):
     TYPE: Optional[str] = None
     INTERFACE: Optional[str] = None
 
+
+# Slotted variants for large fleet snapshots, e.g. CompactShowInterfacesEntry(**entry.to_dict())
+CompactShowMACAddressTableEntry = compact_dataclass(ShowMACAddressTableEntry)
+CompactShowInterfacesEntry = compact_dataclass(ShowInterfacesEntry)
+CompactShowIPARPEntry = compact_dataclass(ShowIPARPEntry)
+
     
 @dataclass
 class DeviceConnectionData(DataclassDunderMethods):
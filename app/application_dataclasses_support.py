@@ -1,6 +1,7 @@
 from dataclasses import dataclass, fields, field, asdict, is_dataclass
-from typing import List, Dict, Any, TypeVar, Generic, Iterator, get_type_hints, Type
+from typing import List, Dict, Any, Callable, TypeVar, Generic, Iterator, Iterable, Optional, Sequence, get_type_hints, Type
 from operator import attrgetter
+from array import array
 import re
 
 T = TypeVar('T')
@@ -20,6 +21,9 @@ class Person:
 class InfoErrorFlags:
     """
     A dataclass to represent a binary word where each bit corresponds to a specific TextFSM template or error code.
+
+    The template fields are views over a single integer bitmask; the bit for each template is taken from
+    its field metadata ({"bit": n}). Reading or assigning a template attribute tests or sets that bit.
     """
     class_version:float = 1.0
     name:str = None
@@ -36,24 +40,22 @@ class InfoErrorFlags:
     show_inventory: int = field(default=0, metadata={"bit": 8})
     show_logging: int = field(default=0, metadata={"bit": 9})
     show_interface_status: int = field(default=0, metadata={"bit": 10})
-    
+
+    # Backing bitmask; not a dataclass field. Populated by the template properties defined below the class.
+    _mask = 0
+    TEMPLATE_BITS = {}
+
     def to_binary_string(self) -> str:
         """
-        Returns the binary representation of the flags as a 32-bit string.
+        Returns the binary representation of the flags as a 32-bit string (bit 0 is the rightmost character).
         """
-        bits = [self.show_version, self.show_interface, self.show_ip_route,
-                self.show_mac_address_table, self.show_ip_arp, self.show_vlan,
-                self.show_cdp_neighbors, self.show_ip_interface_brief,
-                self.show_inventory, self.show_logging, self.show_interface_status]
-
-        # Create the 32-bit binary string with leading zeros
-        return ''.join(map(str, bits)).zfill(32)
+        return format(self._mask, '032b')
 
     def to_integer(self) -> int:
         """
         Returns the binary word as an integer.
         """
-        return int(self.to_binary_string(), 2)
+        return self._mask
 
     def set_template(self, template_name: str, value: bool) -> None:
         """
@@ -63,24 +65,347 @@ class InfoErrorFlags:
             template_name (str): The name of the template to set.
             value (bool): True to set the bit, False to clear it.
         """
-        if hasattr(self, template_name):
-            setattr(self, template_name, int(value))
+        bit = self.TEMPLATE_BITS.get(template_name)
+        if bit is None:
+            raise ValueError(f"Template {template_name} does not exist.")
+        if value:
+            self._mask |= bit
         else:
+            self._mask &= ~bit
+
+    def is_set(self, template_name: str) -> bool:
+        """
+        Tests the bit corresponding to a specific template.
+
+        Args:
+            template_name (str): The name of the template to test.
+
+        Returns:
+            bool: True if the bit is set.
+        """
+        bit = self.TEMPLATE_BITS.get(template_name)
+        if bit is None:
             raise ValueError(f"Template {template_name} does not exist.")
+        return bool(self._mask & bit)
 
     def clear_all(self) -> None:
         """
         Resets all bits to 0.
         """
-        for field_name in self.__dataclass_fields__:
-            setattr(self, field_name, 0)
-            
+        self._mask = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the flags to a dictionary with one 0/1 entry per template.
+
+        Returns:
+            Dict[str, Any]: A dictionary of the dataclass fields and their values.
+        """
+        result = {"class_version": self.class_version, "name": self.name, "description": self.description}
+        for template_name, bit in self.TEMPLATE_BITS.items():
+            result[template_name] = 1 if self._mask & bit else 0
+        return result
+
+    @classmethod
+    def from_integer(cls, mask: int, name: str = None, description: str = None) -> 'InfoErrorFlags':
+        """
+        Creates flags from a bitmask previously returned by to_integer.
+
+        Args:
+            mask (int): The bitmask.
+            name (str): Name of the flag word.
+            description (str): Description of the flag word.
+
+        Returns:
+            InfoErrorFlags: The flags.
+        """
+        flags = cls(name=name, description=description)
+        flags._mask = mask
+        return flags
+
+    @classmethod
+    def mask_for(cls, *template_names: str) -> int:
+        """
+        Returns the combined bitmask for one or more templates.
+
+        Args:
+            template_names (str): The template names.
+
+        Returns:
+            int: The bits of all named templates OR-ed together.
+        """
+        mask = 0
+        for template_name in template_names:
+            bit = cls.TEMPLATE_BITS.get(template_name)
+            if bit is None:
+                raise ValueError(f"Template {template_name} does not exist.")
+            mask |= bit
+        return mask
+
+    @staticmethod
+    def masks_to_array(flags_list: Iterable[Optional['InfoErrorFlags']]) -> array:
+        """
+        Packs the bitmasks of many flag words into an unsigned integer array. None entries become 0.
+
+        Args:
+            flags_list (Iterable[Optional[InfoErrorFlags]]): The flag words, e.g. one per device.
+
+        Returns:
+            array: An array('Q') of 64-bit bitmasks, usable directly or via numpy.frombuffer(..., dtype=numpy.uint64).
+        """
+        return array('Q', (flags._mask if flags is not None else 0 for flags in flags_list))
+
+    @staticmethod
+    def select(masks: Sequence[int], mask: int, match_all: bool = False) -> List[int]:
+        """
+        Returns the positions of the bitmasks that have any (or all) of the given bits set.
+
+        Args:
+            masks (Sequence[int]): Bitmasks, e.g. from masks_to_array. NumPy integer arrays are evaluated vectorised.
+            mask (int): The bits to test, e.g. from mask_for.
+            match_all (bool): True to require every bit in mask, False to require at least one.
+
+        Returns:
+            List[int]: Positions of the matching bitmasks.
+        """
+        if hasattr(masks, 'nonzero'):
+            hits = (masks & mask) == mask if match_all else (masks & mask) != 0
+            return hits.nonzero()[0].tolist()
+        if match_all:
+            return [position for position, value in enumerate(masks) if value & mask == mask]
+        return [position for position, value in enumerate(masks) if value & mask]
+
     def __str__(self):
         return self.to_binary_string()
 
 
+def _template_bit_property(bit: int) -> property:
+    """
+    Builds the property that exposes one bit of InfoErrorFlags._mask as a 0/1 template attribute.
+    """
+    def getter(self) -> int:
+        return 1 if self._mask & bit else 0
+
+    def setter(self, value: int) -> None:
+        if value:
+            self._mask |= bit
+        else:
+            self._mask &= ~bit
+
+    return property(getter, setter)
+
+
+InfoErrorFlags.TEMPLATE_BITS = {f.name: 1 << f.metadata["bit"] for f in fields(InfoErrorFlags) if "bit" in f.metadata}
+for _template_name, _template_bit in InfoErrorFlags.TEMPLATE_BITS.items():
+    setattr(InfoErrorFlags, _template_name, _template_bit_property(_template_bit))
+
+
+
 
 
+class FieldValueInterner:
+    """
+    Dictionary-encodes low-cardinality string fields of parsed CLI records.
+
+    Every distinct value of an interned field is kept once in a per-field pool, and records are rewritten
+    to reference the pooled string instead of their own copy. Pools are capped so a field that turns out
+    to be high-cardinality stops growing its pool.
+    """
+
+    DEFAULT_FIELDS = ("LINK_STATUS", "PROTOCOL_STATUS", "DUPLEX", "SPEED", "TYPE", "VLAN_ID", "HARDWARE_TYPE",
+                      "ENCAPSULATION", "MTU", "MEDIA_TYPE", "BANDWIDTH", "DELAY", "QUEUE_STRATEGY",
+                      "LAST_OUTPUT_HANG", "STATUS", "PROTOCOL", "FC_MODE")
+
+    def __init__(self, field_names: Iterable[str] = DEFAULT_FIELDS, max_pool_size: int = 4096):
+        """
+        Initializes the interner.
+
+        Args:
+            field_names (Iterable[str]): The record keys whose values are interned.
+            max_pool_size (int): Maximum number of distinct values pooled per field.
+        """
+        self.max_pool_size = max_pool_size
+        self._pools: Dict[str, Dict[str, str]] = {name: {} for name in field_names}
+
+    def intern_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replaces interned field values in the record with their pooled copies. The record is updated in place.
+
+        Args:
+            record (Dict[str, Any]): A parsed CLI record, e.g. one TextFSM row.
+
+        Returns:
+            Dict[str, Any]: The same record.
+        """
+        for name, pool in self._pools.items():
+            value = record.get(name)
+            if type(value) is not str:
+                continue
+            pooled = pool.get(value)
+            if pooled is not None:
+                record[name] = pooled
+            elif len(pool) < self.max_pool_size:
+                pool[value] = value
+        return record
+
+    def distinct_counts(self) -> Dict[str, int]:
+        """
+        Returns the number of distinct pooled values per field.
+
+        Returns:
+            Dict[str, int]: Field name to distinct value count.
+        """
+        return {name: len(pool) for name, pool in self._pools.items()}
+
+    def clear(self) -> None:
+        """
+        Empties all pools. Records already built keep their strings.
+        """
+        for pool in self._pools.values():
+            pool.clear()
+
+
+# Process-wide interner applied when parsed CLI rows become dataclasses (DataclassDunderMethods.from_cli_record)
+CLI_FIELD_INTERNER = FieldValueInterner()
+
+
+class PropertyIndex:
+    """
+    Lazily built hash indexes that turn repeated equality filters into dictionary lookups.
+
+    The first query on a property scans the collection once and maps every property value to the positions
+    of the rows holding it. Later queries on that property are lookups. All indexes are dropped when a
+    different collection is passed in or its length changes, and a query whose matches no longer hold the
+    queried values is answered from rebuilt indexes. Rows edited in place to *gain* a value cannot be seen
+    that way, so owners only index collections the caller declares stable (see the indexed flag of the
+    filters) and callers call invalidate() after editing rows in place.
+    """
+
+    FALLBACK_ERRORS = (KeyError, AttributeError, IndexError, TypeError, ValueError)
+
+    def __init__(self, accessor_factory: Callable[[str], Callable[[Any], Any]]):
+        """
+        Initializes the index.
+
+        Args:
+            accessor_factory (Callable[[str], Callable[[Any], Any]]): Returns, for a property name, a function that
+                reads that property from one row.
+        """
+        self._accessor_factory = accessor_factory
+        self._source: Any = None
+        self._source_length = -1
+        self._rows: List[Any] = []
+        self._indexes: Dict[str, Optional[Dict[Any, List[int]]]] = {}
+
+    def rows(self, source: Iterable[Any]) -> List[Any]:
+        """
+        Returns the rows of the collection, dropping every index if the collection changed since the last call.
+
+        Lists are used as they are; dictionaries are indexed as (key, value) pairs and other iterables as a list.
+
+        Args:
+            source (Iterable[Any]): The collection being filtered.
+
+        Returns:
+            List[Any]: The indexed rows.
+        """
+        if source is not self._source or len(source) != self._source_length:
+            self._source = source
+            self._source_length = len(source)
+            if isinstance(source, list):
+                self._rows = source
+            elif isinstance(source, dict):
+                self._rows = list(source.items())
+            else:
+                self._rows = list(source)
+            self._indexes.clear()
+        return self._rows
+
+    def _index_for(self, name: str) -> Optional[Dict[Any, List[int]]]:
+        if name in self._indexes:
+            return self._indexes[name]
+        accessor = self._accessor_factory(name)
+        index: Optional[Dict[Any, List[int]]] = {}
+        try:
+            for position, row in enumerate(self._rows):
+                value = accessor(row)
+                positions = index.get(value)
+                if positions is None:
+                    index[value] = [position]
+                else:
+                    positions.append(position)
+        except self.FALLBACK_ERRORS:
+            index = None
+        self._indexes[name] = index
+        return index
+
+    def select(self, source: Iterable[Any], criteria: Dict[str, Any]) -> Optional[List[Any]]:
+        """
+        Returns the rows whose properties equal all criteria, in collection order.
+
+        Args:
+            source (Iterable[Any]): The collection being filtered.
+            criteria (Dict[str, Any]): Property names and the values to match.
+
+        Returns:
+            Optional[List[Any]]: The matching rows, or None when a property cannot be indexed (a row lacks it or
+            holds an unhashable value) or a value is unhashable. Callers then fall back to a linear scan, which
+            also reports any missing property the way it always has.
+        """
+        matches = self._select(source, criteria)
+        if matches is None or self._still_match(matches, criteria):
+            return matches
+        # Rows were replaced or edited since the index was built; rebuild, and scan if that does not settle it
+        self.invalidate()
+        matches = self._select(source, criteria)
+        if matches is None or self._still_match(matches, criteria):
+            return matches
+        return None
+
+    def _select(self, source: Iterable[Any], criteria: Dict[str, Any]) -> Optional[List[Any]]:
+        rows = self.rows(source)
+        selected: Optional[List[int]] = None
+        for name, value in criteria.items():
+            index = self._index_for(name)
+            if index is None:
+                return None
+            try:
+                positions = index.get(value, [])
+            except TypeError:
+                return None
+            if selected is None:
+                selected = positions
+            else:
+                allowed = set(positions)
+                selected = [position for position in selected if position in allowed]
+        if selected is None:
+            return rows
+        return [rows[position] for position in selected]
+
+    def _still_match(self, matches: List[Any], criteria: Dict[str, Any]) -> bool:
+        try:
+            for name, value in criteria.items():
+                accessor = self._accessor_factory(name)
+                if not all(accessor(row) == value for row in matches):
+                    return False
+        except self.FALLBACK_ERRORS:
+            return False
+        return True
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Drops the index of one property, or every index when no name is given.
+
+        Args:
+            name (Optional[str]): The property whose index is stale.
+        """
+        if name is None:
+            self._indexes.clear()
+            self._source = None
+            self._source_length = -1
+        else:
+            self._indexes.pop(name, None)
+
 
 class DataclassConverter(Generic[T]):
     """
@@ -187,25 +512,33 @@ class DataclassFilter:
     A class to filter a list of dataclass instances based on properties or regex.
     """
 
-    def __init__(self, items: List[Any]):
+    def __init__(self, items: List[Any], indexed: bool = False):
         """
         Initializes the DataclassFilter with a list of items.
 
         Args:
             items (List[Any]): The list of dataclass instances to filter.
+            indexed (bool): Answer repeated queries from per-property hash indexes. Only pass True when the
+                items are not edited in place between queries, or call index.invalidate() after editing them.
         """
         self.items = items
+        self.index = PropertyIndex(attrgetter) if indexed else None
 
     def filter_by_properties(self, criteria: Dict[str, Any]) -> List[Any]:
         """
         Filters the list of items based on the given property criteria.
 
+        With indexed=True repeated queries are answered from per-property hash indexes.
+
         Args:
             criteria (Dict[str, Any]): A dictionary where keys are attribute names and values are the values to filter by.
 
         Returns:
             List[Any]: The filtered list of items.
         """
+        indexed = self.index.select(self.items, criteria) if self.index is not None else None
+        if indexed is not None:
+            return indexed
         filtered_items = self.items
         for key, value in criteria.items():
             if not all(hasattr(item, key) for item in self.items):
@@ -345,18 +678,22 @@ class ListFilter(Generic[T]):
         items (List[T]): The list of items to filter.
     """
 
-    def __init__(self, items: List[T]):
+    def __init__(self, items: List[T], indexed: bool = False):
         """
         Initializes the ListFilter with a list of items.
 
         Args:
             items (List[T]): The list of items to filter.
+            indexed (bool): Answer repeated queries from per-property hash indexes. Only pass True when the
+                items are not edited in place between queries, or call index.invalidate() after editing them.
         """
         self.items = items
+        self.index = PropertyIndex(attrgetter) if indexed else None
 
     def filter(self, criteria: Dict[str, Any]) -> List[T]:
         """
-        Filters the list of items based on the given criteria.
+        Filters the list of items based on the given criteria. With indexed=True repeated queries are answered
+        from per-attribute hash indexes.
 
         Args:
             criteria (Dict[str, Any]): A dictionary where keys are attribute names and values are the values to filter by.
@@ -367,6 +704,9 @@ class ListFilter(Generic[T]):
         Raises:
             AttributeError: If an attribute in the criteria does not exist in the items.
         """
+        indexed = self.index.select(self.items, criteria) if self.index is not None else None
+        if indexed is not None:
+            return indexed
         filtered_items = self.items
         for key, value in criteria.items():
             try:
@@ -434,6 +774,15 @@ class TypeIdentifier:
 ####################################################
 
 
+# # Example usage: all devices whose show mac address-table template errored
+# error_masks = InfoErrorFlags.masks_to_array(device.textfsm_templates_errors for device in devices)
+# mac_table_errors = InfoErrorFlags.select(error_masks, InfoErrorFlags.mask_for("show_mac_address_table"))
+# failed_devices = [devices[position] for position in mac_table_errors]
+#
+# # The same query on a NumPy view of the masks runs vectorised
+# # numpy_masks = numpy.frombuffer(error_masks, dtype=numpy.uint64 if error_masks.itemsize == 8 else numpy.uint32)
+# # mac_table_errors = InfoErrorFlags.select(numpy_masks, InfoErrorFlags.mask_for("show_mac_address_table"))
+
 # Example usage
 # interface_data_list = [
 #     InterfaceData(LINK_STATUS="up", PROTOCOL_STATUS="up", HARDWARE_TYPE="Ethernet"),
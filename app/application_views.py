@@ -1,3 +1,4 @@
+from typing import Any, Dict, List, Optional, Tuple
 from app.application_dataclasses import *
 from app.application_dataclasses_support import *
 from app.application_dataclass_views import PortSecurityViewEntry
@@ -6,16 +7,31 @@ from app.SupportUtilities import TaskProgressIndicator
 from app.console_parser import TimeParser
 from pprint import pformat
 
+# Default of create_entry_record's mac_vendor: look the vendor up. None means it was looked up and is unknown.
+_LOOK_UP_VENDOR: Any = object()
+
 
 class ViewBase:
     def __init__(self):
         pass
 
 class PortSecurityView(ViewBase):
-    def __init__(self, device_list:List[NetworkDeviceEntry]):
-        self.mac_address_support: MacAddressSupport = MacAddressSupport()
-        self._devices:List[NetworkDeviceEntry] = device_list
-        self._records: List[PortSecurityViewEntry] = []
+    """
+    Port security records for every interface of every device, kept up to date incrementally.
+
+    Records are keyed by (switch hostname, interface). apply_device_update recomputes only the records whose
+    source ShowInterfacesEntry or switch details changed since the last build, so streaming collectors can
+    feed single devices without rebuilding the whole view.
+    """
+
+    def __init__(self, device_list:List[NetworkDeviceEntry], mac_address_support:MacAddressSupport = None):
+        self.mac_address_support: MacAddressSupport = mac_address_support or MacAddressSupport.shared()
+        # The latest NetworkDeviceEntry of each device, by switch hostname
+        self._devices:Dict[str, NetworkDeviceEntry] = {device.switch_hostname: device
+                                                       for device in device_list if device is not None}
+        self._device_records: Dict[str, Dict[str, PortSecurityViewEntry]] = {}
+        self._source_values: Dict[Tuple[str, str], tuple] = {}
+        self._records_cache: Optional[List[PortSecurityViewEntry]] = None
         self._task_progress:TaskProgressIndicator = TaskProgressIndicator("Building Port Security View",self.get_task_counts())
         print("\n")
         self._task_progress.start()
@@ -23,41 +39,102 @@ class PortSecurityView(ViewBase):
         
     def get_task_counts(self):
         total_task_count:int = 0
-        for device in self._devices:
-            total_task_count += len(device.show_interfaces_entry_list)
+        for device in self._devices.values():
+            total_task_count += len(device.show_interfaces_entry_list or [])
         return total_task_count
         
     def build_records(self):
-        records:list[PortSecurityViewEntry] = []
-        for device in self._devices:
-            
-            switch_hostname:str = device.switch_hostname
-            switch_ip_address:str = device.switch_ip_address
-            switch_region:str = device.switch_region
-            show_interfaces_entry_list:List[ShowInterfacesEntry] = device.show_interfaces_entry_list
-            
-            for entry in show_interfaces_entry_list:
-                
-                self._task_progress.update_task_name(f"Building Port Security View")
-                records.append(self.create_entry_record(switch_hostname, switch_ip_address, switch_region, entry))
-                
-                self._task_progress.update_progress()
-        
-        self._records = records
+        for device in list(self._devices.values()):
+            self._task_progress.update_task_name(f"Building Port Security View")
+            self.apply_device_update(device)
+            self._task_progress.update_progress(len(device.show_interfaces_entry_list or []))
         self._task_progress.complete()
-    
+
+    @property
+    def _records(self) -> List[PortSecurityViewEntry]:
+        if self._records_cache is None:
+            self._records_cache = [record for records in self._device_records.values() for record in records.values()]
+        return self._records_cache
+
+    @property
+    def records(self) -> List[PortSecurityViewEntry]:
+        """
+        All records, grouped by device in the order the devices were first added.
+        """
+        return self._records
+
+    def get_record(self, switch_hostname:str, interface:str) -> Optional[PortSecurityViewEntry]:
+        """
+        Return the record of one interface, or None if the view has no such interface.
+        """
+        return self._device_records.get(switch_hostname, {}).get(interface)
+
+    def apply_device_update(self, device:NetworkDeviceEntry) -> int:
+        """
+        Bring the records of one device up to date with a newly collected NetworkDeviceEntry.
+
+        The device replaces the one stored under its hostname. Interfaces whose entry values and switch details
+        are unchanged keep their record; changed or new interfaces get a new record and interfaces no longer
+        reported are dropped.
+
+        :param device: The collected device.
+        :return: Number of records created or rebuilt.
+        """
+        switch_hostname:str = device.switch_hostname
+        self._devices[switch_hostname] = device
+        switch_details = (device.switch_ip_address, device.switch_region)
+        previous = self._device_records.get(switch_hostname, {})
+        records: Dict[str, PortSecurityViewEntry] = {}
+        changed = []
+        for entry in device.show_interfaces_entry_list or []:
+            key = (switch_hostname, entry.INTERFACE)
+            source_values = switch_details + entry.field_values()
+            record = previous.get(entry.INTERFACE)
+            if record is None or self._source_values.get(key) != source_values:
+                changed.append(entry)
+                self._source_values[key] = source_values
+            records[entry.INTERFACE] = record
+        vendors = self.mac_address_support.get_vendors([entry.MAC_ADDRESS for entry in changed])
+        for entry, mac_vendor in zip(changed, vendors):
+            records[entry.INTERFACE] = self.create_entry_record(switch_hostname, device.switch_ip_address,
+                                                                device.switch_region, entry, mac_vendor)
+        rebuilt = len(changed)
+        for interface in previous.keys() - records.keys():
+            del self._source_values[(switch_hostname, interface)]
+        if rebuilt or len(records) != len(previous):
+            self._device_records[switch_hostname] = records
+            self._records_cache = None
+        return rebuilt
+
+    def remove_device(self, switch_hostname:str) -> int:
+        """
+        Drop a device and every record of it.
+
+        :return: Number of records removed.
+        """
+        self._devices.pop(switch_hostname, None)
+        records = self._device_records.pop(switch_hostname, {})
+        for interface in records:
+            del self._source_values[(switch_hostname, interface)]
+        if records:
+            self._records_cache = None
+        return len(records)
+
     def create_entry_record(self, switch_hostname:str = None, 
                              switch_ip_address:str = None, 
                              switch_region:str = None,
-                             show_interfaces_entry:ShowInterfacesEntry = None) -> PortSecurityViewEntry:
+                             show_interfaces_entry:ShowInterfacesEntry = None,
+                             mac_vendor:Optional[str] = _LOOK_UP_VENDOR) -> PortSecurityViewEntry:
         
-        entry:PortSecurityViewEntry = PortSecurityViewEntry(show_interfaces_entry)
+        entry:PortSecurityViewEntry = PortSecurityViewEntry()
         entry.switch_hostname = switch_hostname
         entry.switch_ip_address = switch_ip_address
         entry.switch_region = switch_region
-        entry.converted_last_input = TimeParser(show_interfaces_entry.LAST_INPUT).
+        entry.converted_last_input = TimeParser(show_interfaces_entry.LAST_INPUT).time_string
         entry.converted_last_output = TimeParser(show_interfaces_entry.LAST_OUTPUT).time_string  
-        entry.mac_vendor = self.mac_address_support.get_vendor(show_interfaces_entry.MAC_ADDRESS)  
+        if mac_vendor is _LOOK_UP_VENDOR:
+            mac_vendor = self.mac_address_support.get_vendors([show_interfaces_entry.MAC_ADDRESS])[0]
+        entry.mac_vendor = mac_vendor
         entry.update_attributes(show_interfaces_entry.to_dict())     
         return entry
     
@@ -0,0 +1,220 @@
+import tracemalloc
+from typing import Any, Callable, Dict, List, Type
+from app.application_dataclasses import (ShowInterfacesEntry, ShowMACAddressTableEntry, ShowIPARPEntry,
+                                         CompactShowInterfacesEntry, CompactShowMACAddressTableEntry,
+                                         CompactShowIPARPEntry)
+from app.application_dataclass_views import PortSecurityViewEntry, CompactPortSecurityViewEntry
+from app.application_dataclasses_support import FieldValueInterner
+
+
+SAMPLE_SHOW_INTERFACES_RECORD: Dict[str, Any] = {
+    "INTERFACE": "GigabitEthernet1/0/1",
+    "LINK_STATUS": "up",
+    "PROTOCOL_STATUS": "up",
+    "HARDWARE_TYPE": "Gigabit Ethernet",
+    "MAC_ADDRESS": "6412.2582.f13f",
+    "BIA": "6412.2582.f13f",
+    "DESCRIPTION": "Toll Lane 3 Controller",
+    "MTU": "1500",
+    "DUPLEX": "Full-duplex",
+    "SPEED": "1000Mb/s",
+    "MEDIA_TYPE": "10/100/1000BaseTX",
+    "BANDWIDTH": "1000000 Kbit",
+    "DELAY": "10 usec",
+    "ENCAPSULATION": "ARPA",
+    "LAST_INPUT": "00:00:02",
+    "LAST_OUTPUT": "00:00:00",
+    "LAST_OUTPUT_HANG": "never",
+    "QUEUE_STRATEGY": "fifo",
+    "INPUT_RATE": "2000",
+    "OUTPUT_RATE": "5000",
+    "INPUT_PPS": "3",
+    "OUTPUT_PPS": "7",
+    "INPUT_PACKETS": "1234567",
+    "OUTPUT_PACKETS": "7654321",
+    "RUNTS": "0",
+    "GIANTS": "0",
+    "INPUT_ERRORS": "0",
+    "CRC": "0",
+    "FRAME": "0",
+    "OVERRUN": "0",
+    "ABORT": "0",
+    "OUTPUT_ERRORS": "0",
+}
+
+SAMPLE_SHOW_MAC_ADDRESS_TABLE_RECORD: Dict[str, Any] = {
+    "DESTINATION_ADDRESS": "6412.2582.f13f",
+    "TYPE": "DYNAMIC",
+    "VLAN_ID": "10",
+    "DESTINATION_PORT": ["Gi1/0/1"],
+}
+
+SAMPLE_SHOW_IP_ARP_RECORD: Dict[str, Any] = {
+    "PROTOCOL": "Internet",
+    "IP_ADDRESS": "10.95.72.23",
+    "AGE": "12",
+    "MAC_ADDRESS": "6412.2582.f13f",
+    "TYPE": "ARPA",
+    "INTERFACE": "Vlan10",
+}
+
+SAMPLE_PORT_SECURITY_VIEW_RECORD: Dict[str, Any] = {
+    "switch_hostname": "mdta-fmtmaint-swt1",
+    "switch_ip_address": "10.95.72.23",
+    "switch_region": "FMT",
+    "converted_last_input": "00:00:02",
+    "converted_last_output": "00:00:00",
+    "mac_vendor": "Hirschmann",
+    **SAMPLE_SHOW_INTERFACES_RECORD,
+}
+
+
+class MemoryBenchmark:
+    """
+    Measures the memory cost of building large lists of records with tracemalloc.
+    """
+
+    def __init__(self, record_count: int = 10000) -> None:
+        """
+        Initialize the benchmark.
+
+        :param record_count: Number of records to build per measurement.
+        :type record_count: int
+        """
+        self.record_count = record_count
+
+    def measure(self, factory: Callable[[], Any]) -> float:
+        """
+        Build record_count objects with the factory and return the average bytes allocated per object.
+
+        :param factory: Zero-argument callable that returns one record.
+        :type factory: Callable[[], Any]
+        :return: Average bytes allocated per record.
+        :rtype: float
+        """
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            records = [factory() for _ in range(self.record_count)]
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del records
+        return (after - before) / self.record_count
+
+    def compare_record_classes(self, regular_cls: Type, compact_cls: Type, record: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Compare the per-record memory of a regular dataclass and its slotted variant.
+
+        The field values are shared between all records, so only the record containers are measured.
+
+        :param regular_cls: The regular dataclass.
+        :param compact_cls: The slotted variant built with compact_dataclass.
+        :param record: Field values used for every record.
+        :return: Dictionary with the regular and compact bytes per record and the savings.
+        :rtype: Dict[str, float]
+        """
+        regular = self.measure(lambda: regular_cls(**record))
+        compact = self.measure(lambda: compact_cls(**record))
+        return {
+            "regular_bytes": regular,
+            "compact_bytes": compact,
+            "saved_bytes": regular - compact,
+            "saved_percent": (regular - compact) / regular * 100 if regular else 0.0,
+        }
+
+    def run_record_class_benchmark(self) -> List[Dict[str, Any]]:
+        """
+        Run compare_record_classes for every parsed CLI entry type.
+
+        :return: One result row per record type.
+        :rtype: List[Dict[str, Any]]
+        """
+        cases = [
+            (ShowInterfacesEntry, CompactShowInterfacesEntry, SAMPLE_SHOW_INTERFACES_RECORD),
+            (ShowMACAddressTableEntry, CompactShowMACAddressTableEntry, SAMPLE_SHOW_MAC_ADDRESS_TABLE_RECORD),
+            (ShowIPARPEntry, CompactShowIPARPEntry, SAMPLE_SHOW_IP_ARP_RECORD),
+            (PortSecurityViewEntry, CompactPortSecurityViewEntry, SAMPLE_PORT_SECURITY_VIEW_RECORD),
+        ]
+        results = []
+        for regular_cls, compact_cls, record in cases:
+            result = self.compare_record_classes(regular_cls, compact_cls, record)
+            result["record_type"] = regular_cls.__name__
+            results.append(result)
+        return results
+
+    @staticmethod
+    def fresh_copy(record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a record with new string objects for every value, as TextFSM produces for each parsed row.
+
+        :param record: The record to copy.
+        :return: The copied record.
+        :rtype: Dict[str, Any]
+        """
+        return {key: value.encode().decode() if isinstance(value, str) else value for key, value in record.items()}
+
+    def compare_interning(self, record_cls: Type, record: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Compare the per-record memory, field strings included, of records built with and without interning.
+
+        :param record_cls: The dataclass to build.
+        :param record: Field values copied into every record.
+        :return: Dictionary with the plain and interned bytes per record and the savings.
+        :rtype: Dict[str, float]
+        """
+        plain = self.measure(lambda: record_cls(**self.fresh_copy(record)))
+        interner = FieldValueInterner()
+        interned = self.measure(lambda: record_cls(**interner.intern_record(self.fresh_copy(record))))
+        return {
+            "regular_bytes": plain,
+            "compact_bytes": interned,
+            "saved_bytes": plain - interned,
+            "saved_percent": (plain - interned) / plain * 100 if plain else 0.0,
+        }
+
+    def run_interning_benchmark(self) -> List[Dict[str, Any]]:
+        """
+        Run compare_interning for the regular and compact interface and MAC table records.
+
+        :return: One result row per record type.
+        :rtype: List[Dict[str, Any]]
+        """
+        cases = [
+            (ShowInterfacesEntry, SAMPLE_SHOW_INTERFACES_RECORD),
+            (CompactShowInterfacesEntry, SAMPLE_SHOW_INTERFACES_RECORD),
+            (ShowMACAddressTableEntry, SAMPLE_SHOW_MAC_ADDRESS_TABLE_RECORD),
+            (CompactShowMACAddressTableEntry, SAMPLE_SHOW_MAC_ADDRESS_TABLE_RECORD),
+        ]
+        results = []
+        for record_cls, record in cases:
+            result = self.compare_interning(record_cls, record)
+            result["record_type"] = record_cls.__name__
+            results.append(result)
+        return results
+
+    @staticmethod
+    def format_results(results: List[Dict[str, Any]], before_label: str = "Regular", after_label: str = "Compact") -> str:
+        """
+        Format benchmark results as a text table.
+
+        :param results: Result rows from run_record_class_benchmark or run_interning_benchmark.
+        :param before_label: Column label for the baseline measurement.
+        :param after_label: Column label for the optimised measurement.
+        :return: Formatted table.
+        :rtype: str
+        """
+        lines = [f"{'Record Type':<34}{before_label + ' (B)':>14}{after_label + ' (B)':>14}{'Saved (B)':>12}{'Saved %':>9}"]
+        lines.append("-" * len(lines[0]))
+        for result in results:
+            lines.append(f"{result['record_type']:<34}{result['regular_bytes']:>14.1f}{result['compact_bytes']:>14.1f}"
+                         f"{result['saved_bytes']:>12.1f}{result['saved_percent']:>8.1f}%")
+        return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    benchmark = MemoryBenchmark(record_count=50000)
+    print(f"Per-record memory, {benchmark.record_count} records per type")
+    print(MemoryBenchmark.format_results(benchmark.run_record_class_benchmark()))
+    print(f"\nPer-record memory including field strings, {benchmark.record_count} records per type")
+    print(MemoryBenchmark.format_results(benchmark.run_interning_benchmark(), "Plain", "Interned"))
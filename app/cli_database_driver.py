@@ -1,8 +1,32 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.exc import SQLAlchemyError
-from app.models import db, Device, Interface, VersionInfo
+from app.mac_address_support import MacAddress
+from app.models import (db, Interface, VersionInfo, RunningConfig, IpRoute, ArpEntry, MacAddressEntry, Vlan,
+                        LogEntry, OspfNeighbor)
 
 class CLIDatabaseDriver:
+    # Parsed command output -> (model, name of the method that maps it to table rows)
+    COMMAND_TABLES: Dict[str, Tuple[Any, str]] = {
+        'show ip interface brief': (Interface, 'ip_interface_brief_rows'),
+        'show version': (VersionInfo, 'version_info_rows'),
+        'show running-config': (RunningConfig, 'running_config_rows'),
+        'show interfaces': (Interface, 'interfaces_rows'),
+        'show ip route': (IpRoute, 'ip_route_rows'),
+        'show arp': (ArpEntry, 'arp_rows'),
+        'show mac address-table': (MacAddressEntry, 'mac_address_table_rows'),
+        'show vlan brief': (Vlan, 'vlan_brief_rows'),
+        'show logging': (LogEntry, 'logging_rows'),
+        'show ip ospf neighbor': (OspfNeighbor, 'ospf_neighbors_rows'),
+    }
+
+    # Tables that keep one current row per natural key instead of a row per insert
+    UPSERT_KEYS: Dict[Any, Tuple[str, ...]] = {
+        Interface: ('device_id', 'name'),
+    }
+
+    # Tables that hold the device's current table (routes, ARP, ...): each write replaces all rows of the device
+    REPLACE_TABLES = (RunningConfig, IpRoute, ArpEntry, MacAddressEntry, Vlan, LogEntry, OspfNeighbor)
+
     def __init__(self, device_id: int):
         """
         Initialize the CLIDatabaseDriver with a device ID.
@@ -11,48 +35,258 @@ class CLIDatabaseDriver:
         """
         self.device_id = device_id
 
-    def insert_ip_interface_brief(self, interfaces: List[Dict[str, Any]]) -> None:
+    def write_tables(self, tables: List[Tuple[Any, List[Dict[str, Any]]]], description: str) -> List[Dict[str, int]]:
         """
-        Insert parsed 'show ip interface brief' data into the database.
+        Write whole tables of rows in a single transaction.
 
-        :param interfaces: List of dictionaries containing interface data
-        :raises ValueError: If there is an issue inserting data into the database
+        Rows of plain tables are added with executemany-style bulk inserts. Rows of tables in UPSERT_KEYS are
+        compared with the stored rows of the device and only new or changed rows are written (see upsert). For
+        tables in REPLACE_TABLES the device's stored rows are deleted first, in the same transaction, so the table
+        holds what the device reported last.
+
+        :param tables: (model, row mappings) pairs, written in order
+        :param description: The command(s) the rows come from, for error messages
+        :return: Per table, the number of rows 'inserted', 'updated', 'unchanged' and 'deleted'
+        :raises ValueError: If there is an issue inserting data into the database; nothing is written then
         """
+        results = []
+        replaced = set()
         try:
-            for interface in interfaces:
-                intf = Interface(
-                    device_id=self.device_id,
-                    name=interface['interface'],
-                    ip_address=interface['ip_address'],
-                    status=interface['status'],
-                    protocol=interface['protocol']
-                )
-                db.session.add(intf)
+            for model, rows in tables:
+                if model in self.UPSERT_KEYS:
+                    results.append(self._upsert(model, rows))
+                    continue
+                deleted = 0
+                if model in self.REPLACE_TABLES and model not in replaced:
+                    replaced.add(model)
+                    deleted = (db.session.query(model).filter(model.device_id == self.device_id)
+                               .delete(synchronize_session=False))
+                if rows:
+                    db.session.bulk_insert_mappings(model, rows)
+                results.append({'inserted': len(rows), 'updated': 0, 'unchanged': 0, 'deleted': deleted})
             db.session.commit()
         except SQLAlchemyError as e:
             db.session.rollback()
-            raise ValueError(f"Failed to insert 'show ip interface brief' data: {e}")
+            raise ValueError(f"Failed to insert '{description}' data: {e}")
+        return results
 
-    def insert_version_info(self, version_info: Dict[str, Any]) -> None:
+    def upsert(self, model: Any, rows: List[Dict[str, Any]], remove_missing: bool = False) -> Dict[str, int]:
         """
-        Insert parsed 'show version' data into the database.
+        Bring the device's rows of a table in UPSERT_KEYS up to date in one transaction.
 
-        :param version_info: Dictionary containing version information
-        :raises ValueError: If there is an issue inserting data into the database
+        :param model: The model, e.g. Interface
+        :param rows: The current row mappings of the device
+        :param remove_missing: Also delete stored rows whose key is not among the given rows
+        :return: The number of rows 'inserted', 'updated', 'unchanged' and 'deleted'
+        :raises ValueError: If there is an issue writing to the database; nothing is written then
         """
         try:
-            ver_info = VersionInfo(
-                device_id=self.device_id,
-                software=version_info.get('software', ''),
-                uptime=version_info.get('uptime', ''),
-                system_image=version_info.get('system_image', ''),
-                processor_board_id=version_info.get('processor_board_id', '')
-            )
-            db.session.add(ver_info)
+            result = self._upsert(model, rows, remove_missing)
             db.session.commit()
         except SQLAlchemyError as e:
             db.session.rollback()
-            raise ValueError(f"Failed to insert 'show version' data: {e}")
+            raise ValueError(f"Failed to upsert '{model.__tablename__}' data: {e}")
+        return result
+
+    def _upsert(self, model: Any, rows: List[Dict[str, Any]], remove_missing: bool = False) -> Dict[str, int]:
+        """
+        Diff rows against the stored state per natural key and write only the difference, without committing.
+
+        The stored rows of the device are read with one query. Keys that are not stored yet are bulk inserted,
+        stored rows whose columns differ get a bulk update of just those columns, and identical rows are left
+        alone. Older duplicates of a key, left by earlier append-only inserts, are deleted.
+        """
+        key_columns = self.UPSERT_KEYS[model]
+        primary_key = model.__mapper__.primary_key[0]
+        incoming: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        for row in rows:
+            incoming[tuple(row[column] for column in key_columns)] = row
+        value_columns = sorted({column for row in rows for column in row} - set(key_columns))
+        selected = [primary_key] + [getattr(model, column) for column in key_columns + tuple(value_columns)]
+        stored: Dict[Tuple[Any, ...], Tuple[Any, Dict[str, Any]]] = {}
+        deleted = []
+        key_size = len(key_columns)
+        for record in db.session.query(*selected).filter(model.device_id == self.device_id).order_by(primary_key):
+            key = tuple(record[1:1 + key_size])
+            if key in stored:
+                deleted.append(stored[key][0])
+            stored[key] = (record[0], dict(zip(value_columns, record[1 + key_size:])))
+        inserts = []
+        updates = []
+        for key, row in incoming.items():
+            current = stored.get(key)
+            if current is None:
+                inserts.append(row)
+                continue
+            identity, values = current
+            changed = {column: value for column, value in row.items()
+                       if column in values and values[column] != value}
+            if changed:
+                changed[primary_key.key] = identity
+                updates.append(changed)
+        if remove_missing:
+            deleted.extend(identity for key, (identity, _) in stored.items() if key not in incoming)
+        if inserts:
+            db.session.bulk_insert_mappings(model, inserts)
+        if updates:
+            db.session.bulk_update_mappings(model, updates)
+        for start in range(0, len(deleted), 500):
+            db.session.query(model).filter(primary_key.in_(deleted[start:start + 500])).delete(synchronize_session=False)
+        return {'inserted': len(inserts), 'updated': len(updates),
+                'unchanged': len(incoming) - len(inserts) - len(updates), 'deleted': len(deleted)}
+
+    def insert_sweep(self, outputs: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Insert the parsed output of every command collected from the device in one transaction.
+
+        :param outputs: Command (a key of COMMAND_TABLES, e.g. 'show arp') to its parsed output
+        :return: The number of rows written (inserted or updated) per command
+        :raises ValueError: If a command is not supported or the data cannot be inserted; nothing is written then
+        """
+        tables = []
+        for command, parsed in outputs.items():
+            try:
+                model, row_method = self.COMMAND_TABLES[command]
+            except KeyError:
+                raise ValueError(f"Unsupported command '{command}'.")
+            tables.append((model, getattr(self, row_method)(parsed)))
+        results = self.write_tables(tables, ', '.join(outputs))
+        return {command: result['inserted'] + result['updated'] for command, result in zip(outputs, results)}
+
+    def ip_interface_brief_rows(self, interfaces: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show ip interface brief' data to interface table rows.
+        """
+        device_id = self.device_id
+        return [{
+            'device_id': device_id,
+            'name': interface['interface'],
+            'ip_address': interface['ip_address'],
+            'status': interface['status'],
+            'protocol': interface['protocol']
+        } for interface in interfaces]
+
+    def version_info_rows(self, version_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show version' data to a version_info table row.
+        """
+        return [{
+            'device_id': self.device_id,
+            'software': version_info.get('software', ''),
+            'uptime': version_info.get('uptime', ''),
+            'system_image': version_info.get('system_image', ''),
+            'processor_board_id': version_info.get('processor_board_id', '')
+        }]
+
+    def running_config_rows(self, running_config: str) -> List[Dict[str, Any]]:
+        """
+        Map 'show running-config' output to a running_config table row.
+        """
+        return [{'device_id': self.device_id, 'config': running_config}]
+
+    def interfaces_rows(self, interfaces: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show interfaces' data to interface table rows.
+
+        Only the columns the parsed entries carry are included, so a sweep does not overwrite the status and
+        protocol stored from 'show ip interface brief' with blanks.
+        """
+        device_id = self.device_id
+        rows = []
+        for interface in interfaces:
+            row = {'device_id': device_id, 'name': interface.get('interface', '')}
+            for column in ('status', 'protocol'):
+                if column in interface:
+                    row[column] = interface[column]
+            rows.append(row)
+        return rows
+
+    def ip_route_rows(self, routes: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show ip route' data to ip_route table rows.
+        """
+        return self._rows(routes, ('protocol', 'network', 'next_hop'))
+
+    def arp_rows(self, arps: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show arp' data to arp_entry table rows.
+        """
+        return self._mac_rows(self._rows(arps, ('protocol', 'address', 'age', 'mac_address', 'interface')))
+
+    def mac_address_table_rows(self, mac_table: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show mac address-table' data to mac_address_entry table rows.
+        """
+        return self._mac_rows(self._rows(mac_table, ('vlan', 'mac_address', 'ports'), {'type': 'entry_type'}))
+
+    def vlan_brief_rows(self, vlans: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show vlan brief' data to vlan table rows.
+        """
+        return self._rows(vlans, ('vlan_id', 'name', 'status', 'ports'))
+
+    def logging_rows(self, logs: List[str]) -> List[Dict[str, Any]]:
+        """
+        Map 'show logging' lines to log_entry table rows, numbered in output order.
+        """
+        device_id = self.device_id
+        return [{'device_id': device_id, 'line_number': line_number, 'message': message}
+                for line_number, message in enumerate(logs, 1)]
+
+    def ospf_neighbors_rows(self, neighbors: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Map parsed 'show ip ospf neighbor' data to ospf_neighbor table rows.
+        """
+        return self._rows(neighbors, ('neighbor_id', 'priority', 'state', 'dead_time', 'address', 'interface'))
+
+    def _rows(self, entries: List[Dict[str, Any]], fields: Tuple[str, ...],
+              renamed: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Copy parsed fields to row mappings for the device; missing fields become ''.
+
+        :param entries: Parsed entries
+        :param fields: Fields whose column has the same name
+        :param renamed: Parsed field to column name, for the others
+        :return: The row mappings
+        """
+        device_id = self.device_id
+        columns = [(field, field) for field in fields] + list((renamed or {}).items())
+        return [dict({column: entry.get(field, '') for field, column in columns}, device_id=device_id)
+                for entry in entries]
+
+    @staticmethod
+    def _mac_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store mac_address columns in the canonical Cisco form, parsed once per row, so ARP and MAC table rows join
+        on equal text whatever notation the device printed; values that are not MAC addresses are kept as they are.
+        """
+        for row in rows:
+            mac_address = MacAddress.coerce(row['mac_address'])
+            if isinstance(mac_address, MacAddress):
+                row['mac_address'] = str(mac_address)
+        return rows
+
+    def _insert(self, command: str, parsed: Any) -> None:
+        model, row_method = self.COMMAND_TABLES[command]
+        self.write_tables([(model, getattr(self, row_method)(parsed))], command)
+
+    def insert_ip_interface_brief(self, interfaces: List[Dict[str, Any]]) -> None:
+        """
+        Insert parsed 'show ip interface brief' data into the database, updating only interfaces that changed.
+
+        :param interfaces: List of dictionaries containing interface data
+        :raises ValueError: If there is an issue inserting data into the database
+        """
+        self._insert('show ip interface brief', interfaces)
+
+    def insert_version_info(self, version_info: Dict[str, Any]) -> None:
+        """
+        Insert parsed 'show version' data into the database.
+
+        :param version_info: Dictionary containing version information
+        :raises ValueError: If there is an issue inserting data into the database
+        """
+        self._insert('show version', version_info)
 
     def insert_running_config(self, running_config: str) -> None:
         """
@@ -61,34 +295,16 @@ class CLIDatabaseDriver:
         :param running_config: The running configuration as a string
         :raises ValueError: If there is an issue inserting data into the database
         """
-        # This example assumes running config is stored as a text file in the database
-        try:
-            # Implementation for storing running config goes here
-            pass
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show running-config' data: {e}")
+        self._insert('show running-config', running_config)
 
     def insert_interfaces(self, interfaces: List[Dict[str, Any]]) -> None:
         """
-        Insert parsed 'show interfaces' data into the database.
+        Insert parsed 'show interfaces' data into the database, updating only interfaces that changed.
 
         :param interfaces: List of dictionaries containing interface data
         :raises ValueError: If there is an issue inserting data into the database
         """
-        try:
-            for interface in interfaces:
-                intf = Interface(
-                    device_id=self.device_id,
-                    name=interface.get('interface', ''),
-                    status=interface.get('status', ''),
-                    protocol=interface.get('protocol', '')
-                )
-                db.session.add(intf)
-            db.session.commit()
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show interfaces' data: {e}")
+        self._insert('show interfaces', interfaces)
 
     def insert_ip_route(self, routes: List[Dict[str, str]]) -> None:
         """
@@ -97,12 +313,7 @@ class CLIDatabaseDriver:
         :param routes: List of dictionaries containing route data
         :raises ValueError: If there is an issue inserting data into the database
         """
-        try:
-            # Implementation for storing IP route data goes here
-            pass
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show ip route' data: {e}")
+        self._insert('show ip route', routes)
 
     def insert_arp(self, arps: List[Dict[str, str]]) -> None:
         """
@@ -111,12 +322,7 @@ class CLIDatabaseDriver:
         :param arps: List of dictionaries containing ARP table entries
         :raises ValueError: If there is an issue inserting data into the database
         """
-        try:
-            # Implementation for storing ARP data goes here
-            pass
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show arp' data: {e}")
+        self._insert('show arp', arps)
 
     def insert_mac_address_table(self, mac_table: List[Dict[str, str]]) -> None:
         """
@@ -125,12 +331,7 @@ class CLIDatabaseDriver:
         :param mac_table: List of dictionaries containing MAC address table entries
         :raises ValueError: If there is an issue inserting data into the database
         """
-        try:
-            # Implementation for storing MAC address table data goes here
-            pass
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show mac address-table' data: {e}")
+        self._insert('show mac address-table', mac_table)
 
     def insert_vlan_brief(self, vlans: List[Dict[str, str]]) -> None:
         """
@@ -139,12 +340,7 @@ class CLIDatabaseDriver:
         :param vlans: List of dictionaries containing VLAN details
         :raises ValueError: If there is an issue inserting data into the database
         """
-        try:
-            # Implementation for storing VLAN data goes here
-            pass
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show vlan brief' data: {e}")
+        self._insert('show vlan brief', vlans)
 
     def insert_logging(self, logs: List[str]) -> None:
         """
@@ -153,12 +349,7 @@ class CLIDatabaseDriver:
         :param logs: List of log entries
         :raises ValueError: If there is an issue inserting data into the database
         """
-        try:
-            # Implementation for storing log data goes here
-            pass
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show logging' data: {e}")
+        self._insert('show logging', logs)
 
     def insert_ospf_neighbors(self, neighbors: List[Dict[str, str]]) -> None:
         """
@@ -167,17 +358,12 @@ class CLIDatabaseDriver:
         :param neighbors: List of dictionaries containing OSPF neighbor details
         :raises ValueError: If there is an issue inserting data into the database
         """
-        try:
-            # Implementation for storing OSPF neighbor data goes here
-            pass
-        except SQLAlchemyError as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to insert 'show ip ospf neighbor' data: {e}")
+        self._insert('show ip ospf neighbor', neighbors)
 
 # Example usage:
 if __name__ == "__main__":
     from console_parser import (
-        ShowIpInterfaceBriefParser, ShowVersionParser,
+        ShowIpInterfaceBriefParser, ShowVersionParser, ShowArpParser, ShowMacAddressTableParser,
         # Add other necessary parsers here
     )
 
@@ -191,3 +377,11 @@ if __name__ == "__main__":
     db_driver = CLIDatabaseDriver(device_id)
     db_driver.insert_ip_interface_brief(ip_int_brief_data)
     db_driver.insert_version_info(version_info_data)
+
+    # Everything collected from the device in one transaction
+    db_driver.insert_sweep({
+        'show ip interface brief': ip_int_brief_data,
+        'show version': version_info_data,
+        'show arp': ShowArpParser.parse("raw 'show arp' output here"),
+        'show mac address-table': ShowMacAddressTableParser.parse("raw 'show mac address-table' output here"),
+    })
@@ -0,0 +1,276 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from app.application_dataclasses import NetworkDeviceEntry
+
+
+COUNTER_FIELDS = ("CRC", "INPUT_ERRORS", "OUTPUT_ERRORS", "RUNTS", "GIANTS", "INPUT_RATE", "OUTPUT_RATE")
+
+
+def _to_number(value: Any) -> float:
+    """
+    Convert a parsed counter to a float; missing or unparseable counters become NaN.
+    """
+    if value is None or value == '':
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class FleetCounterAnalytics:
+    """
+    Column store of interface counters across the fleet, for vectorized error hunting.
+
+    Every interface of every switch is one row. Each counter in COUNTER_FIELDS is a float64 NumPy column (NaN
+    where the counter is missing), and rows carry integer switch and region codes, so top-N, percentile,
+    threshold and group-by queries run as array operations instead of per-row Python loops.
+    """
+
+    def __init__(self, switches: Sequence[str], regions: Sequence[Optional[str]], switch_regions: np.ndarray,
+                 switch_codes: np.ndarray, interfaces: List[str], counters: Dict[str, np.ndarray],
+                 switch_ips: Optional[Sequence[Optional[str]]] = None) -> None:
+        """
+        Initialize from prepared columns; use from_devices to build from collected data.
+
+        :param switches: Switch hostname per switch code.
+        :param regions: Region name per region code.
+        :param switch_regions: Region code per switch code.
+        :param switch_codes: Switch code per row.
+        :param interfaces: Interface name per row.
+        :param counters: Counter name to float64 column.
+        :param switch_ips: Switch IP address per switch code.
+        """
+        self.switches = list(switches)
+        self.switch_ips = list(switch_ips) if switch_ips is not None else [None] * len(self.switches)
+        self.regions = list(regions)
+        self.switch_regions = switch_regions
+        self.switch_codes = switch_codes
+        self.region_codes = switch_regions[switch_codes]
+        self.interfaces = interfaces
+        self.counters = counters
+        self._positions: Optional[Dict[Tuple[str, str], int]] = None
+
+    @classmethod
+    def from_devices(cls, devices: Iterable[Optional[NetworkDeviceEntry]],
+                     counter_fields: Sequence[str] = COUNTER_FIELDS) -> 'FleetCounterAnalytics':
+        """
+        Load the counters of every interface in a device collection, e.g. Data['network_cisco_switches'].
+
+        :param devices: The collected devices. Missing devices (None) are skipped.
+        :param counter_fields: ShowInterfacesEntry fields to load.
+        :return: The analytics store.
+        """
+        switches: List[str] = []
+        switch_ips: List[Optional[str]] = []
+        region_index: Dict[Optional[str], int] = {}
+        switch_regions: List[int] = []
+        switch_codes: List[int] = []
+        interfaces: List[str] = []
+        columns: Dict[str, List[float]] = {name: [] for name in counter_fields}
+        for device in devices:
+            if device is None:
+                continue
+            code = len(switches)
+            switches.append(device.switch_hostname)
+            switch_ips.append(device.switch_ip_address)
+            switch_regions.append(region_index.setdefault(device.switch_region, len(region_index)))
+            entries = device.show_interfaces_entry_list or []
+            switch_codes.extend([code] * len(entries))
+            interfaces.extend(entry.INTERFACE for entry in entries)
+            for name, column in columns.items():
+                column.extend(_to_number(getattr(entry, name)) for entry in entries)
+        return cls(switches, list(region_index), np.array(switch_regions, dtype=np.int32),
+                   np.array(switch_codes, dtype=np.int32), interfaces,
+                   {name: np.array(column, dtype=np.float64) for name, column in columns.items()}, switch_ips)
+
+    def __len__(self) -> int:
+        return len(self.interfaces)
+
+    def position(self, switch: str, interface: str) -> int:
+        """
+        Return the row of an interface.
+
+        :param switch: The switch hostname.
+        :param interface: The interface name, e.g. 'GigabitEthernet1/0/1'.
+        :return: The row position.
+        :raises KeyError: If the interface is not loaded.
+        """
+        if self._positions is None:
+            switches = self.switches
+            self._positions = {(switches[code], interface): row
+                               for row, (code, interface) in enumerate(zip(self.switch_codes.tolist(), self.interfaces))}
+        try:
+            return self._positions[(switch, interface)]
+        except KeyError:
+            raise KeyError(f"Interface '{interface}' on '{switch}' is not loaded.")
+
+    def value(self, switch: str, interface: str, counter: str) -> float:
+        """
+        Return one counter of one interface.
+        """
+        return float(self.counters[counter][self.position(switch, interface)])
+
+    def _column(self, counter: str) -> np.ndarray:
+        try:
+            return self.counters[counter]
+        except KeyError:
+            raise KeyError(f"Counter '{counter}' is not loaded.")
+
+    def _region_mask(self, region: Optional[str]) -> Optional[np.ndarray]:
+        if region is None:
+            return None
+        if region not in self.regions:
+            return np.zeros(len(self), dtype=bool)
+        return self.region_codes == self.regions.index(region)
+
+    def records(self, rows: Iterable[int], counters: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Describe rows as dictionaries with the switch, region, interface and counter values.
+
+        :param rows: Row positions.
+        :param counters: Counters to include. Defaults to every loaded counter.
+        :return: One dictionary per row.
+        """
+        names = list(self.counters) if counters is None else list(counters)
+        rows = [int(row) for row in rows]
+        values = {name: self.counters[name][rows].tolist() for name in names}
+        records = []
+        for index, row in enumerate(rows):
+            code = int(self.switch_codes[row])
+            record = {
+                "switch_hostname": self.switches[code],
+                "switch_region": self.regions[int(self.switch_regions[code])],
+                "INTERFACE": self.interfaces[row],
+            }
+            for name in names:
+                record[name] = values[name][index]
+            records.append(record)
+        return records
+
+    def top_n(self, counter: str, n: int = 10, region: Optional[str] = None, largest: bool = True) -> List[Dict[str, Any]]:
+        """
+        Return the n interfaces with the highest (or lowest) value of a counter. Missing values are ignored.
+
+        :param counter: The counter, e.g. 'CRC'.
+        :param n: Number of interfaces.
+        :param region: Limit to one region.
+        :param largest: False for the lowest values.
+        :return: Records ordered from the most extreme value.
+        """
+        column = self._column(counter)
+        valid = ~np.isnan(column)
+        mask = self._region_mask(region)
+        if mask is not None:
+            valid &= mask
+        candidates = np.flatnonzero(valid)
+        if n <= 0 or not len(candidates):
+            return []
+        values = column[candidates] if largest else -column[candidates]
+        if n < len(candidates):
+            selected = np.argpartition(-values, n - 1)[:n]
+        else:
+            selected = np.arange(len(candidates))
+        selected = selected[np.argsort(-values[selected], kind='stable')]
+        return self.records(candidates[selected], [counter])
+
+    def percentile(self, counter: str, q, region: Optional[str] = None):
+        """
+        Return percentiles of a counter across the fleet or one region. Missing values are ignored.
+
+        :param counter: The counter, e.g. 'INPUT_RATE'.
+        :param q: Percentile or sequence of percentiles between 0 and 100.
+        :param region: Limit to one region.
+        :return: The percentile value(s); NaN when there are no values.
+        """
+        column = self._column(counter)
+        mask = self._region_mask(region)
+        if mask is not None:
+            column = column[mask]
+        column = column[~np.isnan(column)]
+        if not len(column):
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        result = np.percentile(column, q)
+        return result.tolist() if np.ndim(result) else float(result)
+
+    def threshold(self, counter: str, minimum: Optional[float] = None, maximum: Optional[float] = None,
+                  region: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return the interfaces whose counter lies within [minimum, maximum], e.g. every port with CRC >= 100.
+
+        :param counter: The counter.
+        :param minimum: Lowest accepted value.
+        :param maximum: Highest accepted value.
+        :param region: Limit to one region.
+        :return: Records in fleet order.
+        """
+        column = self._column(counter)
+        mask = ~np.isnan(column)
+        if minimum is not None:
+            mask &= column >= minimum
+        if maximum is not None:
+            mask &= column <= maximum
+        region_mask = self._region_mask(region)
+        if region_mask is not None:
+            mask &= region_mask
+        return self.records(np.flatnonzero(mask), [counter])
+
+    def group_by(self, counter: str, by: str = "region", how: str = "sum") -> Dict[str, float]:
+        """
+        Aggregate a counter per region or per switch. Missing values are ignored.
+
+        Switches are keyed by hostname ('switch') or by IP address ('switch_ip'). Two switches sharing a key would
+        silently merge into one group, so that raises instead; group by 'switch_ip' when hostnames repeat.
+
+        :param counter: The counter.
+        :param by: 'region', 'switch' or 'switch_ip'.
+        :param how: 'sum', 'mean', 'max', 'min' or 'count'.
+        :return: Group name to aggregate; groups without values get NaN (0 for sum and count).
+        :raises ValueError: If by or how is not supported, or if two switches share the group key.
+        """
+        if by == "region":
+            codes, names = self.region_codes, self.regions
+        elif by in ("switch", "switch_ip"):
+            codes, names = self.switch_codes, self.switches if by == "switch" else self.switch_ips
+            duplicates = sorted(str(name) for name, count in Counter(names).items() if count > 1)
+            if duplicates:
+                raise ValueError(f"Cannot group by '{by}': {', '.join(duplicates)} occur on more than one switch.")
+        else:
+            raise ValueError("Group by 'region', 'switch' or 'switch_ip'.")
+        column = self._column(counter)
+        valid = ~np.isnan(column)
+        codes, column = codes[valid], column[valid]
+        size = len(names)
+        if how in ("sum", "mean", "count"):
+            counts = np.bincount(codes, minlength=size)
+            if how == "count":
+                result = counts.astype(np.float64)
+            else:
+                totals = np.bincount(codes, weights=column, minlength=size)
+                if how == "sum":
+                    result = totals
+                else:
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        result = totals / counts
+        elif how in ("max", "min"):
+            result = np.full(size, -np.inf if how == "max" else np.inf)
+            (np.maximum if how == "max" else np.minimum).at(result, codes, column)
+            result[np.isinf(result)] = np.nan
+        else:
+            raise ValueError("Aggregate with 'sum', 'mean', 'max', 'min' or 'count'.")
+        return dict(zip(names, result.tolist()))
+
+
+# # Example usage
+# analytics = FleetCounterAnalytics.from_devices(Data['network_cisco_switches'])
+#
+# # Twenty ports with the most CRC errors, fleet-wide and in one region
+# worst_crc = analytics.top_n("CRC", 20)
+# worst_fmt_crc = analytics.top_n("CRC", 20, region="FMT")
+#
+# # 99th percentile input rate and every port above it
+# busy = analytics.threshold("INPUT_RATE", minimum=analytics.percentile("INPUT_RATE", 99))
+#
+# # Input errors per region
+# errors_per_region = analytics.group_by("INPUT_ERRORS", by="region", how="sum")
@@ -12,3 +12,20 @@ class Database:
     def create_all(app):
         with app.app_context():
             Database.db.create_all()
+        Database.migrate(app)
+
+    @staticmethod
+    def migrate(app):
+        """
+        Bring an existing database up to the current schema. create_all() only adds missing tables, so changes to
+        existing tables are applied here. Every migration checks first and does nothing once applied, so this is
+        run on every start.
+
+        :param app: The Flask application whose database is upgraded.
+        :return: The number of duplicate interface rows removed.
+        :raises ValueError: If the database cannot be upgraded.
+        """
+        # Imported here: app.models imports this module
+        from .models import migrate_interface_natural_key
+        with app.app_context():
+            return migrate_interface_natural_key(Database.db)
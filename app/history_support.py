@@ -0,0 +1,303 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.exc import SQLAlchemyError
+from app.cli_database_driver import CLIDatabaseDriver
+from app.models import db, Sweep, SweepDevice, InterfaceHistory, MacAddressHistory, ArpHistory
+
+
+class HistorySupport:
+    """
+    Sweep-versioned history of interfaces, MAC address tables and ARP tables.
+
+    Every collection run is a Sweep with a start time. The parsed tables of each device are stored as full
+    snapshots keyed by sweep, and a SweepDevice row records which tables each device reported in which sweep.
+    The state of a port at any past time is therefore the snapshot of the latest sweep before it in which the
+    device reported its interfaces; a port missing from that snapshot did not exist then. compact() thins out
+    old snapshots per device and table (every sweep, then one per hour, then one per day) so storage and query
+    time stay bounded.
+    """
+
+    # Parsed command output -> (history model, CLIDatabaseDriver method that maps it to table rows)
+    HISTORY_TABLES: Dict[str, Tuple[Any, str]] = {
+        'show ip interface brief': (InterfaceHistory, 'ip_interface_brief_rows'),
+        'show interfaces': (InterfaceHistory, 'interfaces_rows'),
+        'show mac address-table': (MacAddressHistory, 'mac_address_table_rows'),
+        'show arp': (ArpHistory, 'arp_rows'),
+    }
+
+    HISTORY_MODELS = (InterfaceHistory, MacAddressHistory, ArpHistory)
+
+    def __init__(self, raw_retention: timedelta = timedelta(days=2), hourly_retention: timedelta = timedelta(days=30),
+                 daily_retention: Optional[timedelta] = timedelta(days=365)) -> None:
+        """
+        Initialize the history with its retention policy.
+
+        :param raw_retention: Age up to which every sweep is kept.
+        :param hourly_retention: Age up to which one sweep per hour is kept; older sweeps keep one per day.
+        :param daily_retention: Age after which sweeps are deleted; None keeps daily sweeps forever.
+        """
+        self.raw_retention = raw_retention
+        self.hourly_retention = hourly_retention
+        self.daily_retention = daily_retention
+
+    def begin_sweep(self, started_at: Optional[datetime] = None) -> int:
+        """
+        Start a sweep.
+
+        :param started_at: Start time of the sweep. Defaults to now.
+        :return: The sweep ID.
+        :raises ValueError: If the sweep cannot be stored.
+        """
+        try:
+            sweep = Sweep(started_at=started_at or datetime.now(), resolution='raw')
+            db.session.add(sweep)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise ValueError(f"Failed to start sweep: {e}")
+        return sweep.sweep_id
+
+    def finish_sweep(self, sweep_id: int, finished_at: Optional[datetime] = None) -> None:
+        """
+        Mark a sweep as complete.
+
+        :param sweep_id: The sweep ID.
+        :param finished_at: End time of the sweep. Defaults to now.
+        :raises ValueError: If the sweep cannot be updated.
+        """
+        try:
+            db.session.query(Sweep).filter(Sweep.sweep_id == sweep_id).update(
+                {Sweep.finished_at: finished_at or datetime.now()}, synchronize_session=False)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise ValueError(f"Failed to finish sweep {sweep_id}: {e}")
+
+    def record_device(self, sweep_id: int, device_id: int, outputs: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Store the parsed tables of one device in a sweep, in a single transaction.
+
+        Rows of 'show ip interface brief' and 'show interfaces' are merged per interface name. Each history table
+        of a device can be recorded once per sweep.
+
+        :param sweep_id: The sweep ID.
+        :param device_id: The ID of the device in the database.
+        :param outputs: Command (a key of HISTORY_TABLES, e.g. 'show arp') to its parsed output.
+        :return: The number of rows stored per history table.
+        :raises ValueError: If a command is not supported, a table was already recorded for the device in this
+            sweep or the data cannot be stored; nothing is stored then.
+        """
+        driver = CLIDatabaseDriver(device_id)
+        tables: Dict[Any, List[Dict[str, Any]]] = {}
+        for command, parsed in outputs.items():
+            try:
+                model, row_method = self.HISTORY_TABLES[command]
+            except KeyError:
+                raise ValueError(f"Unsupported history command '{command}'.")
+            rows = getattr(driver, row_method)(parsed)
+            tables.setdefault(model, []).extend(dict(row, sweep_id=sweep_id) for row in rows)
+        if InterfaceHistory in tables:
+            merged: Dict[str, Dict[str, Any]] = {}
+            for row in tables[InterfaceHistory]:
+                merged.setdefault(row['name'], {}).update(row)
+            tables[InterfaceHistory] = list(merged.values())
+        members = [{'sweep_id': sweep_id, 'device_id': device_id, 'table_name': model.__tablename__}
+                   for model in tables]
+        driver.write_tables(list(tables.items()) + [(SweepDevice, members)], ', '.join(outputs))
+        return {model.__tablename__: len(rows) for model, rows in tables.items()}
+
+    def _sweep_at(self, model: Any, device_id: int, when: datetime) -> Optional[int]:
+        """
+        Return the latest sweep at or before a time in which the device reported a history table.
+        """
+        found = (db.session.query(SweepDevice.sweep_id)
+                 .join(Sweep, Sweep.sweep_id == SweepDevice.sweep_id)
+                 .filter(SweepDevice.device_id == device_id, SweepDevice.table_name == model.__tablename__,
+                         Sweep.started_at <= when)
+                 .order_by(Sweep.started_at.desc(), Sweep.sweep_id.desc())
+                 .first())
+        return found[0] if found else None
+
+    def interface_at(self, device_id: int, name: str, when: datetime) -> Optional[InterfaceHistory]:
+        """
+        Return how an interface looked at a point in time, e.g. last Tuesday at 09:00.
+
+        :param device_id: The ID of the device in the database.
+        :param name: The interface name.
+        :param when: The point in time.
+        :return: The interface row of the device's latest sweep at or before that time, or None if the device
+            had no such interface then or its interfaces were never recorded.
+        """
+        sweep_id = self._sweep_at(InterfaceHistory, device_id, when)
+        if sweep_id is None:
+            return None
+        return InterfaceHistory.query.filter_by(sweep_id=sweep_id, device_id=device_id, name=name).first()
+
+    def interfaces_at(self, device_id: int, when: datetime) -> List[InterfaceHistory]:
+        """
+        Return every interface of a device as recorded by the latest sweep at or before a time.
+        """
+        return self._device_rows_at(InterfaceHistory, device_id, when)
+
+    def mac_addresses_at(self, device_id: int, when: datetime) -> List[MacAddressHistory]:
+        """
+        Return the MAC address table of a device as recorded by the latest sweep at or before a time.
+        """
+        return self._device_rows_at(MacAddressHistory, device_id, when)
+
+    def arp_entries_at(self, device_id: int, when: datetime) -> List[ArpHistory]:
+        """
+        Return the ARP table of a device as recorded by the latest sweep at or before a time.
+        """
+        return self._device_rows_at(ArpHistory, device_id, when)
+
+    def _device_rows_at(self, model: Any, device_id: int, when: datetime) -> List[Any]:
+        sweep_id = self._sweep_at(model, device_id, when)
+        if sweep_id is None:
+            return []
+        return model.query.filter_by(sweep_id=sweep_id, device_id=device_id).all()
+
+    def _bucket(self, started_at: datetime, now: datetime) -> Optional[Tuple[str, datetime]]:
+        """
+        Return the retention bucket of a sweep: (resolution, period start), or None if it is past retention.
+        """
+        age = now - started_at
+        if self.daily_retention is not None and age >= self.daily_retention:
+            return None
+        if age >= self.hourly_retention:
+            return 'daily', started_at.replace(hour=0, minute=0, second=0, microsecond=0)
+        return 'hourly', started_at.replace(minute=0, second=0, microsecond=0)
+
+    def compact(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Downsample old snapshots according to the retention policy, in a single transaction.
+
+        Snapshots younger than raw_retention are untouched. Older ones are grouped per device, history table and
+        hour (or day once older than hourly_retention), and only the latest snapshot of each group is kept, with
+        all its rows, so every kept snapshot is still complete. Each snapshot holds a whole table of one device,
+        so snapshots of sweeps that never finished compete like the others: past raw_retention such a sweep is
+        abandoned, not running. Snapshots older than daily_retention are deleted, and so are sweeps left
+        without any.
+
+        :param now: Reference time. Defaults to now.
+        :return: The number of snapshots 'kept' and 'deleted', history 'rows_deleted' and 'sweeps_deleted'.
+        :raises ValueError: If the database cannot be updated; nothing is changed then.
+        """
+        now = now or datetime.now()
+        cutoff = now - self.raw_retention
+        keep: Dict[Tuple[int, str, str, datetime], int] = {}
+        deleted: Dict[Tuple[str, int], List[int]] = {}
+        members = (db.session.query(SweepDevice.sweep_id, SweepDevice.device_id, SweepDevice.table_name,
+                                    Sweep.started_at)
+                   .join(Sweep, Sweep.sweep_id == SweepDevice.sweep_id)
+                   .filter(Sweep.started_at < cutoff)
+                   .order_by(Sweep.started_at, Sweep.sweep_id))
+        for sweep_id, device_id, table_name, started_at in members:
+            bucket = self._bucket(started_at, now)
+            if bucket is None:
+                deleted.setdefault((table_name, sweep_id), []).append(device_id)
+                continue
+            group = (device_id, table_name) + bucket
+            previous = keep.get(group)
+            if previous is not None:
+                deleted.setdefault((table_name, previous), []).append(device_id)
+            keep[group] = sweep_id
+        models = {model.__tablename__: model for model in self.HISTORY_MODELS}
+        rows_deleted = 0
+        try:
+            for resolution in ('hourly', 'daily'):
+                kept = sorted({sweep_id for (_, _, bucket_resolution, _), sweep_id in keep.items()
+                               if bucket_resolution == resolution})
+                for start in range(0, len(kept), 500):
+                    (db.session.query(Sweep)
+                     .filter(Sweep.sweep_id.in_(kept[start:start + 500]), Sweep.resolution != resolution)
+                     .update({Sweep.resolution: resolution}, synchronize_session=False))
+            # Sweeps usually cover the same devices, so delete the snapshots of many sweeps per statement
+            sweeps_by_devices: Dict[Tuple[str, Tuple[int, ...]], List[int]] = {}
+            for (table_name, sweep_id), device_ids in deleted.items():
+                sweeps_by_devices.setdefault((table_name, tuple(sorted(device_ids))), []).append(sweep_id)
+            for (table_name, device_ids), sweep_ids in sweeps_by_devices.items():
+                model = models.get(table_name)
+                for device_start in range(0, len(device_ids), 500):
+                    devices = device_ids[device_start:device_start + 500]
+                    for sweep_start in range(0, len(sweep_ids), 500):
+                        sweeps = sweep_ids[sweep_start:sweep_start + 500]
+                        if model is not None:
+                            rows_deleted += (db.session.query(model)
+                                             .filter(model.sweep_id.in_(sweeps), model.device_id.in_(devices))
+                                             .delete(synchronize_session=False))
+                        (db.session.query(SweepDevice)
+                         .filter(SweepDevice.table_name == table_name, SweepDevice.sweep_id.in_(sweeps),
+                                 SweepDevice.device_id.in_(devices))
+                         .delete(synchronize_session=False))
+            empty = (db.session.query(Sweep.sweep_id)
+                     .filter(Sweep.started_at < cutoff,
+                             ~db.session.query(SweepDevice.sweep_id)
+                             .filter(SweepDevice.sweep_id == Sweep.sweep_id).exists()))
+            empty_ids = [sweep_id for sweep_id, in empty]
+            for start in range(0, len(empty_ids), 500):
+                chunk = empty_ids[start:start + 500]
+                for model in self.HISTORY_MODELS:
+                    rows_deleted += (db.session.query(model).filter(model.sweep_id.in_(chunk))
+                                     .delete(synchronize_session=False))
+                db.session.query(Sweep).filter(Sweep.sweep_id.in_(chunk)).delete(synchronize_session=False)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise ValueError(f"Failed to compact sweep history: {e}")
+        return {'kept': len(keep), 'deleted': sum(map(len, deleted.values())), 'rows_deleted': rows_deleted,
+                'sweeps_deleted': len(empty_ids)}
+
+
+class HistoryCompactor(threading.Thread):
+    """
+    Daemon thread that runs HistorySupport.compact at a fixed interval inside a Flask application context.
+    """
+
+    def __init__(self, app: Any, history: Optional[HistorySupport] = None, interval: float = 3600.0) -> None:
+        """
+        Initialize the compactor; call start() to run it.
+
+        :param app: The Flask application whose database holds the history.
+        :param history: The history and its retention policy. Defaults to HistorySupport().
+        :param interval: Seconds between compactions.
+        """
+        super().__init__(name='history-compactor', daemon=True)
+        self.app = app
+        self.history = history or HistorySupport()
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            with self.app.app_context():
+                try:
+                    self.history.compact()
+                except ValueError as e:
+                    print(f"History compaction failed: {e}")
+                finally:
+                    db.session.remove()
+            self._stopped.wait(self.interval)
+
+    def stop(self) -> None:
+        """
+        Stop after the current compaction.
+        """
+        self._stopped.set()
+
+
+# # Example usage
+# history = HistorySupport()
+# sweep_id = history.begin_sweep()
+# history.record_device(sweep_id, device_id, {
+#     'show ip interface brief': ShowIpInterfaceBriefParser.parse(output),
+#     'show mac address-table': ShowMacAddressTableParser.parse(mac_output),
+# })
+# history.finish_sweep(sweep_id)
+#
+# # How did Gi1/0/1 look last Tuesday at 09:00?
+# port = history.interface_at(device_id, 'GigabitEthernet1/0/1', datetime(2024, 5, 7, 9, 0))
+#
+# # Thin out old sweeps every hour
+# HistoryCompactor(app, history).start()
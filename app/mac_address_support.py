@@ -1,23 +1,344 @@
+import json
 import os
 import re
+import tempfile
+import threading
+from functools import lru_cache
 import requests
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Iterable, Sequence, Tuple, Union
+from app.oui_index_support import OUIIndex, VendorPrefixIndex
+
+# Sidecar file next to the manuf file holding the ETag and Last-Modified of the last download
+MAC_DATABASE_METADATA_SUFFIX = '.meta'
+
+_MAC_SEPARATORS = str.maketrans('', '', '.:-')
+# Format types that render a MacAddress as its integer value, e.g. f'{mac:012x}'; all others format the text
+_INTEGER_FORMAT_TYPES = frozenset('bcdoxXn')
+_MAC_FORMATS = {
+    'cisco': ('.', 4),
+    'colon': (':', 2),
+    'dash': ('-', 2),
+    'bare': ('', 12),
+}
+
+
+class MacAddress(int):
+    """
+    A MAC address parsed once from any common notation and kept as its 48-bit integer value.
+
+    It stands in for the canonical Cisco text (0011.2233.4455) it replaces: str(), repr() and format() give that
+    text, it compares equal to it, hashes like it, sorts against other strings (such as '') by it, and string
+    methods such as lower() or split() work on it. Compared with each other, MAC addresses compare as integers,
+    which orders them the same way. Arithmetic and isinstance(..., int) see the integer; numeric consumers such as
+    the statistics reports skip MacAddress values, as they skipped the strings before.
+    """
+    __slots__ = ()
+
+    MAX_VALUE = 0xFFFFFFFFFFFF
+
+    def __new__(cls, mac_address: Union[str, int]) -> 'MacAddress':
+        """
+        Create a MacAddress from a MAC address string or a 48-bit integer.
+
+        :param mac_address: The MAC address in any Cisco, colon, dash or bare hex notation, or its integer value.
+        :return: The MAC address.
+        :raises ValueError: If the MAC address format is invalid.
+        """
+        if type(mac_address) is cls:
+            return mac_address
+        if isinstance(mac_address, str):
+            value = cls._parse(mac_address)
+        elif isinstance(mac_address, int) and not isinstance(mac_address, bool):
+            if not 0 <= mac_address <= cls.MAX_VALUE:
+                raise ValueError(f"Invalid MAC address value: {mac_address}")
+            value = mac_address
+        else:
+            raise TypeError(f"MAC address must be a string or an integer, not {type(mac_address).__name__}")
+        return super().__new__(cls, value)
+
+    @staticmethod
+    def _parse(mac_address: str) -> int:
+        """
+        Parse a MAC address string to its integer value.
+
+        :param mac_address: The MAC address string.
+        :return: The 48-bit integer value.
+        :raises ValueError: If the MAC address format is invalid.
+        """
+        compact = mac_address.translate(_MAC_SEPARATORS)
+        if len(compact) == 12 and compact.isascii() and compact.isalnum():
+            try:
+                return int(compact, 16)
+            except ValueError:
+                pass
+        # Slow path for unusual notations: keep only the hex digits, as normalize_mac_address always did
+        compact = re.sub(r'[^a-fA-F0-9]', '', mac_address)
+        if len(compact) != 12:
+            raise ValueError(f"Invalid MAC address format: {mac_address}")
+        return int(compact, 16)
+
+    @classmethod
+    def coerce(cls, value: Any) -> Any:
+        """
+        Convert a value to a MacAddress when it is a valid MAC address, otherwise return it unchanged.
+
+        :param value: A MAC address string, integer, or any other value (e.g. None or '').
+        :return: The MacAddress, or the original value.
+        """
+        try:
+            return cls(value)
+        except (TypeError, ValueError):
+            return value
+
+    @property
+    def value(self) -> int:
+        """
+        The 48-bit integer value, as a plain int.
+        """
+        return int(self)
+
+    @property
+    def oui(self) -> int:
+        """
+        The 24-bit Organizationally Unique Identifier.
+        """
+        return int(self) >> 24
+
+    def prefix(self, prefix_length: int) -> int:
+        """
+        Return the leading bits of the address.
+
+        :param prefix_length: Number of leading bits to keep (0-48).
+        :return: The prefix as an integer.
+        """
+        return int(self) >> (48 - prefix_length)
+
+    @property
+    def is_multicast(self) -> bool:
+        """
+        True for group (multicast/broadcast) addresses.
+        """
+        return bool((int(self) >> 40) & 0x01)
+
+    @property
+    def is_locally_administered(self) -> bool:
+        """
+        True for locally administered (e.g. randomised) addresses.
+        """
+        return bool((int(self) >> 40) & 0x02)
+
+    def format_mac(self, style: str = 'cisco') -> str:
+        """
+        Format the address as text.
+
+        :param style: 'cisco' (0011.2233.4455), 'colon' (00:11:22:33:44:55), 'dash' (00-11-22-33-44-55)
+                      or 'bare' (001122334455).
+        :return: The formatted MAC address.
+        :raises ValueError: If the style is unknown.
+        """
+        try:
+            separator, group_size = _MAC_FORMATS[style]
+        except KeyError:
+            raise ValueError(f"Unsupported MAC address style: {style}")
+        digits = format(int(self), '012x')
+        if not separator:
+            return digits
+        return separator.join(digits[i:i + group_size] for i in range(0, 12, group_size))
+
+    # Text behaviour of the canonical string the value replaces
+
+    def __str__(self) -> str:
+        digits = format(int(self), '012x')
+        return f"{digits[:4]}.{digits[4:8]}.{digits[8:]}"
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __format__(self, format_spec: str) -> str:
+        if format_spec and format_spec[-1] in _INTEGER_FORMAT_TYPES:
+            return int.__format__(self, format_spec)
+        return format(str(self), format_spec)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MacAddress):
+            return int.__eq__(self, other)
+        if isinstance(other, str):
+            return str(self) == other
+        return False
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def _ordered(self, other: Any, operator: str) -> Tuple[Any, Any]:
+        if isinstance(other, MacAddress):
+            return int(self), int(other)
+        if isinstance(other, str):
+            return str(self), other
+        raise TypeError(f"'{operator}' not supported between instances of 'MacAddress' and '{type(other).__name__}'")
+
+    def __lt__(self, other: Any) -> bool:
+        mine, theirs = self._ordered(other, '<')
+        return mine < theirs
+
+    def __le__(self, other: Any) -> bool:
+        mine, theirs = self._ordered(other, '<=')
+        return mine <= theirs
+
+    def __gt__(self, other: Any) -> bool:
+        mine, theirs = self._ordered(other, '>')
+        return mine > theirs
+
+    def __ge__(self, other: Any) -> bool:
+        mine, theirs = self._ordered(other, '>=')
+        return mine >= theirs
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return 14
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __getitem__(self, index: Union[int, slice]) -> str:
+        return str(self)[index]
+
+    def __contains__(self, text: str) -> bool:
+        return text in str(self)
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, str):
+            return str(self) + other
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> Any:
+        if isinstance(other, str):
+            return other + str(self)
+        return NotImplemented
+
+    def __getattr__(self, name: str) -> Any:
+        # String methods (lower, split, startswith, ...) work on the canonical text
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
 
 class MacAddressSupport:
-    def __init__(self, mac_database_file: str = 'manuf', url: str = 'https://www.wireshark.org/download/automated/data/manuf') -> None:
+    # Number of distinct MAC addresses whose vendor is kept by get_vendor/get_vendors
+    VENDOR_CACHE_SIZE = 65536
+
+    def __init__(self, mac_database_file: str = 'manuf', url: str = 'https://www.wireshark.org/download/automated/data/manuf',
+                 verify: Union[bool, str] = True) -> None:
         """
         Initialize the MacAddressSupport class and load the MAC address to Vendor mapping.
 
         :param mac_database_file: The local file to store the MAC address to Vendor mapping.
         :param url: The URL to download the MAC address to Vendor mapping file.
+        :param verify: Whether to verify SSL certificates when downloading, or the path of a CA bundle.
         :raises ValueError: If the data cannot be loaded or parsed.
         """
         self.mac_database_file = mac_database_file
         self.url = url
-        self.mac_to_vendor = self.load_mac_to_vendor()
-        self.short_name_to_full_name = self.build_short_name_to_full_name_mapping()
+        self.verify = verify
+        self._mac_to_vendor: Optional[Dict[str, str]] = None
+        self._short_name_to_full_name: Optional[Dict[str, str]] = None
+        self._vendor_index: Optional[VendorPrefixIndex] = None
+        self._vendor_lookup_table: Optional[Tuple[OUIIndex, List[str]]] = None
+        self._refresh_lock = threading.Lock()
+        # Held while reload_mac_database swaps the database and while readers take several parts of it at once
+        self._generation_lock = threading.Lock()
+        self._cached_vendor = lru_cache(maxsize=self.VENDOR_CACHE_SIZE)(self._lookup_vendor)
+        self.oui_index: OUIIndex = self.load_oui_index()
+
+    @property
+    def vendor_index(self) -> VendorPrefixIndex:
+        """
+        Vendor to prefix reverse index of the OUI index, built on first use.
+        """
+        if self._vendor_index is None:
+            self._vendor_index = VendorPrefixIndex(self.oui_index)
+        return self._vendor_index
+
+    @property
+    def _vendor_lookup(self) -> Tuple[OUIIndex, List[str]]:
+        """
+        The OUI index and vendor names of one database version, swapped as a pair by reload_mac_database.
+        """
+        lookup = self._vendor_lookup_table
+        if lookup is None:
+            with self._generation_lock:
+                lookup = self._vendor_lookup_table
+                if lookup is None:
+                    lookup = self._vendor_lookup_table = (self.oui_index, self.oui_index.vendor_names())
+        return lookup
+
+    @property
+    def mac_to_vendor(self) -> Dict[str, str]:
+        """
+        MAC prefix key to short vendor name, materialized from the OUI index on first use.
+        """
+        if self._mac_to_vendor is None:
+            self._mac_to_vendor = self.oui_index.mac_to_vendor()
+        return self._mac_to_vendor
+
+    @property
+    def short_name_to_full_name(self) -> Dict[str, str]:
+        """
+        Short vendor name to full vendor name, materialized from the OUI index on first use.
+        """
+        if self._short_name_to_full_name is None:
+            self._short_name_to_full_name = self.oui_index.short_name_to_full_name()
+        return self._short_name_to_full_name
 
-    def perform_request(self, method: str, url: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, verify: bool = True) -> requests.Response:
+    _shared_instances: Dict[tuple, 'MacAddressSupport'] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, mac_database_file: str = 'manuf', url: str = 'https://www.wireshark.org/download/automated/data/manuf') -> 'MacAddressSupport':
+        """
+        Return the process-wide instance for a vendor database file, loading it on first use.
+
+        Views, Flask routes and scripts should use this instead of MacAddressSupport() so the manuf file is parsed
+        once per process. Concurrent first calls from several threads load the file only once. Worker processes
+        forked after loading inherit the loaded instance.
+
+        :param mac_database_file: The local file to store the MAC address to Vendor mapping.
+        :param url: The URL to download the MAC address to Vendor mapping file.
+        :return: The shared instance.
+        :raises ValueError: If the data cannot be loaded or parsed.
+        """
+        key = (os.path.abspath(mac_database_file), url)
+        instance = cls._shared_instances.get(key)
+        if instance is None:
+            with cls._shared_lock:
+                instance = cls._shared_instances.get(key)
+                if instance is None:
+                    instance = cls._shared_instances[key] = cls(mac_database_file, url)
+        return instance
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """
+        Forget the shared instances, so the next shared() call reloads the vendor database.
+        """
+        with cls._shared_lock:
+            cls._shared_instances.clear()
+
+    @classmethod
+    def _reinitialize_shared_lock(cls) -> None:
+        """
+        Give a forked child a fresh lock; the parent's lock may have been held by another thread at fork time.
+        """
+        cls._shared_lock = threading.Lock()
+        for instance in cls._shared_instances.values():
+            instance._refresh_lock = threading.Lock()
+            instance._generation_lock = threading.Lock()
+
+    def perform_request(self, method: str, url: str, data: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, verify: Union[bool, str] = True, stream: bool = False) -> requests.Response:
         """
         Perform an HTTP request using the specified method.
 
@@ -25,13 +346,14 @@ class MacAddressSupport:
         :param url: The URL to send the request to.
         :param data: The data to send in the request (for POST requests).
         :param headers: Optional headers to include in the request.
-        :param verify: Whether to verify SSL certificates.
+        :param verify: Whether to verify SSL certificates, or the path of a CA bundle.
+        :param stream: Whether to read the response body lazily (GET only).
         :return: The HTTP response object.
         :raises ValueError: If the request fails.
         """
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, verify=verify)
+                response = requests.get(url, headers=headers, verify=verify, stream=stream)
             elif method.upper() == 'POST':
                 response = requests.post(url, data=data, headers=headers, verify=verify)
             else:
@@ -42,102 +364,215 @@ class MacAddressSupport:
         except requests.RequestException as e:
             raise ValueError(f"Failed to perform {method} request to {url}: {e}")
 
-    def load_mac_to_vendor(self) -> Dict[str, str]:
+    def ensure_mac_database(self) -> None:
         """
-        Load the MAC address to Vendor mapping from the specified URL or local file.
+        Download the MAC address to Vendor mapping if the local file is missing or empty.
 
-        :return: A dictionary with MAC address blocks as keys and vendor names as values.
-        :raises ValueError: If the data cannot be loaded or parsed.
+        :raises ValueError: If the data cannot be downloaded.
         """
-        if not os.path.exists(self.mac_database_file):
+        if not os.path.exists(self.mac_database_file) or os.path.getsize(self.mac_database_file) == 0:
             print(f"File {self.mac_database_file} not found. Downloading from URL...")
             self.download_mac_database()
-        else:
-            pass
-            #print(f"File {self.mac_database_file} found. Using local file.")
 
+    def load_oui_index(self) -> OUIIndex:
+        """
+        Open the compiled OUI index of the local manuf file, compiling it when the file is new or has changed.
+
+        :return: The memory-mapped index.
+        :raises ValueError: If the data cannot be loaded or parsed.
+        """
+        self.ensure_mac_database()
         try:
-            with open(self.mac_database_file, 'r', encoding='utf-8') as file:
-                data = file.read()
-                #print(f"Loaded {len(data)} characters from {self.mac_database_file}")
-                if not data.strip():
-                    #print("Local file is empty, downloading data from URL...")
-                    self.download_mac_database()
-                    with open(self.mac_database_file, 'r', encoding='utf-8') as file:
-                        data = file.read()
-                        #print(f"Loaded {len(data)} characters from {self.mac_database_file} after re-downloading")
-                return self.parse_manuf_file(data)
-        except Exception as e:
+            return OUIIndex.load(self.mac_database_file)
+        except (OSError, ValueError) as e:
             raise ValueError(f"Failed to load data from {self.mac_database_file}: {e}")
 
-    def download_mac_database(self) -> None:
+    def download_mac_database(self) -> bool:
         """
         Download the MAC address to Vendor mapping from the specified URL and save it to a local file.
 
+        The request is conditional: the ETag and Last-Modified of the previous download, kept in a sidecar file
+        (manuf.meta), are sent back, and a 304 Not Modified answer leaves the local file alone. A new file is
+        written to a temporary file in the same directory and renamed over the old one, so readers never see a
+        partial download.
+
+        :return: True if a new file was saved, False if the local file is already current.
         :raises ValueError: If the data cannot be downloaded.
         """
+        metadata_file = self.mac_database_file + MAC_DATABASE_METADATA_SUFFIX
+        headers = {}
+        if os.path.exists(self.mac_database_file) and os.path.getsize(self.mac_database_file) > 0:
+            metadata = self._read_download_metadata(metadata_file)
+            if metadata.get('url') == self.url:
+                if metadata.get('etag'):
+                    headers['If-None-Match'] = metadata['etag']
+                if metadata.get('last_modified'):
+                    headers['If-Modified-Since'] = metadata['last_modified']
+        print(f"Downloading data from {self.url}...")
+        response = self.perform_request('GET', self.url, headers=headers, verify=self.verify, stream=True)
         try:
-            response = self.perform_request('GET', self.url, verify=False)  # Bypass SSL verification
-            print(f"Downloading data from {self.url}...")
-            with open(self.mac_database_file, 'w', encoding='utf-8') as file:
-                file.write(response.text)
-            print(f"MAC database downloaded and saved to {self.mac_database_file}")
-        except ValueError as e:
+            if response.status_code == 304:
+                print(f"MAC database {self.mac_database_file} is up to date")
+                return False
+            directory = os.path.dirname(os.path.abspath(self.mac_database_file))
+            file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.download')
+            try:
+                size = 0
+                with os.fdopen(file_descriptor, 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        file.write(chunk)
+                        size += len(chunk)
+                if size == 0:
+                    raise ValueError("the server returned an empty file")
+                os.replace(temp_path, self.mac_database_file)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        except (OSError, ValueError, requests.RequestException) as e:
             raise ValueError(f"Failed to download data from {self.url}: {e}")
+        finally:
+            response.close()
+        self._write_download_metadata(metadata_file, {
+            'url': self.url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        })
+        print(f"MAC database downloaded and saved to {self.mac_database_file}")
+        return True
 
-    def parse_manuf_file(self, data: str) -> Dict[str, str]:
+    @staticmethod
+    def _read_download_metadata(metadata_file: str) -> Dict[str, Any]:
+        try:
+            with open(metadata_file, 'r', encoding='utf-8') as file:
+                metadata = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return metadata if isinstance(metadata, dict) else {}
+
+    @staticmethod
+    def _write_download_metadata(metadata_file: str, metadata: Dict[str, Any]) -> None:
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(metadata_file)),
+                                                          suffix=MAC_DATABASE_METADATA_SUFFIX)
+        except OSError:
+            return
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                json.dump(metadata, file)
+            os.replace(temp_path, metadata_file)
+        except OSError:
+            # Without metadata the next refresh simply downloads the whole file again
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def reload_mac_database(self) -> None:
         """
-        Parse the MAC address to Vendor mapping file.
+        Load the local manuf file again and switch lookups over to it.
+
+        The new index and vendor index are built first and then swapped in together under the generation lock, so
+        lookups keep running against the previous version meanwhile and readers that need several parts never
+        mix versions. The vendor cache starts empty.
 
-        :param data: The raw text data of the file.
-        :return: A dictionary with MAC address blocks as keys and vendor names as values.
-        :raises ValueError: If the data cannot be parsed.
+        :raises ValueError: If the data cannot be loaded or parsed.
         """
-        mac_to_vendor = {}
-        self.short_name_to_full_name = {}
-        try:
-            for line in data.splitlines():
-                if line.startswith('#') or not line.strip():
-                    continue
-                parts = re.split(r'\s+', line)
-                if len(parts) >= 3:
-                    mac_prefix = parts[0].replace(':', '').lower()
-                    short_name = parts[1]
-                    full_name = ' '.join(parts[2:])
-                    mac_to_vendor[mac_prefix] = short_name
-                    self.short_name_to_full_name[short_name] = full_name
-                else:
-                    pass
-                    #print(f"Skipping invalid line: {line}")
-            #print(f"Parsed {len(mac_to_vendor)} entries from the MAC database")
-            return mac_to_vendor
-        except Exception as e:
-            raise ValueError(f"Failed to parse manuf file: {e}")
+        oui_index = self.load_oui_index()
+        vendor_index = VendorPrefixIndex(oui_index) if self._vendor_index is not None else None
+        vendor_lookup = (oui_index, oui_index.vendor_names())
+        with self._generation_lock:
+            self._vendor_lookup_table = vendor_lookup
+            self._vendor_index = vendor_index
+            self.oui_index = oui_index
+            self._mac_to_vendor = None
+            self._short_name_to_full_name = None
+            self._cached_vendor = lru_cache(maxsize=self.VENDOR_CACHE_SIZE)(self._lookup_vendor)
+
+    def refresh_mac_database(self) -> bool:
+        """
+        Fetch the manuf file if it changed on the server and, if so, hot-reload the vendor database.
 
-    def build_short_name_to_full_name_mapping(self) -> Dict[str, str]:
+        Only one refresh runs at a time per instance; a call made while another is running returns False.
+
+        :return: True if a new database was loaded.
+        :raises ValueError: If the data cannot be downloaded, loaded or parsed.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+        try:
+            if not self.download_mac_database():
+                return False
+            self.reload_mac_database()
+            return True
+        finally:
+            self._refresh_lock.release()
+
+    def refresh_mac_database_in_background(self) -> threading.Thread:
         """
-        Build a mapping of short vendor names to full vendor names.
+        Run refresh_mac_database in a daemon thread, e.g. from a scheduler; lookups continue while it runs.
 
-        :return: A dictionary with short vendor names as keys and full vendor names as values.
+        :return: The started thread.
         """
-        return self.short_name_to_full_name
+        def refresh() -> None:
+            try:
+                self.refresh_mac_database()
+            except ValueError as e:
+                print(f"MAC database refresh failed: {e}")
+
+        thread = threading.Thread(target=refresh, name='mac-database-refresh', daemon=True)
+        thread.start()
+        return thread
 
-    def get_vendor(self, mac_address: str) -> Optional[str]:
+    def get_vendor(self, mac_address: Union[str, int]) -> Optional[str]:
         """
         Get the vendor for a given MAC address.
 
-        :param mac_address: The MAC address to lookup.
+        The most specific assignment wins, so addresses in MA-M (/28) and MA-S (/36) blocks return the block
+        owner rather than the vendor of the surrounding /24. Results are kept in an LRU cache.
+
+        :param mac_address: The MAC address to lookup, as a string or MacAddress.
         :return: The vendor name if found, otherwise None.
         """
         try:
-            normalized_mac = self.normalize_mac_address(mac_address)
-            mac_prefixes = [normalized_mac[:i] for i in (6, 7, 9)]  # 24-bit, 28-bit, 36-bit prefixes
-            for prefix in mac_prefixes:
-                if prefix in self.mac_to_vendor:
-                    return self.mac_to_vendor[prefix]
-        except ValueError as e:
+            return self._cached_vendor(mac_address)
+        except TypeError:
             return "Invalid MAC format"
-        return None
+
+    def _lookup_vendor(self, mac_address: Union[str, int, None]) -> Optional[str]:
+        oui_index, names = self._vendor_lookup
+        try:
+            vendor_id = oui_index.lookup(MacAddress(mac_address).value)
+        except (TypeError, ValueError):
+            return "Invalid MAC format"
+        return names[vendor_id] if vendor_id >= 0 else None
+
+    def get_vendors(self, mac_addresses: Iterable[Union[str, int, None]]) -> List[Optional[str]]:
+        """
+        Get the vendors of many MAC addresses in one pass, e.g. a whole MAC table column.
+
+        Addresses may mix Cisco, colon, dash and bare formats, MacAddress values and 48-bit integers. Each
+        distinct address is parsed and looked up once; repeats are answered from the same LRU cache as get_vendor.
+        MacAddress values are already parsed and go straight to the OUI index by their integer value.
+
+        :param mac_addresses: The MAC addresses; None entries (no address recorded) give None.
+        :return: One result per input, as get_vendor would return it.
+        """
+        oui_index, names = self._vendor_lookup
+        lookup = oui_index.lookup
+        cached_vendor = self._cached_vendor
+        vendors = []
+        for mac_address in mac_addresses:
+            if mac_address is None:
+                vendors.append(None)
+            elif type(mac_address) is MacAddress:
+                # Already parsed: look the integer up directly instead of hashing its text for the cache
+                vendor_id = lookup(mac_address.value)
+                vendors.append(names[vendor_id] if vendor_id >= 0 else None)
+            else:
+                try:
+                    vendors.append(cached_vendor(mac_address))
+                except TypeError:
+                    vendors.append("Invalid MAC format")
+        return vendors
 
     def get_full_vendor_name(self, short_name: str) -> Optional[str]:
         """
@@ -149,21 +584,40 @@ class MacAddressSupport:
         return self.short_name_to_full_name.get(short_name)
 
     @staticmethod
-    def normalize_mac_address(mac_address: str) -> str:
+    def normalize_mac_address(mac_address: Union[str, int]) -> str:
         """
         Normalize a MAC address to a common format (lowercase, no delimiters).
 
-        :param mac_address: The MAC address to normalize.
+        :param mac_address: The MAC address to normalize, as a string or MacAddress.
         :return: The normalized MAC address.
         :raises ValueError: If the MAC address format is invalid.
         """
-        mac = re.sub(r'[^a-fA-F0-9]', '', mac_address).lower()
-        if len(mac) != 12:
-            raise ValueError(f"Invalid MAC address format: {mac_address}")
-        return mac
+        return MacAddress(mac_address).format_mac('bare')
 
     @staticmethod
-    def compare_mac_addresses(mac1: str, mac2: str) -> bool:
+    def normalize_mac_addresses(mac_addresses: Sequence[Union[str, int, None]]) -> List[Optional[str]]:
+        """
+        Normalize many MAC addresses (lowercase, no delimiters), parsing each distinct input once.
+
+        :param mac_addresses: The MAC addresses in any Cisco, colon, dash or bare format.
+        :return: The normalized addresses, with None for inputs that are not valid MAC addresses.
+        """
+        normalized: Dict[Any, Optional[str]] = {}
+        results = []
+        for mac_address in mac_addresses:
+            try:
+                value = normalized[mac_address]
+            except KeyError:
+                try:
+                    value = MacAddress(mac_address).format_mac('bare')
+                except (TypeError, ValueError):
+                    value = None
+                normalized[mac_address] = value
+            results.append(value)
+        return results
+
+    @staticmethod
+    def compare_mac_addresses(mac1: Union[str, int], mac2: Union[str, int]) -> bool:
         """
         Compare two MAC addresses for equality.
 
@@ -172,7 +626,7 @@ class MacAddressSupport:
         :return: True if the MAC addresses are equal, False otherwise.
         """
         try:
-            return MacAddressSupport.normalize_mac_address(mac1) == MacAddressSupport.normalize_mac_address(mac2)
+            return MacAddress(mac1) == MacAddress(mac2)
         except ValueError:
             return False
 
@@ -183,7 +637,68 @@ class MacAddressSupport:
         :param vendor_name: The name of the vendor.
         :return: A list of MAC prefixes for the specified vendor.
         """
-        return [prefix for prefix, vendor in self.mac_to_vendor.items() if vendor_name.lower() in vendor.lower()]
+        vendor_index = self._current_vendor_index()
+        return vendor_index.prefixes(vendor_index.vendor_ids_containing(vendor_name))
+
+    def list_mac_prefixes_by_vendors(self, vendor_names: Sequence[str]) -> List[str]:
+        """
+        List all MAC prefixes of several vendors, e.g. ['Axis', 'Hirschmann'].
+
+        :param vendor_names: Vendor names, each matched like list_mac_prefixes_by_vendor.
+        :return: The MAC prefixes in manuf file order.
+        """
+        vendor_index = self._current_vendor_index()
+        return vendor_index.prefixes(self._vendor_ids(vendor_index, vendor_names))
+
+    def find_vendor_ids(self, vendor_names: Sequence[str]) -> List[int]:
+        """
+        Return the ids of the short vendor names that contain any of the given names, ignoring case.
+
+        :param vendor_names: Vendor names to match.
+        :return: Vendor ids in ascending order.
+        """
+        return self._vendor_ids(self._current_vendor_index(), vendor_names)
+
+    def _current_vendor_index(self) -> VendorPrefixIndex:
+        with self._generation_lock:
+            return self.vendor_index
+
+    @staticmethod
+    def _vendor_ids(vendor_index: VendorPrefixIndex, vendor_names: Sequence[str]) -> List[int]:
+        vendor_ids = set()
+        for vendor_name in vendor_names:
+            vendor_ids.update(vendor_index.vendor_ids_containing(vendor_name))
+        return sorted(vendor_ids)
+
+    def filter_by_vendor(self, entries: Sequence[Any], vendor_names: Sequence[str],
+                         mac_field: str = 'DESTINATION_ADDRESS') -> List[Any]:
+        """
+        Keep the entries whose MAC address belongs to one of the vendors, e.g. MAC table rows of Axis cameras.
+
+        :param entries: Entries such as ShowMACAddressTableEntry or ShowIPARPEntry records.
+        :param vendor_names: Vendor names, each matched like list_mac_prefixes_by_vendor.
+        :param mac_field: The attribute holding the MAC address ('MAC_ADDRESS' for ARP and interface entries).
+        :return: The matching entries in their original order.
+        """
+        # Vendor ids are only meaningful within one database version, so look up in the same one
+        with self._generation_lock:
+            vendor_index = self.vendor_index
+            lookup = self.oui_index.lookup
+        wanted = set(self._vendor_ids(vendor_index, vendor_names))
+        if not wanted:
+            return []
+        matches = []
+        for entry in entries:
+            mac = getattr(entry, mac_field)
+            if mac is None:
+                continue
+            try:
+                value = MacAddress(mac).value
+            except (TypeError, ValueError):
+                continue
+            if lookup(value) in wanted:
+                matches.append(entry)
+        return matches
 
     def display_menu(self) -> None:
         """
@@ -231,15 +746,19 @@ class MacAddressSupport:
             else:
                 print("Invalid choice. Please try again.")
 
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=MacAddressSupport._reinitialize_shared_lock)
+
+
 # Example usage:
 if __name__ == "__main__":
-    mac_support = MacAddressSupport()
+    mac_support = MacAddressSupport.shared()
     mac_support.handle_user_input()
 
 # Example usage:
 if __name__ == "__main__":
     from pprint import pprint
-    mac_support = MacAddressSupport()
+    mac_support = MacAddressSupport.shared()
     mac_address = "00:00:01:02:03:04"
     print(f"Vendor for {mac_address}: {mac_support.get_vendor(mac_address)}")
 
@@ -268,6 +787,6 @@ if __name__ == "__main__":
 
 
 if __name__ == "__main__":
-    mac_support = MacAddressSupport()
+    mac_support = MacAddressSupport.shared()
     mac_support.handle_user_input()
 1
\ No newline at end of file
@@ -2,6 +2,8 @@ import os
 from .database import Database
 from email.headerregistry import UniqueAddressHeader
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import SQLAlchemyError
 
 db = SQLAlchemy()
 
@@ -30,6 +32,7 @@ class Switchport(db.Model):
 
 class Interface(db.Model):
     __tablename__ = 'interface'
+    __table_args__ = (db.UniqueConstraint('device_id', 'name', name='uq_interface_device_name'),)
     interface_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
     name = db.Column(db.String(64), nullable=False)
@@ -50,9 +53,183 @@ class VersionInfo(db.Model):
 
     device = db.relationship('Device', backref=db.backref('version_info', lazy=True))
 
+class RunningConfig(db.Model):
+    __tablename__ = 'running_config'
+    running_config_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    config = db.Column(db.Text)
+
+    device = db.relationship('Device', backref=db.backref('running_configs', lazy=True))
+
+class IpRoute(db.Model):
+    __tablename__ = 'ip_route'
+    route_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    protocol = db.Column(db.String(16))
+    network = db.Column(db.String(64))
+    next_hop = db.Column(db.String(64))
+
+    device = db.relationship('Device', backref=db.backref('ip_routes', lazy=True))
+
+class ArpEntry(db.Model):
+    __tablename__ = 'arp_entry'
+    arp_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    protocol = db.Column(db.String(16))
+    address = db.Column(db.String(64))
+    age = db.Column(db.String(16))
+    mac_address = db.Column(db.String(32))
+    interface = db.Column(db.String(64))
+
+    device = db.relationship('Device', backref=db.backref('arp_entries', lazy=True))
+
+class MacAddressEntry(db.Model):
+    __tablename__ = 'mac_address_entry'
+    mac_address_entry_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    vlan = db.Column(db.String(16))
+    mac_address = db.Column(db.String(32))
+    entry_type = db.Column(db.String(16))
+    ports = db.Column(db.String(64))
+
+    device = db.relationship('Device', backref=db.backref('mac_address_entries', lazy=True))
+
+class Vlan(db.Model):
+    __tablename__ = 'vlan'
+    vlan_entry_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    vlan_id = db.Column(db.String(16))
+    name = db.Column(db.String(64))
+    status = db.Column(db.String(32))
+    ports = db.Column(db.Text)
+
+    device = db.relationship('Device', backref=db.backref('vlans', lazy=True))
+
+class LogEntry(db.Model):
+    __tablename__ = 'log_entry'
+    log_entry_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    line_number = db.Column(db.Integer)
+    message = db.Column(db.Text)
+
+    device = db.relationship('Device', backref=db.backref('log_entries', lazy=True))
+
+class OspfNeighbor(db.Model):
+    __tablename__ = 'ospf_neighbor'
+    ospf_neighbor_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    neighbor_id = db.Column(db.String(64))
+    priority = db.Column(db.String(16))
+    state = db.Column(db.String(32))
+    dead_time = db.Column(db.String(16))
+    address = db.Column(db.String(64))
+    interface = db.Column(db.String(64))
+
+    device = db.relationship('Device', backref=db.backref('ospf_neighbors', lazy=True))
+
+class Sweep(db.Model):
+    __tablename__ = 'sweep'
+    sweep_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    started_at = db.Column(db.DateTime, nullable=False, index=True)
+    finished_at = db.Column(db.DateTime)
+    # 'raw' until compaction keeps the sweep as the 'hourly' or 'daily' representative of its period
+    resolution = db.Column(db.String(16), nullable=False, default='raw')
+
+class SweepDevice(db.Model):
+    # One row per history table a device reported in a sweep; an empty table still gets its row
+    __tablename__ = 'sweep_device'
+    __table_args__ = (db.Index('ix_sweep_device_device_table', 'device_id', 'table_name', 'sweep_id'),)
+    sweep_id = db.Column(db.Integer, db.ForeignKey('sweep.sweep_id'), primary_key=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), primary_key=True)
+    table_name = db.Column(db.String(64), primary_key=True)
+
+    sweep = db.relationship('Sweep', backref=db.backref('devices', lazy=True))
+
+class InterfaceHistory(db.Model):
+    __tablename__ = 'interface_history'
+    __table_args__ = (db.Index('ix_interface_history_device_name_sweep', 'device_id', 'name', 'sweep_id'),)
+    interface_history_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    sweep_id = db.Column(db.Integer, db.ForeignKey('sweep.sweep_id'), nullable=False, index=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    name = db.Column(db.String(64), nullable=False)
+    ip_address = db.Column(db.String(64))
+    status = db.Column(db.String(64))
+    protocol = db.Column(db.String(64))
+
+    sweep = db.relationship('Sweep', backref=db.backref('interfaces', lazy=True))
+
+class MacAddressHistory(db.Model):
+    __tablename__ = 'mac_address_history'
+    __table_args__ = (db.Index('ix_mac_address_history_device_sweep', 'device_id', 'sweep_id'),)
+    mac_address_history_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    sweep_id = db.Column(db.Integer, db.ForeignKey('sweep.sweep_id'), nullable=False, index=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    vlan = db.Column(db.String(16))
+    mac_address = db.Column(db.String(32), index=True)
+    entry_type = db.Column(db.String(16))
+    ports = db.Column(db.String(64))
+
+    sweep = db.relationship('Sweep', backref=db.backref('mac_addresses', lazy=True))
+
+class ArpHistory(db.Model):
+    __tablename__ = 'arp_history'
+    __table_args__ = (db.Index('ix_arp_history_device_sweep', 'device_id', 'sweep_id'),)
+    arp_history_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    sweep_id = db.Column(db.Integer, db.ForeignKey('sweep.sweep_id'), nullable=False, index=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.device_id'), nullable=False)
+    protocol = db.Column(db.String(16))
+    address = db.Column(db.String(64))
+    age = db.Column(db.String(16))
+    mac_address = db.Column(db.String(32), index=True)
+    interface = db.Column(db.String(64))
+
+    sweep = db.relationship('Sweep', backref=db.backref('arp_entries', lazy=True))
+
 
 class Config(db.Model):
     __tablename__ = 'config'
     key = db.Column(db.String(64), primary_key=True, unique=True)
     value = db.Column(db.String(64))
-    
\ No newline at end of file
+    
+
+def migrate_interface_natural_key(database: SQLAlchemy = None) -> int:
+    """
+    One-time upgrade of a database created before interface rows were unique per (device_id, name).
+
+    create_all() does not alter existing tables, so older databases keep the append-only duplicates and lack the
+    constraint the interface upsert relies on. This keeps the newest row (highest interface_id) of each
+    (device_id, name), deletes the older ones and creates the unique index uq_interface_device_name, in one
+    transaction. It does nothing on databases that already have the constraint or no interface table, so
+    Database.migrate runs it on every start (FlaskApp) and after Database.create_all.
+    Run it inside an application context.
+
+    :param database: The SQLAlchemy instance bound to the application, e.g. Database.db. Defaults to db.
+    :return: The number of duplicate interface rows deleted.
+    :raises ValueError: If the database cannot be upgraded; nothing is changed then.
+    """
+    database = database or db
+    inspector = inspect(database.engine)
+    if not inspector.has_table(Interface.__tablename__):
+        return 0
+    natural_key = ['device_id', 'name']
+    unique_keys = [constraint['column_names'] for constraint in inspector.get_unique_constraints('interface')]
+    unique_keys += [index['column_names'] for index in inspector.get_indexes('interface') if index['unique']]
+    if natural_key in unique_keys:
+        return 0
+    try:
+        deleted = database.session.execute(text(
+            'DELETE FROM interface WHERE interface_id NOT IN '
+            '(SELECT MAX(interface_id) FROM interface GROUP BY device_id, name)')).rowcount
+        database.session.execute(text(
+            'CREATE UNIQUE INDEX uq_interface_device_name ON interface (device_id, name)'))
+        database.session.commit()
+    except SQLAlchemyError as e:
+        database.session.rollback()
+        raise ValueError(f"Failed to migrate the interface table: {e}")
+    return deleted
+
+
+# # Example usage: FlaskApp runs this through Database.migrate at start-up; to upgrade a database by hand
+# with app.app_context():
+#     db.create_all()
+#     removed = migrate_interface_natural_key()
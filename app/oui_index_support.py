@@ -0,0 +1,398 @@
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+OUI_INDEX_MAGIC = b'CSPOUI\x00\x00'
+OUI_INDEX_VERSION = 2
+OUI_INDEX_SUFFIX = '.idx'
+
+# magic, version, byte order (0 little, 1 big), entry count, vendor count, source size, source mtime (ns)
+_HEADER = struct.Struct('<8sHBxIIQq')
+_SECTIONS = ('sorted_keys', 'sorted_vendor_ids', 'prefix_lengths', 'vendor_ids', 'key_offsets', 'key_data',
+             'vendor_offsets', 'vendor_data', 'full_name_offsets', 'full_name_data')
+_SECTION_TABLE = struct.Struct('<' + 'QQ' * len(_SECTIONS))
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _parse_prefix(text: str) -> Tuple[int, int]:
+    """
+    Convert a manuf prefix such as '00:1B:C5:00:00/36' to its 48-bit network value and prefix length.
+    """
+    address, _, length = text.partition('/')
+    digits = address.replace(':', '').replace('-', '').replace('.', '')
+    bits = int(length) if length else len(digits) * 4
+    value = int(digits, 16) << (48 - len(digits) * 4)
+    return value & ~((1 << (48 - bits)) - 1) & 0xFFFFFFFFFFFF, bits
+
+
+def _string_table(strings: List[str]) -> Tuple[array, bytes]:
+    offsets = array('I', [0])
+    encoded = [string.encode('utf-8') for string in strings]
+    total = 0
+    for data in encoded:
+        total += len(data)
+        offsets.append(total)
+    return offsets, b''.join(encoded)
+
+
+def compile_manuf(data: str, source_size: int = 0, source_mtime_ns: int = 0) -> bytes:
+    """
+    Compile the text of a Wireshark manuf file into a binary OUI index.
+
+    Each line holds a prefix, a short vendor name and a full vendor name. The mac_to_vendor key of an entry is the
+    prefix column without colons in lower case, the vendor is the short name, and the last line wins for repeated
+    keys and short names. Entries keep file order. For lookups every entry is also stored as a sorted search key, the
+    48-bit network value shifted left by 8 with the prefix length in the low byte, next to its vendor id, along
+    with the distinct prefix lengths from longest to shortest.
+
+    :param data: The raw text of the manuf file.
+    :param source_size: Size of the source file, stored for staleness checks.
+    :param source_mtime_ns: Modification time of the source file, stored for staleness checks.
+    :return: The index file contents.
+    :raises ValueError: If a prefix cannot be parsed.
+    """
+    entries: Dict[str, Tuple[int, int, str]] = {}
+    full_names: Dict[str, str] = {}
+    for line in data.splitlines():
+        if line.startswith('#') or not line.strip():
+            continue
+        parts = _WHITESPACE.split(line)
+        if len(parts) < 3:
+            continue
+        key = parts[0].replace(':', '').lower()
+        value, bits = _parse_prefix(parts[0])
+        entries[key] = (value, bits, parts[1])
+        full_names[parts[1]] = ' '.join(parts[2:])
+
+    vendor_ids = {name: index for index, name in enumerate(full_names)}
+    keys = list(entries)
+    vendors = array('I', (vendor_ids[entries[key][2]] for key in keys))
+    # Keys such as '00:00:0C' and '00-00-0C' can name the same prefix; the later entry sorts last and wins
+    search = sorted((value << 8 | bits, index) for index, (value, bits, _) in enumerate(entries.values()))
+    sorted_keys = array('Q', (search_key for search_key, _ in search))
+    sorted_vendor_ids = array('I', (vendors[index] for _, index in search))
+    prefix_lengths = array('B', sorted({bits for _, bits, _ in entries.values()}, reverse=True))
+    key_offsets, key_data = _string_table(keys)
+    vendor_offsets, vendor_data = _string_table(list(full_names))
+    full_name_offsets, full_name_data = _string_table(list(full_names.values()))
+    blocks = [sorted_keys, sorted_vendor_ids, prefix_lengths, vendors, key_offsets, key_data,
+              vendor_offsets, vendor_data, full_name_offsets, full_name_data]
+
+    header = _HEADER.pack(OUI_INDEX_MAGIC, OUI_INDEX_VERSION, 0 if sys.byteorder == 'little' else 1,
+                          len(keys), len(full_names), source_size, source_mtime_ns)
+    offset = _HEADER.size + _SECTION_TABLE.size
+    table = []
+    body = []
+    for block in blocks:
+        raw = block.tobytes() if isinstance(block, array) else block
+        padding = -offset % 8
+        body.append(b'\x00' * padding)
+        offset += padding
+        table.extend((offset, len(raw)))
+        body.append(raw)
+        offset += len(raw)
+    return header + _SECTION_TABLE.pack(*table) + b''.join(body)
+
+
+class OUIIndex:
+    """
+    Read-only view of a compiled OUI index.
+
+    The index file is memory-mapped and its integer sections are used in place, so opening it costs almost
+    nothing. Vendor lookups bisect the sorted search keys once per prefix length, longest first, without
+    building anything in memory. Strings are decoded only when they are asked for.
+    """
+
+    def __init__(self, data, source: Optional[str] = None) -> None:
+        """
+        Wrap compiled index contents.
+
+        :param data: An mmap or bytes object holding the index.
+        :param source: Path of the index file, for error messages.
+        :raises ValueError: If the data is not a compatible index.
+        """
+        self.source = source
+        self._data = data
+        if len(data) < _HEADER.size + _SECTION_TABLE.size:
+            raise ValueError(f"{source or 'data'} is not an OUI index.")
+        magic, version, byteorder, self.count, self.vendor_count, self.source_size, self.source_mtime_ns = \
+            _HEADER.unpack_from(data, 0)
+        if magic != OUI_INDEX_MAGIC or version != OUI_INDEX_VERSION:
+            raise ValueError(f"{source or 'data'} is not a supported OUI index.")
+        if byteorder != (0 if sys.byteorder == 'little' else 1):
+            raise ValueError(f"{source or 'data'} was built for a different byte order.")
+        table = _SECTION_TABLE.unpack_from(data, _HEADER.size)
+        self._sections = {name: (table[2 * i], table[2 * i + 1]) for i, name in enumerate(_SECTIONS)}
+        self._view = memoryview(data)
+        self._views: List[memoryview] = []
+        self.sorted_keys = self._section('sorted_keys', 'Q')
+        self.sorted_vendor_ids = self._section('sorted_vendor_ids', 'I')
+        self.vendor_ids = self._section('vendor_ids', 'I')
+        self._prefix_lengths = self._section('prefix_lengths', 'B').tolist()
+        self._key_offsets = self._section('key_offsets', 'I')
+        self._vendor_offsets = self._section('vendor_offsets', 'I')
+        self._full_name_offsets = self._section('full_name_offsets', 'I')
+        self._vendor_names: Optional[List[str]] = None
+
+    def _section(self, name: str, typecode: str) -> memoryview:
+        offset, length = self._sections[name]
+        view = self._view[offset:offset + length].cast(typecode)
+        self._views.append(view)
+        return view
+
+    def _string(self, table: str, offsets: memoryview, index: int) -> str:
+        base = self._sections[table][0]
+        return bytes(self._view[base + offsets[index]:base + offsets[index + 1]]).decode('utf-8')
+
+    def key(self, index: int) -> str:
+        """
+        Return the mac_to_vendor key of an entry, e.g. '00000c' or '001bc50000/36'.
+        """
+        return self._string('key_data', self._key_offsets, index)
+
+    def lookup(self, mac: int) -> int:
+        """
+        Return the vendor id of the longest prefix containing a MAC address, or -1 if none does.
+
+        :param mac: The 48-bit MAC address as an integer (MacAddress.value).
+        :return: The vendor id or -1.
+        """
+        sorted_keys = self.sorted_keys
+        for length in self._prefix_lengths:
+            search_key = (mac >> (48 - length)) << (56 - length) | length
+            position = bisect_right(sorted_keys, search_key) - 1
+            if position >= 0 and sorted_keys[position] == search_key:
+                return self.sorted_vendor_ids[position]
+        return -1
+
+    def lookup_many(self, macs) -> List[int]:
+        """
+        Look up a column of MAC addresses.
+
+        :param macs: Iterable of 48-bit MAC integers or MacAddress values.
+        :return: Vendor id (or -1) per address.
+        """
+        lookup = self.lookup
+        return [lookup(int(mac)) for mac in macs]
+
+    def vendor_names(self) -> List[str]:
+        """
+        Return the short vendor names, indexed by vendor id.
+        """
+        if self._vendor_names is None:
+            self._vendor_names = [self._string('vendor_data', self._vendor_offsets, index)
+                                  for index in range(self.vendor_count)]
+        return self._vendor_names
+
+    def vendor(self, index: int) -> str:
+        """
+        Return the short vendor name of an entry.
+        """
+        return self.vendor_names()[self.vendor_ids[index]]
+
+    def full_name(self, vendor_id: int) -> str:
+        """
+        Return the full vendor name for a vendor id.
+        """
+        return self._string('full_name_data', self._full_name_offsets, vendor_id)
+
+    def mac_to_vendor(self) -> Dict[str, str]:
+        """
+        Materialize the prefix key to short vendor name dictionary, in manuf file order.
+        """
+        names = self.vendor_names()
+        base = self._sections['key_data'][0]
+        offsets = self._key_offsets.tolist()
+        key_data = bytes(self._view[base:base + offsets[-1]])
+        return {key_data[offsets[index]:offsets[index + 1]].decode('utf-8'): names[vendor_id]
+                for index, vendor_id in enumerate(self.vendor_ids.tolist())}
+
+    def short_name_to_full_name(self) -> Dict[str, str]:
+        """
+        Materialize the short vendor name to full vendor name dictionary.
+        """
+        return {name: self.full_name(vendor_id) for vendor_id, name in enumerate(self.vendor_names())}
+
+    def is_current(self, source_path: str) -> bool:
+        """
+        Return True if the index was built from the current version of a manuf file.
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return False
+        return stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+    def close(self) -> None:
+        """
+        Release the memory map.
+        """
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._view.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> 'OUIIndex':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @classmethod
+    def open(cls, index_path: str) -> 'OUIIndex':
+        """
+        Memory-map an index file.
+
+        :param index_path: Path of the compiled index.
+        :return: The index.
+        :raises ValueError: If the file is not a compatible index.
+        """
+        with open(index_path, 'rb') as file:
+            try:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{index_path} is not an OUI index.")
+        try:
+            return cls(data, index_path)
+        except ValueError:
+            data.close()
+            raise
+
+    @classmethod
+    def load(cls, manuf_path: str, index_path: Optional[str] = None) -> 'OUIIndex':
+        """
+        Open the compiled index of a manuf file, compiling it first if it is missing, outdated or incompatible.
+
+        The index is written next to the manuf file (manuf.idx) through a temporary file and an atomic rename.
+        If it cannot be written, the index is compiled in memory instead.
+
+        :param manuf_path: Path of the Wireshark manuf file.
+        :param index_path: Path of the compiled index. Defaults to the manuf path plus '.idx'.
+        :return: The index.
+        :raises ValueError: If the manuf file cannot be parsed.
+        """
+        index_path = index_path or manuf_path + OUI_INDEX_SUFFIX
+        if os.path.exists(index_path):
+            try:
+                index = cls.open(index_path)
+            except ValueError:
+                pass
+            else:
+                if index.is_current(manuf_path):
+                    return index
+                index.close()
+        stat = os.stat(manuf_path)
+        with open(manuf_path, 'r', encoding='utf-8') as file:
+            compiled = compile_manuf(file.read(), stat.st_size, stat.st_mtime_ns)
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(index_path)),
+                                                          suffix=OUI_INDEX_SUFFIX)
+        except OSError:
+            return cls(compiled, manuf_path)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(compiled)
+            os.replace(temp_path, index_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return cls(compiled, manuf_path)
+        return cls.open(index_path)
+
+
+class VendorPrefixIndex:
+    """
+    Reverse index from vendors to their prefixes, built from an OUIIndex.
+
+    Substring queries on short vendor names go through a trigram index over the distinct names, so only the
+    few names sharing every trigram of the query are compared. Token prefix queries ("hirsch") use a sorted
+    list of the words of the short and full names, built on the first such query. Prefixes are returned in manuf file order.
+    """
+
+    def __init__(self, oui_index: OUIIndex) -> None:
+        """
+        Build the reverse index.
+
+        :param oui_index: The compiled OUI index.
+        """
+        self.oui_index = oui_index
+        self._folded_names = [name.lower() for name in oui_index.vendor_names()]
+        self._entries: List[List[int]] = [[] for _ in self._folded_names]
+        for index, vendor_id in enumerate(oui_index.vendor_ids.tolist()):
+            self._entries[vendor_id].append(index)
+        self._trigrams: Dict[str, List[int]] = {}
+        for vendor_id, name in enumerate(self._folded_names):
+            for trigram in {name[i:i + 3] for i in range(len(name) - 2)}:
+                self._trigrams.setdefault(trigram, []).append(vendor_id)
+        self._tokens: Optional[List[Tuple[str, int]]] = None
+        self._token_words: List[str] = []
+
+    def _build_tokens(self) -> None:
+        tokens = set()
+        for vendor_id, name in enumerate(self._folded_names):
+            for word in re.findall(r'\w+', name + ' ' + self.oui_index.full_name(vendor_id).lower()):
+                tokens.add((word, vendor_id))
+        self._tokens = sorted(tokens)
+        self._token_words = [word for word, _ in self._tokens]
+
+    def vendor_ids_containing(self, text: str) -> List[int]:
+        """
+        Return the ids of short vendor names that contain a text, ignoring case.
+
+        :param text: The text to find, e.g. 'hirschmann'.
+        :return: Matching vendor ids in ascending order.
+        """
+        text = text.lower()
+        if len(text) < 3:
+            return [vendor_id for vendor_id, name in enumerate(self._folded_names) if text in name]
+        postings = [self._trigrams.get(text[i:i + 3]) for i in range(len(text) - 2)]
+        if not all(postings):
+            return []
+        candidates = set(min(postings, key=len))
+        for posting in postings:
+            if len(candidates) <= 8:
+                break
+            candidates.intersection_update(posting)
+        return sorted(vendor_id for vendor_id in candidates if text in self._folded_names[vendor_id])
+
+    def vendor_ids_with_token(self, prefix: str) -> List[int]:
+        """
+        Return the ids of vendors with a word in their short or full name that starts with a prefix, ignoring case.
+
+        :param prefix: Word prefix, e.g. 'axis'.
+        :return: Matching vendor ids in ascending order.
+        """
+        if self._tokens is None:
+            self._build_tokens()
+        prefix = prefix.lower()
+        start = bisect_left(self._token_words, prefix)
+        vendor_ids = set()
+        for word, vendor_id in self._tokens[start:]:
+            if not word.startswith(prefix):
+                break
+            vendor_ids.add(vendor_id)
+        return sorted(vendor_ids)
+
+    def entries(self, vendor_ids) -> List[int]:
+        """
+        Return the index entries of some vendors in manuf file order.
+        """
+        vendor_ids = list(vendor_ids)
+        if len(vendor_ids) == 1:
+            return list(self._entries[vendor_ids[0]])
+        return sorted(index for vendor_id in vendor_ids for index in self._entries[vendor_id])
+
+    def prefixes(self, vendor_ids) -> List[str]:
+        """
+        Return the mac_to_vendor keys of some vendors in manuf file order.
+        """
+        key = self.oui_index.key
+        return [key(index) for index in self.entries(vendor_ids)]
@@ -0,0 +1,723 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from itertools import starmap
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, get_args, get_origin, get_type_hints
+from app import application_dataclasses
+from app.application_dataclasses import DataclassDunderMethods, NetworkDeviceEntry
+from app.application_dataclasses_support import InfoErrorFlags
+from app.mac_address_support import MacAddress
+
+
+# Header: magic, format version, reserved, directory offset, directory length
+SNAPSHOT_MAGIC = b'CSPSNAP\x00'
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct('<8sHHxxxxQQ')
+_ALIGNMENT = 8
+# Values with these tags decode to mutable objects and are decoded per row instead of shared between rows
+_MUTABLE_TAGS = (b'X', b'L', b'J')
+DEVICES_TABLE = 'devices'
+# Fields left out of snapshots unless the caller asks for them: snapshot files are shared and kept for history
+CREDENTIAL_FIELDS: Dict[str, Tuple[str, ...]] = {'device_connection_data': ('password', 'secret')}
+
+
+def _record_classes() -> Dict[str, Type]:
+    """
+    Returns the dataclasses a snapshot can store, by class name.
+    """
+    return {name: value for name, value in vars(application_dataclasses).items()
+            if isinstance(value, type) and is_dataclass(value)}
+
+
+def _device_layout() -> Tuple[List[str], Dict[str, Type], Dict[str, Type]]:
+    """
+    Splits the NetworkDeviceEntry fields into scalar columns, nested dataclass tables and entry list tables.
+
+    :return: (scalar field names, {field name: nested dataclass}, {field name: entry dataclass})
+    """
+    hints = get_type_hints(NetworkDeviceEntry)
+    scalar_fields, nested_tables, list_tables = [], {}, {}
+    for device_field in fields(NetworkDeviceEntry):
+        hint = hints[device_field.name]
+        # Unwrap Optional[...]
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if get_origin(hint) is not list and len(args) == 1:
+            hint = args[0]
+        if get_origin(hint) is list:
+            list_tables[device_field.name] = get_args(hint)[0]
+        elif isinstance(hint, type) and issubclass(hint, DataclassDunderMethods):
+            nested_tables[device_field.name] = hint
+        else:
+            scalar_fields.append(device_field.name)
+    return scalar_fields, nested_tables, list_tables
+
+
+def _encode_value(value: Any) -> bytes:
+    """
+    Encodes one cell value as a type tag followed by its payload.
+    """
+    if value is None:
+        return b'N'
+    value_type = type(value)
+    if value_type is str:
+        return b'S' + value.encode('utf-8')
+    if value_type is MacAddress:
+        return b'M' + value.value.to_bytes(6, 'big')
+    if value_type is bool:
+        return b'B1' if value else b'B0'
+    if value_type is int:
+        return b'I' + str(value).encode('ascii')
+    if value_type is float:
+        return b'F' + repr(value).encode('ascii')
+    if value_type is InfoErrorFlags:
+        flags = {"mask": value.to_integer(), "name": value.name, "description": value.description,
+                 "class_version": value.class_version}
+        return b'X' + json.dumps(flags).encode('utf-8')
+    if value_type is list:
+        return b'L' + json.dumps(value, default=str).encode('utf-8')
+    return b'J' + json.dumps(value, default=str).encode('utf-8')
+
+
+def _decode_value(data: bytes) -> Any:
+    """
+    Decodes one cell value written by _encode_value.
+    """
+    tag, payload = data[:1], data[1:]
+    if tag == b'S':
+        return payload.decode('utf-8')
+    if tag == b'N':
+        return None
+    if tag == b'M':
+        return MacAddress(int.from_bytes(payload, 'big'))
+    if tag == b'B':
+        return payload == b'1'
+    if tag == b'I':
+        return int(payload)
+    if tag == b'F':
+        return float(payload)
+    if tag == b'X':
+        flags = json.loads(payload)
+        decoded = InfoErrorFlags.from_integer(flags["mask"], flags["name"], flags["description"])
+        decoded.class_version = flags["class_version"]
+        return decoded
+    if tag in (b'L', b'J'):
+        return json.loads(payload)
+    raise ValueError(f"Unknown snapshot value tag: {tag!r}")
+
+
+def _smallest_typecode(count: int) -> str:
+    """
+    Returns the smallest unsigned array typecode that can index count values.
+    """
+    if count <= 0xFF:
+        return 'B'
+    if count <= 0xFFFF:
+        return 'H'
+    return 'I'
+
+
+class _ColumnBuilder:
+    """
+    Dictionary-encodes one column while a snapshot is written: each distinct value is stored once
+    and every row holds a small integer code.
+    """
+
+    def __init__(self) -> None:
+        self.codes = array('I')
+        self.values: List[bytes] = []
+        self._codes_by_encoding: Dict[bytes, int] = {}
+        self._codes_by_str: Dict[str, int] = {}
+
+    def append(self, value: Any) -> None:
+        """
+        Appends one cell to the column.
+        """
+        if type(value) is str:
+            code = self._codes_by_str.get(value)
+            if code is None:
+                code = self._codes_by_str[value] = self._code_for(_encode_value(value))
+        else:
+            code = self._code_for(_encode_value(value))
+        self.codes.append(code)
+
+    def _code_for(self, encoded: bytes) -> int:
+        code = self._codes_by_encoding.get(encoded)
+        if code is None:
+            code = self._codes_by_encoding[encoded] = len(self.values)
+            self.values.append(encoded)
+        return code
+
+
+class _TableBuilder:
+    """
+    Collects the rows of one table as columns, with CSR-style row offsets per device.
+    """
+
+    def __init__(self, record_cls: Optional[Type], column_names: List[str]) -> None:
+        self.record_cls = record_cls
+        self.column_names = column_names
+        self.columns = [_ColumnBuilder() for _ in column_names]
+        self.row_offsets = array('I', [0])
+        self.row_count = 0
+
+    def append_rows(self, records: Iterable[Any]) -> None:
+        """
+        Appends the records of one device and closes its row range.
+        """
+        for record in records:
+            if self.record_cls is None:
+                self.record_cls = type(record)
+            for column, name in zip(self.columns, self.column_names):
+                column.append(getattr(record, name))
+            self.row_count += 1
+        self.row_offsets.append(self.row_count)
+
+
+class _BlockWriter:
+    """
+    Writes 8-byte aligned blocks to a binary file and returns their [offset, length] references.
+    """
+
+    def __init__(self, file) -> None:
+        self.file = file
+        self.position = _HEADER.size
+        self.file.write(b'\x00' * _HEADER.size)
+
+    def write(self, data) -> List[int]:
+        padding = -self.position % _ALIGNMENT
+        if padding:
+            self.file.write(b'\x00' * padding)
+            self.position += padding
+        data = data.tobytes() if isinstance(data, array) else bytes(data)
+        offset = self.position
+        self.file.write(data)
+        self.position += len(data)
+        return [offset, len(data)]
+
+
+class SnapshotWriter:
+    """
+    Writes a collection of NetworkDeviceEntry objects to a compact, memory-mappable binary snapshot.
+
+    Layout: a fixed header, then 8-byte aligned blocks, then a JSON directory describing the blocks.
+    Every table (devices, nested records and each entry list) is stored column by column; each column is
+    dictionary-encoded as an array of codes plus a length-prefixed table of its distinct values. Entry
+    tables also carry row offsets per device, so one device's rows can be located without a scan.
+    Login credentials (CREDENTIAL_FIELDS) are not stored unless include_credentials is set; records read back
+    from such a snapshot have None there.
+    """
+
+    def __init__(self, file_path: str, include_credentials: bool = False) -> None:
+        """
+        Initialize the writer.
+
+        :param file_path: Path of the snapshot file to write.
+        :type file_path: str
+        :param include_credentials: Store the password and secret of device_connection_data in plaintext.
+        :type include_credentials: bool
+        """
+        self.file_path = file_path
+        self.include_credentials = include_credentials
+
+    def write(self, devices: Iterable[Optional[NetworkDeviceEntry]], metadata: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Write the devices to the snapshot file. The file is written to a temporary name and renamed into
+        place, so readers never see a partial snapshot. None entries (unreachable devices) are skipped.
+
+        :param devices: The collected devices, e.g. Data['network_cisco_switches'].
+        :type devices: Iterable[Optional[NetworkDeviceEntry]]
+        :param metadata: Extra JSON-serialisable information stored in the directory.
+        :type metadata: Optional[Dict[str, Any]]
+        :return: Number of devices written.
+        :rtype: int
+        """
+        scalar_fields, nested_tables, list_tables = _device_layout()
+        tables: Dict[str, _TableBuilder] = {DEVICES_TABLE: _TableBuilder(NetworkDeviceEntry, scalar_fields)}
+        for name, record_cls in {**nested_tables, **list_tables}.items():
+            excluded = () if self.include_credentials else CREDENTIAL_FIELDS.get(name, ())
+            tables[name] = _TableBuilder(None, [f.name for f in fields(record_cls) if f.name not in excluded])
+
+        device_count = 0
+        for device in devices:
+            if device is None:
+                continue
+            device_count += 1
+            tables[DEVICES_TABLE].append_rows((device,))
+            for name in nested_tables:
+                nested = getattr(device, name)
+                tables[name].append_rows(() if nested is None else (nested,))
+            for name in list_tables:
+                tables[name].append_rows(getattr(device, name) or ())
+
+        directory_path = os.path.dirname(os.path.abspath(self.file_path))
+        file_descriptor, temp_path = tempfile.mkstemp(prefix='.snapshot-', dir=directory_path)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                blocks = _BlockWriter(file)
+                directory = {
+                    "format_version": SNAPSHOT_VERSION,
+                    "byteorder": sys.byteorder,
+                    "created": datetime.now().isoformat(),
+                    "metadata": metadata or {},
+                    "device_count": device_count,
+                    "tables": {name: self._write_table(blocks, table, name != DEVICES_TABLE)
+                               for name, table in tables.items()},
+                }
+                directory_bytes = json.dumps(directory).encode('utf-8')
+                directory_ref = blocks.write(directory_bytes)
+                file.seek(0)
+                file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, directory_ref[0], directory_ref[1]))
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return device_count
+
+    @staticmethod
+    def _write_table(blocks: _BlockWriter, table: _TableBuilder, with_row_offsets: bool) -> Dict[str, Any]:
+        """
+        Write the blocks of one table and return its directory entry.
+        """
+        record_cls = table.record_cls
+        columns = {}
+        for name, column in zip(table.column_names, table.columns):
+            typecode = _smallest_typecode(len(column.values))
+            value_offsets = array('I', [0])
+            total = 0
+            for encoded in column.values:
+                total += len(encoded)
+                value_offsets.append(total)
+            columns[name] = {
+                "typecode": typecode,
+                "mutable": any(encoded[:1] in _MUTABLE_TAGS for encoded in column.values),
+                "codes": blocks.write(array(typecode, column.codes)),
+                "value_count": len(column.values),
+                "value_offsets": blocks.write(value_offsets),
+                "value_data": blocks.write(b''.join(column.values)),
+            }
+        return {
+            "class": record_cls.__name__ if record_cls is not None else None,
+            "rows": table.row_count,
+            "row_offsets": blocks.write(table.row_offsets) if with_row_offsets else None,
+            "columns": columns,
+        }
+
+
+class _SnapshotColumn:
+    """
+    Lazily decoded view of one stored column. Codes are read straight from the memory map and each
+    distinct value is decoded the first time a row that uses it is accessed.
+    """
+
+    def __init__(self, reader: 'SnapshotReader', descriptor: Dict[str, Any]) -> None:
+        self._reader = reader
+        self._descriptor = descriptor
+        self.codes = reader._int_view(descriptor["codes"], descriptor["typecode"])
+        self.value_count = descriptor["value_count"]
+        self.mutable = descriptor.get("mutable", True)
+        self._value_offsets = None
+        self._decoded: Dict[int, Any] = {}
+
+    def _encoded(self, code: int) -> bytes:
+        if self._value_offsets is None:
+            self._value_offsets = self._reader._int_view(self._descriptor["value_offsets"], 'I')
+        base = self._descriptor["value_data"][0]
+        return self._reader._mmap[base + self._value_offsets[code]:base + self._value_offsets[code + 1]]
+
+    def value(self, code: int) -> Any:
+        """
+        Return the value stored under a code. Mutable values are decoded afresh on every call.
+        """
+        if self.mutable:
+            return _decode_value(self._encoded(code))
+        try:
+            return self._decoded[code]
+        except KeyError:
+            value = self._decoded[code] = _decode_value(self._encoded(code))
+            return value
+
+    def take(self, start: int, stop: int) -> List[Any]:
+        """
+        Return the values of rows start:stop.
+        """
+        codes = self.codes[start:stop].tolist()
+        if not self.mutable and len(codes) >= self.value_count:
+            values = [self.value(code) for code in range(self.value_count)]
+            return list(map(values.__getitem__, codes))
+        return [self.value(code) for code in codes]
+
+
+class SnapshotReader:
+    """
+    Reads a snapshot written by SnapshotWriter through a read-only memory map.
+
+    Only the header and directory are read when the snapshot is opened. Columns are decoded on first
+    access, and read_device/read_records materialize just the devices, rows and fields asked for, so
+    the operating system pages in only the parts of the file that are used.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Open and validate a snapshot file.
+
+        :param file_path: Path of the snapshot file.
+        :type file_path: str
+        :raises ValueError: If the file is not a supported snapshot.
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{file_path} is not a snapshot file.")
+        self._view = memoryview(self._mmap)
+        self._exported_views: List[memoryview] = []
+        self._columns: Dict[Tuple[str, str], _SnapshotColumn] = {}
+        self._row_offsets: Dict[str, Any] = {}
+        self._device_positions: Optional[Dict[str, int]] = None
+        try:
+            self.directory = self._read_directory()
+        except BaseException:
+            self.close()
+            raise
+        self._swap_bytes = self.directory["byteorder"] != sys.byteorder
+        self._record_classes = _record_classes()
+
+    def _read_directory(self) -> Dict[str, Any]:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{self.file_path} is not a snapshot file.")
+        magic, version, _, offset, length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{self.file_path} is not a snapshot file.")
+        if version > SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot format version {version} is not supported.")
+        return json.loads(self._mmap[offset:offset + length])
+
+    def _int_view(self, block: List[int], typecode: str):
+        """
+        Return an integer block as a zero-copy view of the map, or as a converted copy when the
+        snapshot was written with a different byte order.
+        """
+        offset, length = block
+        if self._swap_bytes:
+            values = array(typecode)
+            values.frombytes(self._mmap[offset:offset + length])
+            values.byteswap()
+            return values
+        view = self._view[offset:offset + length].cast(typecode)
+        self._exported_views.append(view)
+        return view
+
+    def _column(self, table_name: str, field_name: str) -> _SnapshotColumn:
+        key = (table_name, field_name)
+        column = self._columns.get(key)
+        if column is None:
+            descriptor = self.directory["tables"][table_name]["columns"][field_name]
+            column = self._columns[key] = _SnapshotColumn(self, descriptor)
+        return column
+
+    def _record_class(self, table: Dict[str, Any]) -> Type:
+        record_cls = self._record_classes.get(table["class"])
+        if record_cls is None:
+            raise ValueError(f"Snapshot record class {table['class']} is not available.")
+        return record_cls
+
+    @property
+    def created(self) -> str:
+        """
+        ISO timestamp of when the snapshot was written.
+        """
+        return self.directory["created"]
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Metadata stored with the snapshot.
+        """
+        return self.directory["metadata"]
+
+    @property
+    def device_count(self) -> int:
+        """
+        Number of devices in the snapshot.
+        """
+        return self.directory["device_count"]
+
+    def table_names(self) -> List[str]:
+        """
+        Return the names of the stored tables.
+        """
+        return list(self.directory["tables"])
+
+    def field_names(self, table_name: str) -> List[str]:
+        """
+        Return the stored field names of a table.
+        """
+        return list(self.directory["tables"][table_name]["columns"])
+
+    def hostnames(self) -> List[str]:
+        """
+        Return the switch hostnames in stored order.
+        """
+        return self._column(DEVICES_TABLE, "switch_hostname").take(0, self.device_count)
+
+    def device_position(self, hostname: str) -> int:
+        """
+        Return the stored position of a device.
+
+        :param hostname: The switch hostname.
+        :raises KeyError: If the device is not in the snapshot.
+        """
+        if self._device_positions is None:
+            self._device_positions = {name: position for position, name in enumerate(self.hostnames())}
+        try:
+            return self._device_positions[hostname]
+        except KeyError:
+            raise KeyError(f"Device '{hostname}' not found in snapshot {self.file_path}.")
+
+    def row_offsets(self, table_name: str):
+        """
+        Return the per-device row offsets of an entry table; rows of device i are offsets[i]:offsets[i + 1].
+        """
+        offsets = self._row_offsets.get(table_name)
+        if offsets is None:
+            offsets = self._row_offsets[table_name] = self._int_view(
+                self.directory["tables"][table_name]["row_offsets"], 'I')
+        return offsets
+
+    def device_rows(self, table_name: str, position: Optional[int] = None) -> range:
+        """
+        Return the row range of one device in a table, or every row when position is None.
+        """
+        if table_name == DEVICES_TABLE:
+            return range(self.device_count) if position is None else range(position, position + 1)
+        if position is None:
+            return range(self.directory["tables"][table_name]["rows"])
+        offsets = self.row_offsets(table_name)
+        return range(offsets[position], offsets[position + 1])
+
+    def column(self, table_name: str, field_name: str, hostname: Optional[str] = None) -> List[Any]:
+        """
+        Read one field of a table without materializing records.
+
+        :param table_name: 'devices' or an entry table such as 'show_interfaces_entry_list'.
+        :param field_name: The field to read, e.g. 'CRC'.
+        :param hostname: Limit the values to one device's rows.
+        :return: The field values in stored order.
+        """
+        position = None if hostname is None else self.device_position(hostname)
+        rows = self.device_rows(table_name, position)
+        return self._column(table_name, field_name).take(rows.start, rows.stop)
+
+    def read_records(self, table_name: str, hostname: Optional[str] = None,
+                     field_names: Optional[Iterable[str]] = None) -> List[Any]:
+        """
+        Materialize the records of a table, optionally for one device and a subset of fields.
+        Fields that are not requested keep their dataclass defaults.
+
+        :param table_name: 'devices' or an entry table such as 'show_interfaces_entry_list'.
+        :param hostname: Limit the records to one device.
+        :param field_names: The fields to load. Defaults to every stored field.
+        :return: The records in stored order.
+        """
+        table = self.directory["tables"][table_name]
+        position = None if hostname is None else self.device_position(hostname)
+        rows = self.device_rows(table_name, position)
+        if not rows:
+            return []
+        names = list(table["columns"]) if field_names is None else list(field_names)
+        columns = [self._column(table_name, name).take(rows.start, rows.stop) for name in names]
+        record_cls = self._record_class(table)
+        if names == [f.name for f in fields(record_cls) if f.init]:
+            return list(starmap(record_cls, zip(*columns)))
+        return [record_cls(**dict(zip(names, row))) for row in zip(*columns)]
+
+    def read_table(self, table_name: str) -> List[Any]:
+        """
+        Materialize every row of one table as records.
+
+        :param table_name: 'devices' or a NetworkDeviceEntry field name such as 'show_interfaces_entry_list'.
+        :type table_name: str
+        :return: The records in stored order.
+        :rtype: List[Any]
+        """
+        return self.read_records(table_name)
+
+    def read_device(self, hostname: str, table_names: Optional[Iterable[str]] = None) -> NetworkDeviceEntry:
+        """
+        Materialize one device with its nested records and entry lists.
+
+        :param hostname: The switch hostname.
+        :param table_names: The nested/entry tables to load. Defaults to all of them.
+        :return: The device.
+        """
+        device = self.read_records(DEVICES_TABLE, hostname)[0]
+        _, nested_tables, list_tables = _device_layout()
+        for name in self._child_tables(table_names):
+            rows = self.read_records(name, hostname)
+            setattr(device, name, (rows[0] if rows else None) if name in nested_tables else rows)
+        return device
+
+    def read_devices(self) -> List[NetworkDeviceEntry]:
+        """
+        Materialize the whole snapshot as NetworkDeviceEntry objects.
+
+        :return: The devices in stored order.
+        :rtype: List[NetworkDeviceEntry]
+        """
+        devices = self.read_table(DEVICES_TABLE)
+        _, nested_tables, list_tables = _device_layout()
+        for name in self._child_tables(None):
+            records = self.read_table(name)
+            offsets = self.row_offsets(name)
+            for index, device in enumerate(devices):
+                rows = records[offsets[index]:offsets[index + 1]]
+                setattr(device, name, (rows[0] if rows else None) if name in nested_tables else rows)
+        return devices
+
+    def _child_tables(self, table_names: Optional[Iterable[str]]) -> List[str]:
+        stored = [name for name in self.directory["tables"] if name != DEVICES_TABLE]
+        return stored if table_names is None else [name for name in table_names if name in stored]
+
+    def close(self) -> None:
+        """
+        Release the memory map and the file.
+        """
+        self._columns.clear()
+        self._row_offsets.clear()
+        for view in self._exported_views:
+            view.release()
+        self._exported_views.clear()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'SnapshotReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class SnapshotHistory:
+    """
+    A time-ordered set of snapshots for comparing sweeps.
+
+    Each snapshot stays memory-mapped and only the devices and fields that are queried are decoded,
+    so comparing many days of history costs little more memory than the records returned.
+    """
+
+    def __init__(self, file_paths: Iterable[str]) -> None:
+        """
+        Open the snapshots, ordered oldest first.
+
+        :param file_paths: Paths of snapshot files.
+        :type file_paths: Iterable[str]
+        """
+        self.readers: List[SnapshotReader] = []
+        try:
+            for file_path in file_paths:
+                self.readers.append(SnapshotReader(file_path))
+        except BaseException:
+            self.close()
+            raise
+        self.readers.sort(key=lambda reader: reader.created)
+
+    @classmethod
+    def from_directory(cls, directory: str, suffix: str = '.snapshot') -> 'SnapshotHistory':
+        """
+        Open every snapshot file in a directory.
+
+        :param directory: The directory to scan.
+        :param suffix: File name suffix of snapshot files.
+        :return: The history.
+        """
+        return cls(os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(suffix))
+
+    def device_history(self, hostname: str, table_name: str,
+                       field_names: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, List[Any]]]:
+        """
+        Yield one device's records from every snapshot that contains it.
+
+        :param hostname: The switch hostname.
+        :param table_name: The entry table, e.g. 'show_interfaces_entry_list'.
+        :param field_names: The fields to load. Defaults to every stored field.
+        :return: (snapshot created timestamp, records) pairs, oldest first.
+        """
+        field_names = None if field_names is None else list(field_names)
+        for reader in self.readers:
+            try:
+                records = reader.read_records(table_name, hostname, field_names)
+            except KeyError:
+                continue
+            yield reader.created, records
+
+    def column_history(self, hostname: str, table_name: str, field_name: str) -> Iterator[Tuple[str, List[Any]]]:
+        """
+        Yield one field of one device's rows from every snapshot that contains the device.
+
+        :return: (snapshot created timestamp, values) pairs, oldest first.
+        """
+        for reader in self.readers:
+            try:
+                values = reader.column(table_name, field_name, hostname)
+            except KeyError:
+                continue
+            yield reader.created, values
+
+    def close(self) -> None:
+        """
+        Close every snapshot.
+        """
+        for reader in self.readers:
+            reader.close()
+        self.readers = []
+
+    def __enter__(self) -> 'SnapshotHistory':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class SnapshotFileHandler:
+    """
+    Save and load whole sweeps as binary snapshots, alongside FileHandler's text formats.
+    """
+
+    @staticmethod
+    def write_snapshot(file_path: str, devices: Iterable[Optional[NetworkDeviceEntry]],
+                       metadata: Optional[Dict[str, Any]] = None, include_credentials: bool = False) -> int:
+        """
+        Writes a device collection to a binary snapshot file. Device passwords and secrets are left out unless
+        include_credentials is set.
+
+        :param file_path: Path to the snapshot file.
+        :param devices: The collected devices, e.g. Data['network_cisco_switches'].
+        :param metadata: Extra JSON-serialisable information stored with the snapshot.
+        :param include_credentials: Store the device_connection_data password and secret in plaintext.
+        :return: Number of devices written.
+        """
+        return SnapshotWriter(file_path, include_credentials).write(devices, metadata)
+
+    @staticmethod
+    def read_snapshot(file_path: str) -> List[NetworkDeviceEntry]:
+        """
+        Reads a whole binary snapshot file back into NetworkDeviceEntry objects.
+
+        :param file_path: Path to the snapshot file.
+        :return: The devices stored in the snapshot.
+        :raises FileNotFoundError: If the file does not exist.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+        with SnapshotReader(file_path) as reader:
+            return reader.read_devices()
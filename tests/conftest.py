@@ -0,0 +1,14 @@
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# app/__init__.py starts the whole CLI and Flask stack (netmiko, pyad, ldap3, the CLI connection module), none
+# of which the modules under test need. Register the package by path so `import app.x` loads just that module.
+if 'app' not in sys.modules:
+    package = types.ModuleType('app')
+    package.__path__ = [os.path.join(ROOT, 'app')]
+    sys.modules['app'] = package
@@ -0,0 +1,88 @@
+import unittest
+from app.application_dataclass_aggregation import GroupByAggregator, aggregate_entries
+from app.application_dataclasses import NetworkDeviceEntry, ShowInterfacesStatusEntry
+
+ROWS = [
+    {'region': 'JFK', 'status': 'connected', 'vlan': '10', 'crc': '5'},
+    {'region': 'JFK', 'status': 'notconnect', 'vlan': '10', 'crc': '0'},
+    {'region': 'JFK', 'status': 'connected', 'vlan': '20', 'crc': 'n/a'},
+    {'region': 'FMT', 'status': 'connected', 'vlan': None, 'crc': '7'},
+    {'region': 'FMT', 'status': None, 'vlan': '30', 'crc': None},
+]
+
+
+class GroupByAggregatorTest(unittest.TestCase):
+    def aggregator(self) -> GroupByAggregator:
+        return GroupByAggregator(['region', 'status'], {
+            'ports': ('count', None), 'with_vlan': ('count', 'vlan'), 'vlans': ('distinct', 'vlan'),
+            'crc_sum': ('sum', 'crc'), 'crc_mean': ('mean', 'crc'), 'crc_max': ('max', 'crc'),
+        }).update(ROWS)
+
+    def test_results_per_group(self) -> None:
+        results = self.aggregator().results()
+        self.assertEqual(list(results), [('JFK', 'connected'), ('JFK', 'notconnect'), ('FMT', 'connected'),
+                                         ('FMT', None)])
+        self.assertEqual(results[('JFK', 'connected')],
+                         {'ports': 2, 'with_vlan': 2, 'vlans': 2, 'crc_sum': 5, 'crc_mean': 5.0, 'crc_max': 5})
+        self.assertEqual(results[('FMT', None)],
+                         {'ports': 1, 'with_vlan': 1, 'vlans': 1, 'crc_sum': 0, 'crc_mean': None, 'crc_max': None})
+
+    def test_rows_are_flat_and_sorted(self) -> None:
+        rows = self.aggregator().rows()
+        self.assertEqual([(row['region'], row['status']) for row in rows],
+                         [('FMT', None), ('FMT', 'connected'), ('JFK', 'connected'), ('JFK', 'notconnect')])
+
+    def test_invalid_plans_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            GroupByAggregator(['region'], {'x': ('median', 'crc')})
+        with self.assertRaises(ValueError):
+            GroupByAggregator(['region'], {'x': ('sum', None)})
+        with self.assertRaises(ValueError):
+            GroupByAggregator(['region'], {'region': ('count', None)})
+
+    def test_groups_do_not_share_state(self) -> None:
+        aggregator = GroupByAggregator(['region'], {'vlans': ('distinct', 'vlan'), 'crc': ('mean', 'crc')})
+        results = aggregator.update(ROWS).results()
+        self.assertEqual(results[('JFK',)], {'vlans': 2, 'crc': 2.5})
+        self.assertEqual(results[('FMT',)], {'vlans': 1, 'crc': 7.0})
+
+
+class PivotTest(unittest.TestCase):
+    def test_pivot_spreads_a_key_into_columns(self) -> None:
+        aggregator = GroupByAggregator(['region', 'status']).update(ROWS)
+        self.assertEqual(aggregator.pivot(columns='status'), [
+            {'region': 'FMT', '(none)': 1, 'connected': 1, 'notconnect': 0},
+            {'region': 'JFK', '(none)': 0, 'connected': 2, 'notconnect': 1},
+        ])
+        self.assertEqual(aggregator.pivot(columns='status', fill=None, missing='unknown')[1],
+                         {'region': 'JFK', 'unknown': None, 'connected': 2, 'notconnect': 1})
+
+    def test_column_named_like_a_row_key_raises(self) -> None:
+        rows = [{'region': 'JFK', 'status': 'region'}, {'region': 'FMT', 'status': 'up'}]
+        with self.assertRaises(ValueError):
+            GroupByAggregator(['region', 'status']).update(rows).pivot(columns='status')
+
+    def test_values_with_the_same_text_raise(self) -> None:
+        rows = [{'region': 'JFK', 'vlan': 10}, {'region': 'JFK', 'vlan': '10'}]
+        with self.assertRaises(ValueError):
+            GroupByAggregator(['region', 'vlan']).update(rows).pivot(columns='vlan')
+
+    def test_pivot_key_must_be_grouped(self) -> None:
+        with self.assertRaises(ValueError):
+            GroupByAggregator(['region']).update(ROWS).pivot(columns='status')
+
+    def test_aggregate_entries_reads_entry_and_device_fields(self) -> None:
+        devices = []
+        for region, statuses in (('JFK', ['connected', 'notconnect']), ('FMT', ['connected'])):
+            device = NetworkDeviceEntry(switch_hostname=f'sw-{region}', switch_region=region)
+            device.show_interfaces_status_entry_list = [ShowInterfacesStatusEntry(STATUS=status) for status in statuses]
+            devices.append(device)
+        status = aggregate_entries(devices + [None], 'show_interfaces_status_entry_list', ['switch_region', 'STATUS'])
+        self.assertEqual(status.pivot(columns='STATUS'), [
+            {'switch_region': 'FMT', 'connected': 1, 'notconnect': 0},
+            {'switch_region': 'JFK', 'connected': 1, 'notconnect': 1},
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from flask import Flask
+from sqlalchemy import event
+from app.cli_database_driver import CLIDatabaseDriver
+from app.models import db, ArpEntry, Device, Interface, LogEntry, MdtaRegion, RunningConfig
+
+BRIEF = [
+    {'interface': 'Gi1/0/1', 'ip_address': 'unassigned', 'status': 'up', 'protocol': 'up'},
+    {'interface': 'Gi1/0/2', 'ip_address': 'unassigned', 'status': 'down', 'protocol': 'down'},
+    {'interface': 'Vlan10', 'ip_address': '10.0.0.1', 'status': 'up', 'protocol': 'up'},
+]
+ARP = [{'protocol': 'Internet', 'address': f'10.0.0.{i}', 'age': '1', 'mac_address': '00:11:22:33:44:5%d' % i,
+        'interface': 'Vlan10'} for i in range(4)]
+
+
+class DatabaseTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.flask_app = Flask(__name__)
+        self.flask_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.flask_app)
+        self.context = self.flask_app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(MdtaRegion(region_id=1, region_name='JFK'))
+        for device_id in (1, 2):
+            db.session.add(Device(device_id=device_id, ip_address=f'10.0.0.{device_id}',
+                                  host_name=f'sw{device_id}', region_id=1))
+        db.session.commit()
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+
+class UpsertTest(DatabaseTestCase):
+    def statements(self):
+        statements = []
+        event.listen(db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        return statements
+
+    def test_second_sweep_changes_only_differing_columns(self) -> None:
+        CLIDatabaseDriver(1).insert_ip_interface_brief(BRIEF)
+        identities = {interface.name: interface.interface_id for interface in Interface.query}
+        changed = [dict(row) for row in BRIEF]
+        changed[1]['status'] = 'up'
+        statements = self.statements()
+
+        result = CLIDatabaseDriver(1).upsert(Interface, CLIDatabaseDriver(1).ip_interface_brief_rows(changed))
+
+        self.assertEqual(result, {'inserted': 0, 'updated': 1, 'unchanged': 2, 'deleted': 0})
+        updates = [statement for statement in statements if statement.startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('SET status=', updates[0])
+        self.assertNotIn('protocol', updates[0])
+        self.assertEqual({interface.name: interface.interface_id for interface in Interface.query}, identities)
+        self.assertEqual(Interface.query.filter_by(name='Gi1/0/2').one().status, 'up')
+
+    def test_identical_sweep_writes_nothing(self) -> None:
+        CLIDatabaseDriver(1).insert_ip_interface_brief(BRIEF)
+        statements = self.statements()
+
+        result = CLIDatabaseDriver(1).upsert(Interface, CLIDatabaseDriver(1).ip_interface_brief_rows(BRIEF))
+
+        self.assertEqual(result['unchanged'], 3)
+        self.assertFalse([s for s in statements if s.startswith(('UPDATE', 'INSERT', 'DELETE'))])
+
+    def test_show_interfaces_does_not_blank_brief_columns(self) -> None:
+        CLIDatabaseDriver(1).insert_ip_interface_brief(BRIEF)
+        CLIDatabaseDriver(1).insert_sweep({'show interfaces': [{'interface': 'Vlan10', 'status': 'down'}]})
+
+        vlan = Interface.query.filter_by(name='Vlan10').one()
+        self.assertEqual((vlan.status, vlan.protocol, vlan.ip_address), ('down', 'up', '10.0.0.1'))
+
+    def test_remove_missing_deletes_only_this_device(self) -> None:
+        CLIDatabaseDriver(1).insert_ip_interface_brief(BRIEF)
+        CLIDatabaseDriver(2).insert_ip_interface_brief(BRIEF)
+
+        result = CLIDatabaseDriver(1).upsert(Interface, CLIDatabaseDriver(1).ip_interface_brief_rows(BRIEF[:1]),
+                                             remove_missing=True)
+
+        self.assertEqual(result['deleted'], 2)
+        self.assertEqual(Interface.query.filter_by(device_id=1).count(), 1)
+        self.assertEqual(Interface.query.filter_by(device_id=2).count(), 3)
+
+
+class ReplaceTablesTest(DatabaseTestCase):
+    def test_repeated_sweeps_keep_only_the_latest_rows(self) -> None:
+        sweep = {'show arp': ARP, 'show logging': ['a', 'b'], 'show running-config': 'hostname sw'}
+        for device_id in (1, 2):
+            for _ in range(3):
+                written = CLIDatabaseDriver(device_id).insert_sweep(sweep)
+
+        self.assertEqual(written, {'show arp': 4, 'show logging': 2, 'show running-config': 1})
+        self.assertEqual((ArpEntry.query.count(), LogEntry.query.count(), RunningConfig.query.count()), (8, 4, 2))
+
+    def test_replacing_one_device_leaves_the_others(self) -> None:
+        CLIDatabaseDriver(1).insert_arp(ARP)
+        CLIDatabaseDriver(2).insert_arp(ARP)
+
+        result = CLIDatabaseDriver(1).write_tables([(ArpEntry, CLIDatabaseDriver(1).arp_rows(ARP[:1]))], 'show arp')
+
+        self.assertEqual(result, [{'inserted': 1, 'updated': 0, 'unchanged': 0, 'deleted': 4}])
+        self.assertEqual(ArpEntry.query.filter_by(device_id=1).count(), 1)
+        self.assertEqual(ArpEntry.query.filter_by(device_id=2).count(), 4)
+
+    def test_mac_addresses_are_stored_in_canonical_form(self) -> None:
+        CLIDatabaseDriver(1).insert_arp(ARP[:1] + [dict(ARP[1], mac_address='Incomplete')])
+
+        self.assertEqual([arp.mac_address for arp in ArpEntry.query.order_by(ArpEntry.arp_id)],
+                         ['0011.2233.4450', 'Incomplete'])
+
+    def test_failed_write_leaves_stored_rows(self) -> None:
+        CLIDatabaseDriver(1).insert_arp(ARP)
+
+        driver = CLIDatabaseDriver(1)
+        with self.assertRaises(ValueError):
+            driver.write_tables([(ArpEntry, driver.arp_rows(ARP[:1])),
+                                 (LogEntry, [{'device_id': None, 'line_number': 1, 'message': 'x'}])], 'sweep')
+        self.assertEqual(ArpEntry.query.filter_by(device_id=1).count(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import math
+import unittest
+from app.application_dataclasses import NetworkDeviceEntry, ShowInterfacesEntry
+from app.counter_analytics_support import FleetCounterAnalytics
+
+
+def make_device(hostname: str, ip_address: str, region: str, crc_values) -> NetworkDeviceEntry:
+    device = NetworkDeviceEntry(switch_hostname=hostname, switch_ip_address=ip_address, switch_region=region)
+    for i, crc in enumerate(crc_values):
+        device.show_interfaces_entry_list.append(ShowInterfacesEntry(INTERFACE=f'Gi1/0/{i}', CRC=crc))
+    return device
+
+
+class GroupByTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.devices = [make_device('sw0', '10.0.0.1', 'JFK', ['1', '2']),
+                        make_device('sw1', '10.0.0.2', 'JFK', ['5', '']),
+                        make_device('sw2', '10.0.0.3', 'FMT', ['7'])]
+
+    def test_group_by_switch_and_region(self) -> None:
+        analytics = FleetCounterAnalytics.from_devices(self.devices + [None])
+
+        self.assertEqual(analytics.group_by('CRC', by='switch'), {'sw0': 3.0, 'sw1': 5.0, 'sw2': 7.0})
+        self.assertEqual(analytics.group_by('CRC', by='region', how='count'), {'JFK': 3.0, 'FMT': 1.0})
+        self.assertEqual(analytics.group_by('CRC', by='switch_ip', how='max'),
+                         {'10.0.0.1': 2.0, '10.0.0.2': 5.0, '10.0.0.3': 7.0})
+
+    def test_duplicate_hostnames_raise_instead_of_merging(self) -> None:
+        self.devices.append(make_device('sw0', '10.0.0.4', 'FMT', ['100']))
+        analytics = FleetCounterAnalytics.from_devices(self.devices)
+
+        with self.assertRaisesRegex(ValueError, 'sw0'):
+            analytics.group_by('CRC', by='switch')
+        by_ip = analytics.group_by('CRC', by='switch_ip')
+        self.assertEqual((by_ip['10.0.0.1'], by_ip['10.0.0.4']), (3.0, 100.0))
+
+    def test_switches_without_values(self) -> None:
+        self.devices.append(make_device('sw3', '10.0.0.5', 'FMT', [None]))
+        analytics = FleetCounterAnalytics.from_devices(self.devices)
+
+        self.assertEqual(analytics.group_by('CRC', by='switch')['sw3'], 0.0)
+        self.assertTrue(math.isnan(analytics.group_by('CRC', by='switch', how='mean')['sw3']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from types import SimpleNamespace
+from app.application_dataclass_data_manager import DataProcessor, compile_key_accessor
+
+
+class CompileKeyAccessorTest(unittest.TestCase):
+    def test_reads_dictionaries_lists_and_attributes(self) -> None:
+        item = {'device': SimpleNamespace(ports=[{'name': 'Gi1'}, {'name': 'Gi2'}])}
+        self.assertEqual(compile_key_accessor('device.ports.1.name')(item), 'Gi2')
+        self.assertEqual(compile_key_accessor('device.ports.-1.name')(item), 'Gi2')
+        self.assertIsNone(compile_key_accessor('missing')(item))
+        self.assertIs(compile_key_accessor(None)(item), item)
+
+    def test_missing_attribute_raises_key_error(self) -> None:
+        with self.assertRaises(KeyError):
+            compile_key_accessor('device.speed')({'device': SimpleNamespace()})
+
+
+class DataProcessorSortTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = [
+            {'host': 'sw2', 'stats': {'crc': 5}, 'id': 0},
+            {'host': 'sw1', 'stats': {'crc': 7}, 'id': 1},
+            {'host': 'sw2', 'stats': {'crc': 9}, 'id': 2},
+            {'host': 'sw1', 'stats': {'crc': 7}, 'id': 3},
+        ]
+
+    def ids(self, rows) -> list:
+        return [row['id'] for row in rows]
+
+    def test_single_nested_key(self) -> None:
+        processor = DataProcessor(self.rows)
+        self.assertEqual(self.ids(processor.sort('stats.crc')), [0, 1, 3, 2])
+        self.assertEqual(self.ids(processor.sort('stats.crc', ascending=False)), [2, 1, 3, 0])
+
+    def test_several_keys_with_one_direction(self) -> None:
+        self.assertEqual(self.ids(DataProcessor(self.rows).sort(['host', 'stats.crc'])), [1, 3, 0, 2])
+
+    def test_several_keys_with_mixed_directions_are_stable(self) -> None:
+        rows = DataProcessor(self.rows).sort(['host', 'stats.crc'], ascending=[True, False])
+        self.assertEqual(self.ids(rows), [1, 3, 2, 0])
+
+    def test_flags_must_match_keys(self) -> None:
+        with self.assertRaises(ValueError):
+            DataProcessor(self.rows).sort(['host', 'id'], ascending=[True])
+
+    def test_only_lists_and_sets_sort(self) -> None:
+        with self.assertRaises(ValueError):
+            DataProcessor({'a': 1}).sort('a')
+
+
+if __name__ == '__main__':
+    unittest.main()
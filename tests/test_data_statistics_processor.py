@@ -0,0 +1,74 @@
+import statistics
+import unittest
+from fractions import Fraction
+from types import SimpleNamespace
+from app.application_dataclass_data_manager import DataStatisticsProcessor, StreamingPropertyStatistics
+from app.mac_address_support import MacAddress
+
+
+def streamed(values):
+    stats = StreamingPropertyStatistics(max_distinct=float('inf'))
+    for value in values:
+        stats.add(value)
+    return stats
+
+
+class ExactStatisticsTest(unittest.TestCase):
+    CASES = [
+        [1, 2, 3, 4],
+        [1, 2, 4],
+        [0.1, 0.2, 0.3, 0.4],
+        [1e16, 1.0, -1e16, 3.0],
+        [1e100, 1.0, -1e100],
+        [1, 2.5, 3, 4.25],
+        [10 ** 30 + 1, 10 ** 30 + 3],
+    ]
+
+    def test_mean_variance_and_stdev_equal_the_statistics_module(self) -> None:
+        for values in self.CASES:
+            with self.subTest(values=values):
+                stats = streamed(values)
+                for name in ('mean', 'variance', 'stdev'):
+                    expected = getattr(statistics, name)(values)
+                    actual = getattr(stats, name)
+                    self.assertEqual(actual, expected)
+                    self.assertIs(type(actual), type(expected))
+
+    def test_fractions_are_not_numbers_for_the_report(self) -> None:
+        stats = streamed([Fraction(1, 3), 1, 2])
+        self.assertEqual(stats.count, 2)
+
+    def test_non_finite_values_fall_back_to_float_arithmetic(self) -> None:
+        self.assertEqual(streamed([1.0, float('inf')]).mean, float('inf'))
+
+    def test_too_few_values_raise(self) -> None:
+        with self.assertRaises(statistics.StatisticsError):
+            streamed([]).mean
+        with self.assertRaises(statistics.StatisticsError):
+            streamed([1]).variance
+
+
+class DataStatisticsProcessorTest(unittest.TestCase):
+    def test_leaf_values_in_depth_first_order(self) -> None:
+        data = {'a': [1, {'b': 2, 'c': [3, 4]}], 'd': SimpleNamespace(e=5, f='x')}
+        self.assertEqual(list(DataStatisticsProcessor.iter_values(data)), [1, 2, 3, 4, 5, 'x'])
+
+    def test_deep_nesting_does_not_recurse(self) -> None:
+        data = 7
+        for _ in range(5000):
+            data = [data]
+        self.assertEqual(list(DataStatisticsProcessor.iter_values(data)), [7])
+
+    def test_statistics_skip_text_and_mac_addresses(self) -> None:
+        data = [{'crc': 1, 'mac': MacAddress('0011.2233.4455')}, {'crc': 3, 'mac': 'up'}, {'crc': 2}]
+        processor = DataStatisticsProcessor(data)
+        self.assertEqual(processor.get_statistics()['mean'], 2)
+        self.assertEqual(processor.count_values()['0011.2233.4455'], 1)
+
+    def test_no_numbers_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            DataStatisticsProcessor(['a', 'b']).get_statistics()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from app.application_dataclass_data_manager import DataTableExporter
+from app.mac_address_support import MacAddress
+
+DATA = [
+    {"name": "Alice", "details": {"age": 30, "city": "New York"}},
+    {"name": "Bob", "details": {"age": 25}},
+    {"name": "Charlie", "details": {"age": 35, "city": None}, "mac": MacAddress('00:11:22:33:44:55')},
+]
+
+
+class DataTableExporterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'out.csv')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def read(self):
+        with open(self.path, newline='') as file:
+            return list(csv.reader(file))
+
+    def test_list_header_is_the_union_of_all_rows(self) -> None:
+        with mock.patch.object(tempfile, 'TemporaryFile', wraps=tempfile.TemporaryFile) as spill:
+            self.assertEqual(DataTableExporter(DATA).export_to_csv(self.path), 3)
+        spill.assert_not_called()
+        self.assertEqual(self.read(), [
+            ['details.age', 'details.city', 'mac', 'name'],
+            ['30', 'New York', '', 'Alice'],
+            ['25', '', '', 'Bob'],
+            ['35', '', '0011.2233.4455', 'Charlie'],
+        ])
+
+    def test_generator_is_spilled_and_written_like_a_list(self) -> None:
+        DataTableExporter(DATA).export_to_csv(self.path)
+        expected = self.read()
+        with mock.patch.object(tempfile, 'TemporaryFile', wraps=tempfile.TemporaryFile) as spill:
+            self.assertEqual(DataTableExporter(row for row in DATA).export_to_csv(self.path), 3)
+        spill.assert_called_once()
+        self.assertEqual(self.read(), expected)
+
+    def test_header_scan_rows_takes_the_header_from_leading_rows(self) -> None:
+        with mock.patch.object(tempfile, 'TemporaryFile', wraps=tempfile.TemporaryFile) as spill:
+            written = DataTableExporter(row for row in DATA).export_to_csv(self.path, header_scan_rows=2)
+        spill.assert_not_called()
+        self.assertEqual(written, 3)
+        rows = self.read()
+        self.assertEqual(rows[0], ['details.age', 'details.city', 'name'])
+        self.assertEqual(rows[3], ['35', '', 'Charlie'])
+
+    def test_nested_sequences_are_walked(self) -> None:
+        data = [[DATA[0]], (DATA[1],), iter([DATA[2]])]
+        self.assertEqual(len(list(DataTableExporter(data).iter_rows())), 3)
+        with self.assertRaises(ValueError):
+            list(DataTableExporter([1]).iter_rows())
+
+    def test_no_rows_leave_no_file(self) -> None:
+        for data in ([], iter([])):
+            with self.assertRaises(ValueError):
+                DataTableExporter(data).export_to_csv(self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
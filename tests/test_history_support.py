@@ -0,0 +1,111 @@
+import unittest
+from datetime import datetime, timedelta
+from flask import Flask
+from app.history_support import HistorySupport
+from app.models import db, Device, InterfaceHistory, MdtaRegion, Sweep, SweepDevice
+
+NOW = datetime(2026, 6, 10)
+
+
+def interfaces(*names, status='up'):
+    return {'show ip interface brief': [{'interface': name, 'ip_address': 'unassigned', 'status': status,
+                                         'protocol': 'up'} for name in names]}
+
+
+class HistorySupportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.flask_app = Flask(__name__)
+        self.flask_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.flask_app)
+        self.context = self.flask_app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(MdtaRegion(region_id=1, region_name='JFK'))
+        for device_id in (1, 2):
+            db.session.add(Device(device_id=device_id, ip_address=f'10.0.0.{device_id}',
+                                  host_name=f'sw{device_id}', region_id=1))
+        db.session.commit()
+        self.history = HistorySupport()
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def sweep(self, started_at: datetime, devices, finish: bool = True) -> int:
+        sweep_id = self.history.begin_sweep(started_at)
+        for device_id, outputs in devices:
+            self.history.record_device(sweep_id, device_id, outputs)
+        if finish:
+            self.history.finish_sweep(sweep_id, started_at + timedelta(minutes=1))
+        return sweep_id
+
+    def test_state_at_a_past_time(self) -> None:
+        self.sweep(NOW - timedelta(hours=3), [(1, interfaces('Gi1', 'Gi2')), (2, interfaces('Gi9'))])
+        self.sweep(NOW - timedelta(hours=2), [(1, interfaces('Gi1', status='down'))])
+
+        self.assertEqual(self.history.interface_at(1, 'Gi1', NOW - timedelta(hours=2, minutes=30)).status, 'up')
+        self.assertEqual(self.history.interface_at(1, 'Gi1', NOW).status, 'down')
+        self.assertIsNone(self.history.interface_at(1, 'Gi2', NOW))
+        self.assertEqual([row.name for row in self.history.interfaces_at(2, NOW)], ['Gi9'])
+        self.assertEqual(self.history.interfaces_at(1, NOW - timedelta(hours=4)), [])
+
+    def test_a_table_is_recorded_once_per_sweep(self) -> None:
+        sweep_id = self.sweep(NOW, [(1, interfaces('Gi1'))], finish=False)
+        with self.assertRaises(ValueError):
+            self.history.record_device(sweep_id, 1, interfaces('Gi1'))
+
+    def test_48_hours_of_15_minute_sweeps_compact_to_one_per_hour(self) -> None:
+        start = NOW - timedelta(hours=96)
+        for quarter in range(4 * 96):
+            self.sweep(start + timedelta(minutes=15 * quarter), [(1, interfaces('Gi1', 'Gi2'))])
+
+        result = self.history.compact(NOW)
+
+        # The 192 sweeps older than raw_retention (48 h) keep the last of each hour; the newer 192 are untouched
+        self.assertEqual(result, {'kept': 48, 'deleted': 144, 'rows_deleted': 288, 'sweeps_deleted': 144})
+        self.assertEqual(Sweep.query.count(), 48 + 192)
+        self.assertEqual(Sweep.query.filter_by(resolution='hourly').count(), 48)
+        kept = Sweep.query.filter_by(resolution='hourly').order_by(Sweep.started_at).first()
+        self.assertEqual(kept.started_at, start + timedelta(minutes=45))
+        self.assertEqual(InterfaceHistory.query.count(), 2 * 240)
+        self.assertEqual(self.history.compact(NOW)['deleted'], 0)
+
+    def test_old_sweeps_keep_one_per_day_and_expire(self) -> None:
+        for days in (400, 40.5, 40.25, 40.1):
+            self.sweep(NOW - timedelta(days=days), [(1, interfaces('Gi1'))])
+
+        result = self.history.compact(NOW)
+
+        self.assertEqual(result['kept'], 1)
+        self.assertEqual(result['sweeps_deleted'], 3)
+        self.assertEqual([sweep.started_at for sweep in Sweep.query], [NOW - timedelta(days=40.1)])
+
+    def test_devices_and_tables_are_compacted_separately(self) -> None:
+        hour = NOW - timedelta(days=5)
+        self.sweep(hour, [(1, interfaces('Gi1')), (2, interfaces('Gi9'))])
+        self.sweep(hour + timedelta(minutes=15), [(1, interfaces('Gi1', status='down'))])
+
+        self.history.compact(NOW)
+
+        self.assertEqual(self.history.interface_at(1, 'Gi1', NOW).status, 'down')
+        self.assertEqual([row.name for row in self.history.interfaces_at(2, NOW)], ['Gi9'])
+        self.assertEqual(SweepDevice.query.count(), 2)
+
+    def test_unfinished_sweeps_past_the_raw_window_are_compacted(self) -> None:
+        hour = NOW - timedelta(days=5)
+        self.sweep(hour, [(1, interfaces('Gi1'))])
+        abandoned = self.sweep(hour + timedelta(minutes=30), [(1, interfaces('Gi1', status='down'))], finish=False)
+        self.sweep(hour + timedelta(hours=1), [(1, interfaces('Gi1'))], finish=False)
+        self.sweep(hour + timedelta(hours=1, minutes=15), [(1, interfaces('Gi1'))])
+        running = self.sweep(NOW - timedelta(minutes=5), [(1, interfaces('Gi1'))], finish=False)
+
+        result = self.history.compact(NOW)
+
+        self.assertEqual(result, {'kept': 2, 'deleted': 2, 'rows_deleted': 2, 'sweeps_deleted': 2})
+        self.assertEqual({sweep.sweep_id for sweep in Sweep.query}, {abandoned, abandoned + 2, running})
+        self.assertEqual(self.history.interface_at(1, 'Gi1', hour + timedelta(minutes=45)).status, 'down')
+
+
+if __name__ == '__main__':
+    unittest.main()
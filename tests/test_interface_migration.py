@@ -0,0 +1,64 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from flask import Flask
+from app.database import Database
+
+
+class InterfaceMigrationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'legacy.db')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def make_legacy_database(self) -> None:
+        connection = sqlite3.connect(self.path)
+        connection.execute('CREATE TABLE device (device_id INTEGER PRIMARY KEY)')
+        connection.execute('CREATE TABLE interface (interface_id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                           'device_id INTEGER NOT NULL, name VARCHAR(64) NOT NULL, ip_address VARCHAR(64), '
+                           'status VARCHAR(64), protocol VARCHAR(64))')
+        for sweep in range(3):
+            for name in ('Gi1', 'Gi2'):
+                connection.execute('INSERT INTO interface (device_id, name, status) VALUES (1, ?, ?)',
+                                   (name, f'sweep{sweep}'))
+        connection.execute("INSERT INTO interface (device_id, name, status) VALUES (2, 'Gi1', 'up')")
+        connection.commit()
+        connection.close()
+
+    def flask_app(self) -> Flask:
+        flask_app = Flask(__name__)
+        flask_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + self.path
+        Database.init_app(flask_app)
+        return flask_app
+
+    def query(self, statement: str) -> list:
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(statement).fetchall()
+        finally:
+            connection.close()
+
+    def test_migration_keeps_the_newest_row_and_adds_the_constraint(self) -> None:
+        self.make_legacy_database()
+        flask_app = self.flask_app()
+
+        self.assertEqual(Database.migrate(flask_app), 4)
+        self.assertEqual(Database.migrate(flask_app), 0)
+        self.assertEqual(self.query('SELECT device_id, name, status FROM interface ORDER BY interface_id'),
+                         [(1, 'Gi1', 'sweep2'), (1, 'Gi2', 'sweep2'), (2, 'Gi1', 'up')])
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.query("INSERT INTO interface (device_id, name) VALUES (1, 'Gi1')")
+
+    def test_empty_database_needs_nothing(self) -> None:
+        flask_app = self.flask_app()
+
+        self.assertEqual(Database.migrate(flask_app), 0)
+        self.assertEqual(self.query("SELECT name FROM sqlite_master WHERE type = 'table'"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
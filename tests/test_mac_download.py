@@ -0,0 +1,109 @@
+import hashlib
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from app.mac_address_support import MacAddressSupport
+
+CISCO_MANUF = b"# manuf test data\n00:00:0C\tCisco\tCisco Systems, Inc\n00:1A:7C\tHirschmann\tHirschmann Multimedia B.V.\n"
+RENAMED_MANUF = CISCO_MANUF.replace(b"\tCisco\t", b"\tNewCisco\t")
+
+
+class ManufHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves server.body with an ETag, answers If-None-Match with 304 and can cut the body short.
+    """
+
+    def do_GET(self) -> None:
+        server = self.server
+        server.requests.append(dict(self.headers))
+        etag = '"%s"' % hashlib.sha1(server.body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(server.body)))
+        self.end_headers()
+        if server.truncate:
+            # Promise the whole body but close the connection half way through
+            self.wfile.write(server.body[:len(server.body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(server.body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class MacDatabaseDownloadTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), ManufHandler)
+        self.server.body = CISCO_MANUF
+        self.server.truncate = False
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/manuf'
+        self.directory = tempfile.mkdtemp()
+        self.manuf = os.path.join(self.directory, 'manuf')
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def read_manuf(self) -> bytes:
+        with open(self.manuf, 'rb') as file:
+            return file.read()
+
+    def assertNoTemporaryFiles(self) -> None:
+        leftovers = [name for name in os.listdir(self.directory) if name.endswith('.download')]
+        self.assertEqual(leftovers, [])
+
+    def test_first_download_saves_file_and_etag(self) -> None:
+        mac_support = MacAddressSupport(self.manuf, self.url)
+
+        self.assertEqual(self.read_manuf(), CISCO_MANUF)
+        self.assertEqual(mac_support.get_vendor('00:00:0c:12:34:56'), 'Cisco')
+        self.assertNotIn('If-None-Match', self.server.requests[0])
+        self.assertTrue(os.path.exists(self.manuf + '.meta'))
+        self.assertNoTemporaryFiles()
+
+    def test_not_modified_keeps_local_file(self) -> None:
+        mac_support = MacAddressSupport(self.manuf, self.url)
+        modified = os.path.getmtime(self.manuf)
+
+        self.assertFalse(mac_support.refresh_mac_database())
+        self.assertIn('If-None-Match', self.server.requests[-1])
+        self.assertEqual(os.path.getmtime(self.manuf), modified)
+        self.assertEqual(self.read_manuf(), CISCO_MANUF)
+        self.assertNoTemporaryFiles()
+
+    def test_changed_file_replaces_local_file_and_reloads(self) -> None:
+        mac_support = MacAddressSupport(self.manuf, self.url)
+        self.server.body = RENAMED_MANUF
+
+        self.assertTrue(mac_support.refresh_mac_database())
+        self.assertEqual(self.read_manuf(), RENAMED_MANUF)
+        self.assertEqual(mac_support.get_vendor('00:00:0c:12:34:56'), 'NewCisco')
+        self.assertNoTemporaryFiles()
+        self.assertFalse(mac_support.refresh_mac_database())
+
+    def test_interrupted_download_leaves_local_file_intact(self) -> None:
+        mac_support = MacAddressSupport(self.manuf, self.url)
+        self.server.body = RENAMED_MANUF
+        self.server.truncate = True
+
+        with self.assertRaises(ValueError):
+            mac_support.download_mac_database()
+        self.assertEqual(self.read_manuf(), CISCO_MANUF)
+        self.assertEqual(mac_support.get_vendor('00:00:0c:12:34:56'), 'Cisco')
+        self.assertNoTemporaryFiles()
+
+
+if __name__ == '__main__':
+    unittest.main()
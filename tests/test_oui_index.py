@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+from app.oui_index_support import OUI_INDEX_SUFFIX, OUIIndex, compile_manuf
+
+MANUF = """# manuf test data
+00:00:0C\tCisco\tCisco Systems, Inc
+00:1B:C5\tIEEERegi\tIEEE Registration Authority
+00:1B:C5:00:00/36\tConvergi\tConverging Systems Inc.
+00:1B:C5:00:10/36\tOpenRB\tOpenRB.com, Direct SA
+70:B3:D5:10:00:00/28\tMAM\tMA-M Block Owner
+00-00-0C\tCiscoLater\tCisco Systems (later line)
+80:00:00/4\tShort\tShort prefix owner
+"""
+
+
+class OUIIndexLookupTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = OUIIndex(compile_manuf(MANUF))
+        self.names = self.index.vendor_names()
+
+    def vendor(self, mac: int):
+        vendor_id = self.index.lookup(mac)
+        return self.names[vendor_id] if vendor_id >= 0 else None
+
+    def test_longest_prefix_wins(self) -> None:
+        self.assertEqual(self.vendor(0x001BC5000001), 'Convergi')
+        self.assertEqual(self.vendor(0x001BC5000FFF), 'Convergi')
+        self.assertEqual(self.vendor(0x001BC5001ABC), 'OpenRB')
+        self.assertEqual(self.vendor(0x001BC5002000), 'IEEERegi')
+        self.assertEqual(self.vendor(0x70B3D510ABCD), 'MAM')
+        self.assertIsNone(self.vendor(0x70B3D520ABCD))
+
+    def test_later_line_for_the_same_prefix_wins(self) -> None:
+        self.assertEqual(self.vendor(0x00000C123456), 'CiscoLater')
+
+    def test_prefixes_shorter_than_an_oui(self) -> None:
+        self.assertEqual(self.vendor(0x8FFFFFFFFFFF), 'Short')
+        self.assertIsNone(self.vendor(0x7FFFFFFFFFFF))
+
+    def test_lookup_many(self) -> None:
+        self.assertEqual([self.names[i] if i >= 0 else None
+                          for i in self.index.lookup_many([0x001BC5001000, 0x123456789ABC])], ['OpenRB', None])
+
+
+class OUIIndexFileTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.manuf = os.path.join(self.directory, 'manuf')
+        with open(self.manuf, 'w', encoding='utf-8') as file:
+            file.write(MANUF)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_load_compiles_once_and_maps_the_file(self) -> None:
+        with OUIIndex.load(self.manuf) as index:
+            self.assertTrue(os.path.exists(self.manuf + OUI_INDEX_SUFFIX))
+            self.assertEqual(index.mac_to_vendor()['001bc50000/36'], 'Convergi')
+        modified = os.path.getmtime(self.manuf + OUI_INDEX_SUFFIX)
+        with OUIIndex.load(self.manuf) as index:
+            self.assertEqual(index.short_name_to_full_name()['OpenRB'], 'OpenRB.com, Direct SA')
+        self.assertEqual(os.path.getmtime(self.manuf + OUI_INDEX_SUFFIX), modified)
+
+    def test_incompatible_index_is_rebuilt(self) -> None:
+        with open(self.manuf + OUI_INDEX_SUFFIX, 'wb') as file:
+            file.write(b'not an index' * 20)
+        with OUIIndex.load(self.manuf) as index:
+            self.assertEqual(index.count, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from operator import attrgetter
+from types import SimpleNamespace
+from app.application_dataclass_data_manager import DataProcessor
+from app.application_dataclasses_support import DataclassFilter, PropertyIndex
+
+
+def make_items():
+    return [SimpleNamespace(name=f'Gi{i}', vlan=10 * (i % 3), status='up' if i % 2 else 'down') for i in range(9)]
+
+
+class PropertyIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.items = make_items()
+        self.index = PropertyIndex(attrgetter)
+
+    def test_select_matches_a_scan(self) -> None:
+        expected = [item for item in self.items if item.vlan == 10 and item.status == 'up']
+        self.assertEqual(self.index.select(self.items, {'vlan': 10, 'status': 'up'}), expected)
+        self.assertEqual(self.index.select(self.items, {'vlan': 99}), [])
+
+    def test_repeated_select_uses_the_built_index(self) -> None:
+        self.index.select(self.items, {'vlan': 10})
+        built = self.index._indexes['vlan']
+        self.index.select(self.items, {'vlan': 20})
+        self.assertIs(self.index._indexes['vlan'], built)
+
+    def test_row_edited_to_lose_the_value_is_not_returned(self) -> None:
+        self.index.select(self.items, {'vlan': 10})
+        self.items[1].vlan = 30
+
+        matches = self.index.select(self.items, {'vlan': 10})
+        self.assertEqual([item.name for item in matches], ['Gi4', 'Gi7'])
+        # _still_match found the stale match and the index was rebuilt, so the edited row is now found by its value
+        self.assertIn(self.items[1], self.index.select(self.items, {'vlan': 30}))
+
+    def test_replaced_row_is_not_returned(self) -> None:
+        self.index.select(self.items, {'status': 'up'})
+        self.items[1] = SimpleNamespace(name='new', vlan=10, status='down')
+
+        self.assertNotIn('new', [item.name for item in self.index.select(self.items, {'status': 'up'})])
+
+    def test_length_change_drops_the_indexes(self) -> None:
+        self.index.select(self.items, {'vlan': 10})
+        self.items.append(SimpleNamespace(name='Gi9', vlan=10, status='up'))
+
+        self.assertEqual(self.index.select(self.items, {'vlan': 10})[-1].name, 'Gi9')
+
+    def test_unindexable_values_fall_back(self) -> None:
+        self.items[0].ports = ['Gi1']
+        self.assertIsNone(self.index.select(self.items, {'ports': ['Gi1']}))
+        self.assertIsNone(self.index.select(self.items, {'vlan': [10]}))
+
+
+class IndexedOwnersTest(unittest.TestCase):
+    def test_filters_only_index_when_asked(self) -> None:
+        self.assertIsNone(DataclassFilter(make_items()).index)
+        self.assertIsNone(DataProcessor(make_items()).index)
+
+    def test_indexed_dataclass_filter_sees_in_place_edits_that_drop_a_value(self) -> None:
+        items = make_items()
+        dataclass_filter = DataclassFilter(items, indexed=True)
+        self.assertEqual(len(dataclass_filter.filter_by_properties({'status': 'up'})), 4)
+        items[1].status = 'down'
+        self.assertEqual(len(dataclass_filter.filter_by_properties({'status': 'up'})), 3)
+
+    def test_indexed_data_processor_filters_dictionaries(self) -> None:
+        data = {item.name: {'vlan': item.vlan} for item in make_items()}
+        processor = DataProcessor(data, indexed=True)
+        self.assertEqual(list(processor.filter('vlan', 20)), ['Gi2', 'Gi5', 'Gi8'])
+        data['Gi2']['vlan'] = 0
+        self.assertEqual(list(processor.filter('vlan', 20)), ['Gi5', 'Gi8'])
+
+
+if __name__ == '__main__':
+    unittest.main()
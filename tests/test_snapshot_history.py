@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+from app.snapshot_support import SnapshotFileHandler, SnapshotHistory, SnapshotReader
+from test_snapshot_support import make_devices
+
+
+class SnapshotLazyLoadingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'a.snapshot')
+        SnapshotFileHandler.write_snapshot(self.path, make_devices())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_opening_decodes_no_columns(self) -> None:
+        with SnapshotReader(self.path) as reader:
+            self.assertEqual(reader._columns, {})
+            reader.column('show_interfaces_entry_list', 'CRC', hostname='sw1')
+            self.assertEqual(set(reader._columns),
+                             {('devices', 'switch_hostname'), ('show_interfaces_entry_list', 'CRC')})
+
+    def test_immutable_values_are_shared_and_mutable_values_are_not(self) -> None:
+        with SnapshotReader(self.path) as reader:
+            statuses = reader.column('show_interfaces_entry_list', 'LINK_STATUS')
+            ports = reader.column('show_mac_address_table_entry_list', 'DESTINATION_PORT')
+        self.assertIs(statuses[0], statuses[1])
+        self.assertEqual(ports[0], ['Gi1/0/0'])
+        ports[0].append('Gi1/0/9')
+        with SnapshotReader(self.path) as reader:
+            self.assertEqual(reader.column('show_mac_address_table_entry_list', 'DESTINATION_PORT')[0], ['Gi1/0/0'])
+
+    def test_unknown_device_raises_key_error(self) -> None:
+        with SnapshotReader(self.path) as reader:
+            with self.assertRaises(KeyError):
+                reader.read_device('missing')
+
+
+class SnapshotHistoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        devices = make_devices()
+        SnapshotFileHandler.write_snapshot(os.path.join(self.directory, '1.snapshot'), devices)
+        devices[2].show_interfaces_entry_list[0].CRC = '99'
+        SnapshotFileHandler.write_snapshot(os.path.join(self.directory, '2.snapshot'), devices)
+        SnapshotFileHandler.write_snapshot(os.path.join(self.directory, '3.snapshot'), devices[:2])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_column_history_skips_snapshots_without_the_device(self) -> None:
+        with SnapshotHistory.from_directory(self.directory) as history:
+            values = [values for _, values in history.column_history('sw2', 'show_interfaces_entry_list', 'CRC')]
+        self.assertEqual(values, [['0', '2', '4', '6'], ['99', '2', '4', '6']])
+
+    def test_device_history_loads_requested_fields(self) -> None:
+        with SnapshotHistory.from_directory(self.directory) as history:
+            sweeps = list(history.device_history('sw0', 'show_interfaces_entry_list', ['INTERFACE']))
+            self.assertEqual(len(sweeps), 3)
+            self.assertEqual([created for created, _ in sweeps], sorted(created for created, _ in sweeps))
+            records = sweeps[-1][1]
+            self.assertEqual(records[1].INTERFACE, 'Gi1/0/1')
+            self.assertIsNone(records[1].CRC)
+
+
+if __name__ == '__main__':
+    unittest.main()
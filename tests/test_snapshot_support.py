@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+import unittest
+from app.application_dataclasses import (DeviceConnectionData, NetworkDeviceEntry, ShowInterfacesEntry,
+                                         ShowMACAddressTableEntry, ShowVersionData)
+from app.mac_address_support import MacAddress
+from app.snapshot_support import SnapshotFileHandler, SnapshotReader
+
+
+def make_devices(count: int = 3, interfaces: int = 4):
+    devices = []
+    for d in range(count):
+        device = NetworkDeviceEntry(
+            switch_hostname=f'sw{d}', switch_ip_address=f'10.0.0.{d}', switch_region='JFK',
+            device_connection_data=DeviceConnectionData(host=f'10.0.0.{d}', username='admin',
+                                                        password='hunter2', secret='enable-secret'),
+            show_version_data=ShowVersionData(VERSION='15.2', HOSTNAME=f'sw{d}') if d % 2 == 0 else None)
+        for i in range(interfaces):
+            mac = f'0011.22{d:02x}.{i:04x}'
+            device.show_interfaces_entry_list.append(ShowInterfacesEntry.from_cli_record(
+                {'INTERFACE': f'Gi1/0/{i}', 'MAC_ADDRESS': mac, 'CRC': str(i * d), 'LINK_STATUS': 'up'}))
+            device.show_mac_address_table_entry_list.append(ShowMACAddressTableEntry.from_cli_record(
+                {'DESTINATION_ADDRESS': mac, 'TYPE': 'DYNAMIC', 'VLAN_ID': '10', 'DESTINATION_PORT': [f'Gi1/0/{i}']}))
+        devices.append(device)
+    return devices
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'sweep.snapshot')
+        self.devices = make_devices()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_round_trip_restores_devices(self) -> None:
+        written = SnapshotFileHandler.write_snapshot(self.path, self.devices + [None], include_credentials=True)
+
+        devices = SnapshotFileHandler.read_snapshot(self.path)
+        self.assertEqual(written, 3)
+        self.assertEqual([device.to_dict() for device in devices], [device.to_dict() for device in self.devices])
+        self.assertIsNone(devices[1].show_version_data)
+        self.assertIs(type(devices[0].show_interfaces_entry_list[0].MAC_ADDRESS), MacAddress)
+        self.assertEqual([name for name in os.listdir(self.directory)], ['sweep.snapshot'])
+
+    def test_credentials_are_left_out_by_default(self) -> None:
+        SnapshotFileHandler.write_snapshot(self.path, self.devices)
+
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        self.assertNotIn(b'hunter2', data)
+        self.assertNotIn(b'enable-secret', data)
+        connection = SnapshotFileHandler.read_snapshot(self.path)[0].device_connection_data
+        self.assertEqual((connection.username, connection.password, connection.secret), ('admin', None, None))
+
+    def test_credentials_are_kept_when_asked_for(self) -> None:
+        SnapshotFileHandler.write_snapshot(self.path, self.devices, include_credentials=True)
+
+        connection = SnapshotFileHandler.read_snapshot(self.path)[2].device_connection_data
+        self.assertEqual((connection.password, connection.secret), ('hunter2', 'enable-secret'))
+
+    def test_partial_column_reads(self) -> None:
+        SnapshotFileHandler.write_snapshot(self.path, self.devices, {'sweep': 'test'})
+
+        with SnapshotReader(self.path) as reader:
+            self.assertEqual(reader.metadata, {'sweep': 'test'})
+            self.assertEqual(reader.hostnames(), ['sw0', 'sw1', 'sw2'])
+            self.assertEqual(reader.column('show_interfaces_entry_list', 'CRC', hostname='sw2'), ['0', '2', '4', '6'])
+            self.assertEqual(len(reader.column('show_interfaces_entry_list', 'INTERFACE')), 12)
+            records = reader.read_records('show_interfaces_entry_list', 'sw1', field_names=['INTERFACE'])
+            self.assertEqual([record.INTERFACE for record in records], [f'Gi1/0/{i}' for i in range(4)])
+            self.assertIsNone(records[0].MAC_ADDRESS)
+            device = reader.read_device('sw1', ['show_mac_address_table_entry_list'])
+            self.assertEqual(device.show_interfaces_entry_list, [])
+            self.assertEqual(device.show_mac_address_table_entry_list[3].DESTINATION_ADDRESS, '0011.2201.0003')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import statistics
+import unittest
+from app.application_dataclass_data_manager import (DictListStatisticsReport, StreamingPropertyStatistics,
+                                                    StreamingStatisticsAggregator)
+
+DATA = [
+    {"name": "Alice", "age": 30, "city": "New York"},
+    {"name": "Bob", "age": 25, "city": "San Francisco"},
+    {"name": "Charlie", "age": 35, "city": "New York"},
+    {"name": "David", "age": 40, "city": "Chicago"},
+    {"name": "Eve", "age": 25, "city": None},
+]
+
+
+class StreamingPropertyStatisticsTest(unittest.TestCase):
+    def test_summary_matches_statistics_module(self) -> None:
+        stats = StreamingPropertyStatistics()
+        for value in [3, 1, 4, 1, 5, 9, 2, 6, 'n/a', None]:
+            stats.add(value)
+        numbers = [3, 1, 4, 1, 5, 9, 2, 6]
+        self.assertEqual(stats.summary(), {
+            "mean": statistics.mean(numbers), "median": statistics.median(numbers), "mode": statistics.mode(numbers),
+            "variance": statistics.variance(numbers), "stdev": statistics.stdev(numbers)})
+        self.assertEqual(stats.counts['n/a'], 1)
+
+    def test_values_beyond_the_distinct_limit_are_tallied(self) -> None:
+        stats = StreamingPropertyStatistics(max_distinct=3)
+        for value in [1, 2, 3, 4, 5, 1]:
+            stats.add(value)
+        self.assertEqual(stats.counts, {1: 2, 2: 1, 3: 1})
+        self.assertEqual(stats.uncounted, 2)
+        self.assertFalse(stats.counts_complete)
+        self.assertEqual(stats.mean, statistics.mean([1, 2, 3, 4, 5, 1]))
+
+    def test_no_numeric_values(self) -> None:
+        stats = StreamingPropertyStatistics()
+        stats.add('up')
+        with self.assertRaises(ValueError):
+            stats.summary()
+
+
+class StatisticsReportTest(unittest.TestCase):
+    def test_aggregator_reads_each_item_once(self) -> None:
+        items = iter(DATA)
+        aggregator = StreamingStatisticsAggregator(['age', 'city']).update(items)
+        self.assertEqual(aggregator['age'].count, 5)
+        self.assertEqual(aggregator['city'].counts, {'New York': 2, 'San Francisco': 1, 'Chicago': 1, None: 1})
+        self.assertEqual(list(items), [])
+
+    def test_report_from_a_generator_matches_the_list_report(self) -> None:
+        report = DictListStatisticsReport(DATA).generate_reports(['age', 'city'])
+        streamed = DictListStatisticsReport.report_from_iterable((item for item in DATA), ['age', 'city'])
+        self.assertEqual(report, streamed)
+        self.assertIn("25: 2", report)
+        self.assertIn("Mean: 31.00", report)
+        self.assertIn("Data Statistics Report for 'city'", report)
+
+    def test_report_counts_values_beyond_the_limit(self) -> None:
+        aggregator = StreamingStatisticsAggregator(['name'], max_distinct=2).update(DATA)
+        self.assertEqual(aggregator['name'].uncounted, 3)
+        report = DictListStatisticsReport._format_report('name', aggregator['name'].counts, {},
+                                                         aggregator['name'].uncounted)
+        self.assertIn("(values beyond the distinct value limit, not counted): 3", report)
+
+    def test_get_statistics_without_numbers_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            DictListStatisticsReport(DATA).get_statistics('city')
+
+
+if __name__ == '__main__':
+    unittest.main()